@@ -1,25 +1,247 @@
+import os
+
 import pytest
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from utils.driver_pool import ContextPool, DriverPool, is_alive, session_lost
+from utils.driver_resolver import default_cache_dirs, resolve_shared
+from utils.async_driver import AsyncDriverPool
+from utils.auth_session import AuthSession
+from utils.local_server import LocalParaBank
+from utils.provisioning import Provisioner
+from utils.api_client import BankApi
+from utils import network_idle, resource_blocking, webdriver_timing
+from utils.html_driver import HtmlDriver, new_adapter
+from pages.base_page import ELEMENT_CACHE_STATS
 
-@pytest.fixture(scope="function")
-def driver():
+pytest_plugins = ["utils.duration_scheduler", "utils.timing_report", "utils.benchmark",
+                  "utils.network_report", "utils.memory_report", "utils.async_runner",
+                  "utils.impact_selection", "utils.result_sink"]
+
+REMOTE_BASE_URL = "https://parabank.parasoft.com/parabank"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--driver-mode", choices=("pool", "context"), default="pool",
+        help="pool — пул браузеров со сбросом между тестами, context — один Chrome на воркер "
+             "и отдельный browser context на каждый тест")
+    parser.addoption(
+        "--driver-max-uses", type=int, default=20,
+        help="Сколько тестов обслуживает один браузер до перезапуска (1 — новый браузер на каждый тест)")
+    parser.addoption(
+        "--driver-pool-size", type=int, default=1,
+        help="Сколько простаивающих браузеров держать в пуле одного воркера")
+    parser.addoption(
+        "--offline-driver", action="store_true", default=False,
+        help="Искать chromedriver только локально, без скачивания через webdriver-manager")
+    parser.addoption(
+        "--target", choices=("local", "remote"), default="remote",
+        help="local — встроенный стенд ParaBank, remote — BASE_URL или демо-сайт parasoft")
+    parser.addoption(
+        "--page-load-strategy", choices=("normal", "eager", "none"), default="eager",
+        help="Когда driver.get возвращает управление: normal — после загрузки всех ресурсов, "
+             "eager — после разбора DOM, none — сразу. Готовность страницы проверяют page objects")
+    parser.addoption(
+        "--local-latency", type=float, default=0.0,
+        help="Искусственная задержка каждого ответа локального стенда, мс")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "browserless: тест получает HtmlDriver (HTTP + lxml) вместо Chrome; "
+                   "только для проверок, которым не нужен JavaScript")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    yield
+    # Браузер, потерявший сессию, не возвращается в пул, а пересоздаётся.
+    # Прочие ошибки WebDriver (таймауты ожиданий, ненайденные элементы)
+    # браузер не ломают; после них фикстура driver лишь проверяет, что
+    # сессия жива.
+    if call.excinfo is None:
+        return
+    if session_lost(call.excinfo.value):
+        item.driver_crashed = True
+    elif call.excinfo.errisinstance(WebDriverException):
+        item.driver_error = True
+
+
+def create_driver(driver_path, page_load_strategy="eager", chrome_binary=None):
     options = Options()
+    # Chrome, под версию которого подобран драйвер; None — Chrome по умолчанию.
+    if chrome_binary:
+        options.binary_location = chrome_binary
+    # driver.get не ждёт картинок и стилей: page objects сами ждут своего
+    # контракта готовности (BasePage.READY, см. BasePage.wait_until_ready).
+    options.page_load_strategy = page_load_strategy
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
+    # События DevTools (Network.*, Page.*) — источник сетевой сводки теста.
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    service = ChromeService(executable_path=driver_path)
+    # Неявное ожидание не включаем: с ним каждый пустой find_elements
+    # ждёт полный таймаут. Ожидания задаются явно в BasePage.
+    with webdriver_timing.measure("startup", "newSession"):
+        driver = webdriver.Chrome(service=service, options=options)
+    webdriver_timing.instrument(driver)
+    network_idle.install(driver)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def chromedriver(request):
+    """
+    chromedriver и Chrome, подобранные один раз за сессию без обращения к
+    сети (DriverResolution). Результат делится между xdist-воркерами через
+    файл в кэше pytest, а без кэша (-p no:cacheprovider) — в каталоге
+    кэша драйверов.
+    """
+    config = request.config
+    cache = getattr(config, "cache", None)
+    state_dir = cache.mkdir("chromedriver") if cache is not None else default_cache_dirs()[0]
+    resolution = resolve_shared(state_dir, allow_download=not config.getoption("--offline-driver"))
+    config.driver_resolutions = [resolution.describe()]
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["driver_resolutions"] = config.driver_resolutions
+    return resolution
+
+
+def pytest_sessionfinish(session):
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["element_cache"] = dict(ELEMENT_CACHE_STATS)
+
+
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    config = node.config
+    config.driver_resolutions = getattr(config, "driver_resolutions", []) + [
+        f"[{node.gateway.id}] {line}" for line in workeroutput.get("driver_resolutions", [])]
+    for key, value in workeroutput.get("element_cache", {}).items():
+        ELEMENT_CACHE_STATS[key] += value
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    for line in getattr(config, "driver_resolutions", []):
+        terminalreporter.write_line(line)
+    if any(ELEMENT_CACHE_STATS.values()):
+        terminalreporter.write_line(
+            "Кэш элементов: hits={hits}, validated={validated}, misses={misses}, stale={stale} "
+            "(hits — сэкономленные поиски элементов; validated — поиск заменён "
+            "проверкой tag_name, те же round trip)".format(**ELEMENT_CACHE_STATS))
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, chromedriver):
+    """
+    Пул браузеров текущего воркера. Под pytest-xdist каждый воркер —
+    отдельная сессия, поэтому у каждого воркера свой пул. С
+    --driver-mode=context пул держит один Chrome и выдаёт тестам
+    изолированные browser contexts.
+    """
+    config = request.config
+
+    def factory():
+        return create_driver(chromedriver.driver_path, config.getoption("--page-load-strategy"),
+                             chromedriver.chrome_binary)
+
+    if config.getoption("--driver-mode") == "context":
+        pool = ContextPool(factory)
+    else:
+        pool = DriverPool(
+            factory,
+            max_uses=config.getoption("--driver-max-uses"),
+            size=config.getoption("--driver-pool-size"),
+        )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def html_adapter():
+    """Пул соединений, общий для HtmlDriver всех browserless-тестов воркера."""
+    adapter = new_adapter()
+    yield adapter
+    adapter.close()
 
-    service = ChromeService(executable_path=ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
 
-    driver.implicitly_wait(10)
+@pytest.fixture(scope="function")
+def driver(request):
+    """
+    Браузер из пула воркера. Тест с маркером browserless получает HtmlDriver:
+    Chrome для него не запускается и не берётся из пула.
+
+    Во время теста memory_watchdog измеряет память браузера; если после
+    теста она выше --memory-threshold, браузер не возвращается в пул.
+    """
+    if request.node.get_closest_marker("browserless"):
+        driver = HtmlDriver(request.getfixturevalue("html_adapter"))
+        yield driver
+        stats = dict(driver.stats, profile=driver.resource_profile)
+        request.node.user_properties.append((resource_blocking.USER_PROPERTY, stats))
+        driver.quit()
+        return
+    driver_pool = request.getfixturevalue("driver_pool")
+    memory_watchdog = request.getfixturevalue("memory_watchdog")
+    driver = driver_pool.acquire()
+    profile = resource_blocking.profile_for(request.node)
+    try:
+        resource_blocking.apply_profile(driver, profile)
+        resource_blocking.drain(driver)
+        memory_watchdog.begin(driver)
+    except Exception as e:
+        # Браузер возвращается в пул (или закрывается, если упал сам) и не
+        # остаётся занятым, когда подготовка теста не удалась.
+        driver_pool.release(driver, failed=session_lost(e))
+        raise
     yield driver
-    driver.quit()
+    crashed = getattr(request.node, "driver_crashed", False)
+    try:
+        memory = memory_watchdog.finish(request.node)
+        if memory is not None and memory["recycled"]:
+            driver_pool.mark_broken(driver)
+        stats = resource_blocking.network_stats(resource_blocking.drain(driver))
+        stats["profile"] = getattr(driver, "resource_profile", profile)
+        request.node.user_properties.append((resource_blocking.USER_PROPERTY, stats))
+        crashed = crashed or (getattr(request.node, "driver_error", False) and not is_alive(driver))
+    except Exception as e:
+        crashed = crashed or session_lost(e)
+        raise
+    finally:
+        # Браузер не должен остаться занятым, даже если отчёт о тесте не собрался.
+        driver_pool.release(driver, failed=crashed)
+
+
+@pytest.fixture(scope="session")
+def async_browser(request, chromedriver):
+    """
+    Браузеры для async-тестов (utils/async_runner.py): не больше
+    --async-concurrency сессий одновременно на воркер. Пул отдельный от
+    driver_pool, поэтому вместе с ним воркер держит до
+    --driver-pool-size + --async-concurrency браузеров.
+        async with async_browser.session() as driver:
+            login_page = await AsyncLoginPage.navigate(driver, base_url)
+    """
+    config = request.config
+    pool = AsyncDriverPool(
+        lambda: create_driver(chromedriver.driver_path, config.getoption("--page-load-strategy"),
+                              chromedriver.chrome_binary),
+        limit=config.getoption("--async-concurrency"),
+        max_uses=config.getoption("--driver-max-uses"),
+        prepare=lambda driver: resource_blocking.apply_profile(
+            driver, config.getoption("--resource-profile")),
+        memory_threshold_mb=config.getoption("--memory-threshold"),
+    )
+    yield pool
+    pool.close()
 
 
 @pytest.fixture
@@ -37,5 +259,64 @@ def explicit_wait(driver):
 
 
 @pytest.fixture(scope="session")
-def base_url():
-    return "https://parabank.parasoft.com/parabank"
+def local_parabank(request):
+    """Локальный стенд ParaBank; у каждого xdist-воркера свой сервер и свои данные."""
+    server = LocalParaBank(latency=request.config.getoption("--local-latency") / 1000)
+    with server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def base_url(request):
+    # Бенчмарки всегда идут на локальный стенд: у демо-сайта время ответа
+    # непредсказуемо, и сравнивать с базовой линией было бы не с чем.
+    if request.config.getoption("--target") == "local" or request.config.getoption("--benchmark"):
+        return request.getfixturevalue("local_parabank").base_url
+    return os.environ.get("BASE_URL", REMOTE_BASE_URL)
+
+
+@pytest.fixture(scope="session")
+def auth_session(base_url):
+    """HTTP-сессия пользователя john/demo, общая для всех тестов воркера."""
+    return AuthSession(base_url, "john", "demo")
+
+
+@pytest.fixture
+def logged_in_driver(driver, auth_session):
+    """
+    Браузер, уже авторизованный как john/demo и открытый на overview.htm.
+    Вход через UI (LoginPage) остаётся для тестов, которые проверяют сам логин.
+    """
+    return auth_session.login(driver)
+
+
+@pytest.fixture(scope="session")
+def bank_api(base_url):
+    """
+    REST-клиент ParaBank для проверок до и после действия в UI:
+        balance = bank_api.balance(13344)
+    """
+    api = BankApi(base_url)
+    yield api
+    api.close()
+
+
+@pytest.fixture(scope="session")
+def provisioner(base_url):
+    """Создание клиентов и счетов по HTTP с общим пулом keep-alive соединений."""
+    provisioner = Provisioner(base_url)
+    yield provisioner
+    provisioner.close()
+
+
+@pytest.fixture
+def customer_factory(provisioner):
+    """
+    Фабрика отдельных клиентов для теста, без браузера:
+        customer = customer_factory(balances=[("CHECKING", 500), ("SAVINGS", 100)])
+        customers = customer_factory.many(5)
+    """
+    def create(**kwargs):
+        return provisioner.create_customer(**kwargs)
+    create.many = provisioner.create_customers
+    return create
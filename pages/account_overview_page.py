@@ -1,5 +1,74 @@
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple, Optional
+
 from pages.base_page import BasePage
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+
+
+# Читает таблицу accountTable целиком за один вызов: строки счетов
+# [номер, баланс, доступно] и итог. Пока AJAX не заполнил таблицу, возвращает null.
+SNAPSHOT_SCRIPT = """
+var table = document.getElementById("accountTable");
+if (!table) { return null; }
+var rows = [], total = null;
+Array.prototype.forEach.call(table.querySelectorAll("tbody tr"), function (row) {
+  var cells = row.querySelectorAll("td");
+  var link = cells.length ? cells[0].querySelector("a") : null;
+  if (link) {
+    rows.push([link.textContent.trim(), cells[1].textContent.trim(),
+               cells.length > 2 ? cells[2].textContent.trim() : ""]);
+  } else if (cells.length > 1 && cells[0].textContent.indexOf("Total") !== -1) {
+    total = cells[1].textContent.trim();
+  }
+});
+return rows.length ? [rows, total] : null;
+"""
+
+
+def parse_money(text):
+    """Переводит сумму вида "$1,234.50" или "-$50.00" в Decimal; пустая строка — None."""
+    cleaned = text.replace("$", "").replace(",", "").strip()
+    if not cleaned:
+        return None
+    try:
+        return Decimal(cleaned)
+    except InvalidOperation:
+        raise ValueError(f"Сумма '{text}' не является числовым значением.")
+
+
+class AccountRecord(NamedTuple):
+    account_id: str
+    balance: Decimal
+    # Пустая ячейка "Available Amount" — None.
+    available: Optional[Decimal]
+    balance_text: str
+
+
+class AccountSnapshot:
+    """Снимок таблицы счетов: записи в порядке страницы и поиск по номеру за O(1)."""
+
+    def __init__(self, records, total):
+        self.records = tuple(records)
+        self.total = total
+        self._by_id = {record.account_id: record for record in self.records}
+
+    def __getitem__(self, account_id):
+        return self._by_id[str(account_id)]
+
+    def __contains__(self, account_id):
+        return str(account_id) in self._by_id
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def account_ids(self):
+        return [record.account_id for record in self.records]
 
 
 class AccountOverviewPage(BasePage):
@@ -11,27 +80,44 @@ class AccountOverviewPage(BasePage):
     ACCOUNT_NUMBER_13344 = (
         By.XPATH, "//table[@id='accountTable']//a[@href='activity.htm?id=13344']")
 
+    PATH = "overview.htm"
+    READY = ACCOUNT_OVERVIEW_HEADER
+    # Таблица счетов заполняется AJAX-запросом.
+    READY_NETWORK_IDLE = True
+
     def is_account_overview_displayed(self):
         """
-        Ожидает появления заголовка раздела "Accounts Overview" и возвращает True, если он найден.
+        Ожидает готовности обзора счетов (заголовок "Accounts Overview" и загруженная
+        таблица) и возвращает True, если дождался.
         """
-        try:
-            self.wait_for_element(self.ACCOUNT_OVERVIEW_HEADER, timeout=15)
-            return True
-        except Exception as e:
-            print("Account overview header not found:", e)
-            return False
+        return self.is_ready(timeout=15)
+
+    def snapshot(self, timeout=15):
+        """
+        Считывает всю таблицу accountTable одним запросом к браузеру, дождавшись
+        её заполнения, и возвращает AccountSnapshot с суммами в Decimal.
+        """
+        rows, total = self._table(timeout)
+        records = [
+            AccountRecord(account_id, parse_money(balance), parse_money(available), balance)
+            for account_id, balance, available in rows
+        ]
+        return AccountSnapshot(records, parse_money(total) if total else None)
+
+    def _table(self, timeout):
+        """Строки таблицы счетов как есть (текст ячеек) и текст итога."""
+        return WebDriverWait(self.driver, timeout).until(
+            lambda driver: driver.execute_script(SNAPSHOT_SCRIPT))
 
     def get_account_balance(self, account_id):
         """
-        Находит строку в таблице по номеру аккаунта и возвращает текст первой соседней ячейки (баланс).
-        Пример XPath: //table[@id='accountTable']//a[text()='13344']/parent::td/following-sibling::td[1]
+        Возвращает текст баланса счета из таблицы (например, "$515.50").
+        Если счета нет в таблице, бросает NoSuchElementException.
         """
-        row_locator = (
-            By.XPATH,
-            f"//table[@id='accountTable']//a[text()='{account_id}']/parent::td/following-sibling::td[1]"
-        )
-        return self.find_element(row_locator).text
+        snapshot = self.snapshot()
+        if account_id not in snapshot:
+            raise NoSuchElementException(f"Счет {account_id} не найден в таблице accountTable")
+        return snapshot[account_id].balance_text
 
     def view_transaction_history(self, account_id):
         """
@@ -47,11 +133,11 @@ class AccountOverviewPage(BasePage):
         """
         Проверяет, отображается ли номер аккаунта на странице обзора аккаунтов.
         Возвращает True, если элемент с указанным номером найден, иначе False.
+        Суммы не разбираются, поэтому нечисловая ячейка в другой строке не
+        превращает проверку в ошибку.
         """
-        locator = (
-            By.XPATH, f"//table[@id='accountTable']//a[text()='{account_id}']")
         try:
-            self.wait_for_element(locator, timeout=10)
-            return True
-        except Exception:
+            rows, _ = self._table(timeout=10)
+        except TimeoutException:
             return False
+        return any(row_id == str(account_id) for row_id, _, _ in rows)
@@ -0,0 +1,57 @@
+import functools
+import inspect
+
+from pages.base_page import BasePage
+
+
+def _coroutine(name, func):
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        return await self.driver.call(getattr(self.page, name), *args, **kwargs)
+    return method
+
+
+def _wrap_methods(cls):
+    """Объявляет для каждого публичного метода SYNC_PAGE одноимённую корутину."""
+    for name, value in inspect.getmembers(cls.SYNC_PAGE, inspect.isfunction):
+        if not name.startswith("_") and name not in vars(cls):
+            setattr(cls, name, _coroutine(name, value))
+    return cls
+
+
+class AsyncBasePage:
+    """
+    Асинхронный вариант page object поверх AsyncDriver (utils/async_driver.py).
+
+    Логика страницы не дублируется: SYNC_PAGE — обычный page object, и каждый
+    его публичный метод доступен как корутина, которая выполняется в потоке
+    сессии браузера. Пока одна страница ждёт элемент или AJAX, event loop
+    ведёт другие сессии. Локаторы и прочие атрибуты читаются из SYNC_PAGE:
+
+        login_page = await AsyncLoginPage.navigate(driver, base_url)
+        await login_page.login("john", "demo")
+        assert await login_page.result() == "logged_in"
+    """
+
+    SYNC_PAGE = BasePage
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _wrap_methods(cls)
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page = self.SYNC_PAGE(driver.sync)
+
+    def __getattr__(self, name):
+        return getattr(self.page, name)
+
+    @classmethod
+    async def navigate(cls, driver, base_url, timeout=None):
+        """Открывает страницу класса (base_url + PATH) и возвращает page object, когда она готова."""
+        page = cls(driver)
+        await page.open(f"{base_url.rstrip('/')}/{cls.SYNC_PAGE.PATH}", timeout=timeout)
+        return page
+
+
+_wrap_methods(AsyncBasePage)
@@ -0,0 +1,46 @@
+from pages.account_overview_page import AccountOverviewPage
+from pages.async_base_page import AsyncBasePage
+from pages.bill_pay_page import BillPayPage
+from pages.contact_page import ContactPage
+from pages.funds_transfer_page import FundsTransferPage
+from pages.login_page import LoginPage
+from pages.navigation_page import NavigationPage
+from pages.profile_page import ProfilePage
+from pages.registration_page import RegistrationPage
+from pages.search_page import SearchPage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    SYNC_PAGE = LoginPage
+
+
+class AsyncRegistrationPage(AsyncBasePage):
+    SYNC_PAGE = RegistrationPage
+
+
+class AsyncAccountOverviewPage(AsyncBasePage):
+    SYNC_PAGE = AccountOverviewPage
+
+
+class AsyncFundsTransferPage(AsyncBasePage):
+    SYNC_PAGE = FundsTransferPage
+
+
+class AsyncBillPayPage(AsyncBasePage):
+    SYNC_PAGE = BillPayPage
+
+
+class AsyncProfilePage(AsyncBasePage):
+    SYNC_PAGE = ProfilePage
+
+
+class AsyncContactPage(AsyncBasePage):
+    SYNC_PAGE = ContactPage
+
+
+class AsyncNavigationPage(AsyncBasePage):
+    SYNC_PAGE = NavigationPage
+
+
+class AsyncSearchPage(AsyncBasePage):
+    SYNC_PAGE = SearchPage
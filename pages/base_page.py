@@ -1,22 +1,343 @@
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, TimeoutException)
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from utils import network_idle, resource_blocking
+from utils.locators import compile_class_locators
+from utils.webdriver_timing import trace_methods
+
+
+# Заполняет поля формы за один вызов execute_script: находит элементы,
+# выставляет value через нативный сеттер (его видят и фреймворки вроде
+# AngularJS) и генерирует события input/change. Возвращает индексы полей,
+# которые не найдены или в чьём <select> нет нужного значения.
+FILL_FORM_SCRIPT = """
+var fields = arguments[0], missing = [];
+function resolve(by, value) {
+  switch (by) {
+    case "id": return document.getElementById(value);
+    case "name": return document.getElementsByName(value)[0] || null;
+    case "css selector": return document.querySelector(value);
+    case "xpath": return document.evaluate(
+      value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return null;
+}
+fields.forEach(function (field, index) {
+  var element = resolve(field[0], field[1]), value = field[2], proto;
+  if (!element) { missing.push(index); return; }
+  if (element.tagName === "SELECT") {
+    if (!Array.prototype.some.call(element.options, function (o) { return o.value === value; })) {
+      missing.push(index);
+      return;
+    }
+    proto = HTMLSelectElement.prototype;
+  } else {
+    proto = element.tagName === "TEXTAREA" ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  }
+  Object.getOwnPropertyDescriptor(proto, "value").set.call(element, value);
+  element.dispatchEvent(new Event("input", {bubbles: true}));
+  element.dispatchEvent(new Event("change", {bubbles: true}));
+});
+return missing;
+"""
+SCRIPT_STRATEGIES = ("id", "name", "css selector", "xpath")
+
+# Проверка текста выполняется в браузере, наружу возвращается только bool.
+# Ищем по сериализованному DOM — так же, как `text in driver.page_source`.
+TEXT_PRESENT_SCRIPT = "return document.documentElement.outerHTML.indexOf(arguments[0]) !== -1;"
+
+# Идентификатор документа и счётчик его изменений: по ним снимок page_source
+# понимает, что страница сменилась или перерисовалась.
+PAGE_STATE_SCRIPT = """
+var state = window.__pageSourceState;
+if (!state) {
+  state = window.__pageSourceState = {id: Date.now() + "-" + Math.random(), version: 0};
+  new MutationObserver(function () { state.version++; }).observe(
+    document, {subtree: true, childList: true, attributes: true, characterData: true});
+}
+return [location.href, state.id, state.version];
+"""
+
+# Счётчики кэша элементов всех page objects процесса: hits — сэкономленные
+# поиски (элемент из кэша использован без лишних команд), validated —
+# попадания find_element, проверенные одной командой tag_name (поиск заменён
+# проверкой, round trip не сэкономлен), misses — реальные поиски, stale —
+# элементы, устаревшие после смены документа.
+ELEMENT_CACHE_STATS = {"hits": 0, "validated": 0, "misses": 0, "stale": 0}
+
 
 class BasePage:
+    # Неявное ожидание в драйвере отключено: каждый поиск ждёт явно и ровно
+    # столько, сколько указано в вызове.
+    DEFAULT_TIMEOUT = 10
+    # Поля, которые нужно вводить настоящими нажатиями клавиш (например,
+    # из-за JS-валидации по keydown/keyup), а не через fill_form.
+    TYPED_FIELDS = ()
+    # XPath-локаторы в атрибутах класса переводятся в поиск по id или CSS,
+    # где это не меняет смысла (utils/locators.py). False — оставить как есть.
+    COMPILE_LOCATORS = True
+    # Профиль блокировки ресурсов (utils/resource_blocking.py), который open()
+    # включает перед загрузкой страницы. None — оставить профиль теста.
+    RESOURCE_PROFILE = None
+    # Контракт готовности страницы: путь относительно base_url, ключевой
+    # элемент, который должен стать видимым, и нужно ли дождаться окончания
+    # AJAX-запросов (например, загрузки списка счетов). Драйвер загружает
+    # страницы со стратегией eager, поэтому open() и navigate() ждут именно
+    # этого, а не загрузки всех картинок и стилей.
+    PATH = None
+    READY = None
+    READY_NETWORK_IDLE = False
+    READY_QUIET_PERIOD = 0.2
+
+    def __init_subclass__(cls, **kwargs):
+        # Методы page objects задают контекст (метод, локатор) для замеров
+        # команд WebDriver, см. utils/webdriver_timing.py.
+        super().__init_subclass__(**kwargs)
+        if cls.COMPILE_LOCATORS:
+            compile_class_locators(cls)
+        trace_methods(cls)
+
     def __init__(self, driver):
         self.driver = driver
+        self._elements = {}
+        self._page_source = None
+
+    def find_element(self, locator, timeout=None):
+        """
+        Возвращает элемент по локатору, при необходимости ожидая его
+        появления в DOM (до timeout секунд).
+
+        Найденные элементы кэшируются по локатору. Ссылка на элемент
+        привязана к документу, поэтому элемент из кэша перед возвратом
+        проверяется одной лёгкой командой: если после навигации или
+        перерисовки он устарел, запись сбрасывается и элемент ищется заново.
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            try:
+                element.tag_name
+                ELEMENT_CACHE_STATS["validated"] += 1
+                return element
+            except StaleElementReferenceException:
+                ELEMENT_CACHE_STATS["stale"] += 1
+                self.invalidate()
+        return self._locate(locator, timeout)
+
+    def _cached_element(self, locator):
+        """
+        Элемент из кэша без проверки: для действий _with_element, которые
+        сами повторяются на свежем элементе при StaleElementReferenceException.
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            ELEMENT_CACHE_STATS["hits"] += 1
+            return element
+        return self._locate(locator)
+
+    def _locate(self, locator, timeout=None):
+        ELEMENT_CACHE_STATS["misses"] += 1
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        element = WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+        self._elements[locator] = element
+        return element
+
+    def invalidate(self, locator=None):
+        """Сбрасывает кэш элементов: для одного локатора или целиком."""
+        if locator is None:
+            self._elements.clear()
+        else:
+            self._elements.pop(locator, None)
+
+    @classmethod
+    def navigate(cls, driver, base_url, timeout=None):
+        """Открывает страницу класса (base_url + PATH) и возвращает page object, когда она готова."""
+        page = cls(driver)
+        page.open(f"{base_url.rstrip('/')}/{cls.PATH}", timeout=timeout)
+        return page
+
+    def open(self, url, timeout=None):
+        """
+        Открывает url и ждёт готовности страницы (wait_until_ready); элементы
+        предыдущего документа из кэша удаляются. Если у класса задан
+        RESOURCE_PROFILE, перед загрузкой включается он.
+        """
+        self.invalidate()
+        if self.RESOURCE_PROFILE is not None:
+            resource_blocking.apply_profile(self.driver, self.RESOURCE_PROFILE)
+        self.driver.get(url)
+        self.wait_until_ready(timeout)
+
+    def wait_until_ready(self, timeout=None):
+        """
+        Ждёт выполнения контракта готовности: READY виден и, если задано
+        READY_NETWORK_IDLE, AJAX-запросы затихли. Без READY ждёт полной
+        загрузки документа, как стратегия normal.
+        """
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        if self.READY is None:
+            self.wait_for_page_ready(timeout)
+            return
+        self.wait_for_element(self.READY, timeout=timeout)
+        if self.READY_NETWORK_IDLE:
+            self.wait_for_network_idle(self.READY_QUIET_PERIOD, timeout, loaded=False)
+
+    def is_ready(self, timeout=None):
+        """True, если контракт готовности выполнился за timeout секунд."""
+        try:
+            self.wait_until_ready(timeout)
+            return True
+        except TimeoutException:
+            return False
 
-    def find_element(self, locator):
-        return self.driver.find_element(*locator)
+    def _with_element(self, locator, action):
+        """
+        Выполняет action над элементом из кэша. Если элемент устарел,
+        ищет его заново и повторяет действие один раз.
+        """
+        try:
+            return action(self._cached_element(locator))
+        except StaleElementReferenceException:
+            ELEMENT_CACHE_STATS["stale"] += 1
+            self.invalidate()
+            return action(self._locate(locator))
+
+    def find_elements(self, locator):
+        """Возвращает найденные элементы сразу, без ожидания."""
+        return self.driver.find_elements(*locator)
 
     def click(self, locator):
-        element = self.find_element(locator)
-        element.click()
+        self._with_element(locator, lambda element: element.click())
 
     def send_keys(self, locator, keys):
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(keys)
+        def clear_and_type(element):
+            element.clear()
+            element.send_keys(keys)
+        self._with_element(locator, clear_and_type)
+
+    def get_text(self, locator):
+        return self._with_element(locator, lambda element: element.text)
+
+    def select_by_value(self, locator, value):
+        self._with_element(locator, lambda element: Select(element).select_by_value(value))
+
+    def fill_form(self, fields, typed=None):
+        """
+        Заполняет форму: fields — {локатор: значение} для полей ввода и <select>.
+
+        Все поля со стратегиями id/name/css/xpath выставляются одним вызовом
+        скрипта вместо find/clear/send_keys на каждое поле. Локаторы из typed
+        (по умолчанию TYPED_FIELDS) и прочих стратегий вводятся по-старому.
+        Если поле или значение <select> не найдено, бросает NoSuchElementException.
+        """
+        typed = self.TYPED_FIELDS if typed is None else typed
+        fields = list(fields.items())
+        # Дожидаемся формы так же, как это делал бы первый send_keys.
+        self.find_element(fields[0][0])
+        scripted = [(locator, value) for locator, value in fields
+                    if locator not in typed and locator[0] in SCRIPT_STRATEGIES]
+        missing = self.driver.execute_script(
+            FILL_FORM_SCRIPT, [[by, value, str(text)] for (by, value), text in scripted])
+        if missing:
+            raise NoSuchElementException(
+                "Не удалось заполнить поля: " + ", ".join(str(scripted[i]) for i in missing))
+        for locator, value in fields:
+            if (locator, value) in scripted:
+                continue
+            if self._with_element(locator, lambda element: element.tag_name) == "select":
+                self.select_by_value(locator, str(value))
+            else:
+                self.send_keys(locator, value)
 
     def wait_for_element(self, locator, timeout=15):
-        return WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+        element = WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+        ELEMENT_CACHE_STATS["misses"] += 1
+        self._elements[locator] = element
+        return element
+
+    def wait_for_any(self, outcomes, timeout=15):
+        """
+        Ждёт, пока станет видимым любой из локаторов outcomes ({имя: локатор}),
+        и возвращает имя первого найденного. Локаторы проверяются в порядке
+        словаря, поэтому при одновременном появлении побеждает более ранний.
+        Если за timeout ничего не появилось, возвращает None.
+        """
+        def first_visible(driver):
+            for name, locator in outcomes.items():
+                if any(element.is_displayed() for element in driver.find_elements(*locator)):
+                    return name
+            return False
+
+        try:
+            return WebDriverWait(
+                self.driver, timeout, ignored_exceptions=[StaleElementReferenceException]
+            ).until(first_visible)
+        except TimeoutException:
+            return None
+
+    def wait_for_page_ready(self, timeout=None):
+        """Ждёт, пока документ полностью загрузится (document.readyState == 'complete')."""
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        WebDriverWait(self.driver, timeout).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete")
+
+    def track_network(self):
+        """
+        Включает учёт XHR/fetch в текущем документе. Вызывается перед
+        действием, запускающим AJAX, если трекер не был установлен через CDP.
+        """
+        network_idle.track(self.driver)
+
+    def wait_for_network_idle(self, quiet_period=0.5, timeout=15, loaded=True):
+        """
+        Ждёт, пока страница простоит quiet_period секунд без незавершённых
+        XHR/fetch и навигаций. Заменяет фиксированные time.sleep после
+        действий с AJAX или переходом на другую страницу. С loaded=False не
+        ждёт загрузки подресурсов документа (см. network_idle.idle_for).
+        """
+        WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+            lambda driver: (network_idle.idle_for(driver, loaded) or 0) >= quiet_period)
+
+    def is_text_present(self, text, timeout=0):
+        """
+        Проверяет наличие текста на странице внутри браузера, не передавая
+        DOM целиком. С timeout > 0 ждёт появления текста до timeout секунд.
+        """
+        def found(driver):
+            return driver.execute_script(TEXT_PRESENT_SCRIPT, text)
+
+        if not timeout:
+            return found(self.driver)
+        try:
+            return WebDriverWait(self.driver, timeout).until(found)
+        except TimeoutException:
+            return False
+
+    def page_source(self):
+        """
+        Возвращает исходный код страницы. Полный DOM скачивается один раз на
+        документ и повторно — только после смены URL, документа или изменений DOM.
+        """
+        state = tuple(self.driver.execute_script(PAGE_STATE_SCRIPT))
+        if self._page_source is None or self._page_source[0] != state:
+            self._page_source = (state, self.driver.page_source)
+        return self._page_source[1]
+
+    def is_element_absent(self, locator, timeout=None):
+        """
+        Возвращает True, если после загрузки страницы элемента в DOM нет.
+        Не ждёт появления элемента: проверка выполняется один раз, как только
+        документ готов, поэтому отсутствующий элемент не стоит таймаута.
+        """
+        self.wait_for_page_ready(timeout)
+        return not self.find_elements(locator)
+
+    def assert_element_absent(self, locator, timeout=None, message=None):
+        """Падает с AssertionError, если элемент присутствует на загруженной странице."""
+        assert self.is_element_absent(locator, timeout), \
+            message or f"Элемент {locator} присутствует на странице, хотя его быть не должно."
+
+
+trace_methods(BasePage)
@@ -1,6 +1,5 @@
 from pages.base_page import BasePage
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
 
 
 class BillPayPage(BasePage):
@@ -26,45 +25,51 @@ class BillPayPage(BasePage):
     AMOUNT_INVALID_ERROR = (
         By.XPATH, "//span[@id='validationModel-amount-invalid' and contains(text(),'Please enter a valid amount')]")
 
+    PATH = "billpay.htm"
+    READY = PAYEE_NAME_INPUT
+    # Список счетов в форме подгружается AJAX-запросом.
+    READY_NETWORK_IDLE = True
+
     def pay_bill(self, payee_name, address, city, state, zip_code, phone, account, verify_account, amount, from_account):
-        self.send_keys(self.PAYEE_NAME_INPUT, payee_name)
-        self.send_keys(self.ADDRESS_INPUT, address)
-        self.send_keys(self.CITY_INPUT, city)
-        self.send_keys(self.STATE_INPUT, state)
-        self.send_keys(self.ZIP_CODE_INPUT, zip_code)
-        self.send_keys(self.PHONE_INPUT, phone)
-        self.send_keys(self.ACCOUNT_INPUT, account)
-        self.send_keys(self.VERIFY_ACCOUNT_INPUT, verify_account)
-        self.send_keys(self.AMOUNT_INPUT, amount)
-        select = Select(self.find_element(self.FROM_ACCOUNT_SELECT))
-        select.select_by_value(from_account)
+        self.fill_form({
+            self.PAYEE_NAME_INPUT: payee_name,
+            self.ADDRESS_INPUT: address,
+            self.CITY_INPUT: city,
+            self.STATE_INPUT: state,
+            self.ZIP_CODE_INPUT: zip_code,
+            self.PHONE_INPUT: phone,
+            self.ACCOUNT_INPUT: account,
+            self.VERIFY_ACCOUNT_INPUT: verify_account,
+            self.AMOUNT_INPUT: amount,
+            self.FROM_ACCOUNT_SELECT: from_account,
+        })
         self.click(self.SEND_PAYMENT_BUTTON)
 
+    def result(self, prefer=None, timeout=15):
+        """
+        Ждёт исхода оплаты и возвращает имя первого появившегося результата:
+        "success", "payee_required", "account_mismatch" или "amount_invalid".
+        Ошибки валидации показываются одновременно, поэтому исход prefer
+        проверяется первым. Если за timeout ничего не появилось, возвращает None.
+        """
+        outcomes = {
+            "success": self.SUCCESS_MESSAGE,
+            "payee_required": self.ERROR_MESSAGE,
+            "account_mismatch": self.VERIFY_ACCOUNT_MISMATCH_ERROR,
+            "amount_invalid": self.AMOUNT_INVALID_ERROR,
+        }
+        if prefer is not None:
+            outcomes = {prefer: outcomes.pop(prefer), **outcomes}
+        return self.wait_for_any(outcomes, timeout=timeout)
+
     def is_payment_successful(self):
-        try:
-            self.wait_for_element(self.SUCCESS_MESSAGE, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result(prefer="success") == "success"
 
     def is_payment_error_displayed(self):
-        try:
-            self.wait_for_element(self.ERROR_MESSAGE, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result(prefer="payee_required") == "payee_required"
 
     def is_verify_account_mismatch_error_displayed(self):
-        try:
-            self.wait_for_element(
-                self.VERIFY_ACCOUNT_MISMATCH_ERROR, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result(prefer="account_mismatch") == "account_mismatch"
 
     def is_amount_invalid_error_displayed(self):
-        try:
-            self.wait_for_element(self.AMOUNT_INVALID_ERROR, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result(prefer="amount_invalid") == "amount_invalid"
@@ -13,6 +13,9 @@ class ContactPage(BasePage):
     SUCCESS_MESSAGE = (
         By.XPATH, "//div[@id='rightPanel']//p[contains(text(),'A Customer Care Representative will be contacting you.')]")
 
+    PATH = "contact.htm"
+    READY = NAME_INPUT
+
     def submit_contact_form(self, name, email, phone, message):
         self.send_keys(self.NAME_INPUT, name)
         self.send_keys(self.EMAIL_INPUT, email)
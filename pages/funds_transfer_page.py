@@ -1,6 +1,5 @@
 from pages.base_page import BasePage
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
 
 
 class FundsTransferPage(BasePage):
@@ -13,34 +12,42 @@ class FundsTransferPage(BasePage):
     ERROR_MESSAGE = (
         By.XPATH, "//div[@id='showError']//h1[contains(text(), 'Error!')]")
 
-    def transfer_funds(self, amount, from_account, to_account):
-        self.clear_and_send_keys(self.AMOUNT_INPUT, amount)
+    PATH = "transfer.htm"
+    READY = AMOUNT_INPUT
+    # Списки счетов «откуда» и «куда» подгружаются AJAX-запросом.
+    READY_NETWORK_IDLE = True
 
-        from_select = Select(self.find_element(self.FROM_ACCOUNT_SELECT))
-        from_select.select_by_value(from_account)
-        to_select = Select(self.find_element(self.TO_ACCOUNT_SELECT))
-        to_select.select_by_value(to_account)
+    def transfer_funds(self, amount, from_account, to_account, quiet_period=0.5):
+        """
+        Заполняет форму перевода, отправляет её и ждёт завершения AJAX-запроса
+        и ещё quiet_period секунд тишины в сети (0 — только завершения запроса).
+        """
+        self.track_network()
+        self.clear_and_send_keys(self.AMOUNT_INPUT, amount)
+        self.select_by_value(self.FROM_ACCOUNT_SELECT, from_account)
+        self.select_by_value(self.TO_ACCOUNT_SELECT, to_account)
 
         self.click(self.TRANSFER_BUTTON)
+        self.wait_for_network_idle(quiet_period)
+
+    def result(self, timeout=15):
+        """
+        Ждёт исхода перевода и возвращает "success" или "error" — смотря что
+        появится раньше, — либо None, если за timeout не появилось ничего.
+        """
+        return self.wait_for_any({
+            "success": self.SUCCESS_MESSAGE,
+            "error": self.ERROR_MESSAGE,
+        }, timeout=timeout)
 
     def is_transfer_successful(self):
-        try:
-            self.wait_for_element(self.SUCCESS_MESSAGE, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result(timeout=15) == "success"
 
     def is_transfer_error_displayed(self):
-        try:
-            self.wait_for_element(self.ERROR_MESSAGE, timeout=5)
-            return True
-        except Exception:
-            return False
+        return self.result(timeout=5) == "error"
 
     def clear_and_send_keys(self, locator, keys):
         """
         Очищает поле, найденное по локатору, и отправляет в него указанные ключи.
         """
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(keys)
+        self.send_keys(locator, keys)
@@ -10,15 +10,27 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = (By.XPATH, "//input[@value='Log In']")
     ERROR_MESSAGE = (
         By.XPATH, "//div[@id='updateProfileError']//h1[@class='Error!']")
+    REJECTED_MESSAGE = (By.XPATH, "//div[@id='rightPanel']//p[@class='error']")
+    LOGOUT_LINK = (By.XPATH, "//div[@id='leftPanel']//a[@href='logout.htm']")
+
+    PATH = "index.htm"
+    READY = USERNAME_INPUT
 
     def login(self, username, password):
         self.send_keys(self.USERNAME_INPUT, username)
         self.send_keys(self.PASSWORD_INPUT, password)
         self.click(self.LOGIN_BUTTON)
 
+    def result(self, timeout=15):
+        """
+        Ждёт исхода входа: "error", "rejected" (сообщение сервера о неверных
+        данных) или "logged_in" — что появится раньше; None по таймауту.
+        """
+        return self.wait_for_any({
+            "error": self.ERROR_MESSAGE,
+            "rejected": self.REJECTED_MESSAGE,
+            "logged_in": self.LOGOUT_LINK,
+        }, timeout=timeout)
+
     def is_error_displayed(self):
-        try:
-            self.wait_for_element(self.ERROR_MESSAGE, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result() == "error"
@@ -22,3 +22,8 @@ class NavigationPage(BasePage):
         link_locator = (
             By.XPATH, f"//div[@id='leftPanel']//a[text()='{link_text}']")
         self.click(link_locator)
+
+    def log_out(self):
+        """Нажимает "Log Out" и ждёт, пока завершится переход на страницу входа."""
+        self.click(self.LOG_OUT_LINK)
+        self.wait_for_network_idle()
@@ -16,28 +16,37 @@ class ProfilePage(BasePage):
     ERROR_MESSAGE = (
         By.XPATH, "//div[@id='updateProfileForm']//span[contains(@class, 'error') and not(contains(@style, 'display:none'))]")
 
+    PATH = "updateprofile.htm"
+    READY = PHONE_INPUT
+    # Поля формы заполняются данными клиента AJAX-запросом.
+    READY_NETWORK_IDLE = True
+
     def update_phone_number(self, new_phone):
         """
-        Нажимает на ссылку "Update Contact Info", ожидает появления формы обновления профиля,
-        очищает поле номера телефона, вводит новое значение и нажимает кнопку "Update Profile".
+        Нажимает на ссылку "Update Contact Info", ожидает готовности страницы профиля,
+        очищает поле номера телефона, вводит новое значение, нажимает кнопку "Update Profile"
+        и ждёт завершения AJAX-запроса.
         """
         self.click(self.EDIT_PROFILE_BUTTON)
-        self.wait_for_element((By.ID, "updateProfileForm"), timeout=10)
-        phone_field = self.find_element(self.PHONE_INPUT)
-        phone_field.clear()
-        phone_field.send_keys(new_phone)
+        self.invalidate()
+        self.wait_until_ready(timeout=10)
+        self.send_keys(self.PHONE_INPUT, new_phone)
+        self.track_network()
         self.click(self.SAVE_BUTTON)
+        self.wait_for_network_idle()
+
+    def result(self, timeout=30):
+        """
+        Ждёт исхода обновления профиля: "success" или "error" — что появится
+        раньше. Если за timeout не появилось ничего, возвращает None.
+        """
+        return self.wait_for_any({
+            "success": self.SUCCESS_MESSAGE,
+            "error": self.ERROR_MESSAGE,
+        }, timeout=timeout)
 
     def is_update_successful(self):
-        try:
-            self.wait_for_element(self.SUCCESS_MESSAGE, timeout=30)
-            return True
-        except Exception:
-            return False
+        return self.result() == "success"
 
     def is_error_displayed(self):
-        try:
-            self.wait_for_element(self.ERROR_MESSAGE, timeout=30)
-            return True
-        except Exception:
-            return False
+        return self.result() == "error"
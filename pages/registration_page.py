@@ -29,39 +29,51 @@ class RegistrationPage(BasePage):
         By.XPATH, "//form[@id='customerForm']//input[@value='Register']")
     ERROR_MESSAGE = (
         By.XPATH, "//span[contains(@class, 'error') or contains(text(), 'error')]")
+    LOGOUT_LINK = (By.XPATH, "//div[@id='leftPanel']//a[@href='logout.htm']")
+
+    PATH = "register.htm"
+    READY = FIRST_NAME_INPUT
 
     def register(self, first_name, last_name, address, city, state, zip_code, phone, ssn, username, password, confirm_password):
-        self.send_keys(self.FIRST_NAME_INPUT, first_name)
-        self.send_keys(self.LAST_NAME_INPUT, last_name)
-        self.send_keys(self.ADDRESS_INPUT, address)
-        self.send_keys(self.CITY_INPUT, city)
-        self.send_keys(self.STATE_INPUT, state)
-        self.send_keys(self.ZIP_CODE_INPUT, zip_code)
-        self.send_keys(self.PHONE_INPUT, phone)
-        self.send_keys(self.SSN_INPUT, ssn)
-        self.send_keys(self.USERNAME_INPUT, username)
-        self.send_keys(self.PASSWORD_INPUT, password)
-        self.send_keys(self.CONFIRM_PASSWORD_INPUT, confirm_password)
+        self.fill_form({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.ADDRESS_INPUT: address,
+            self.CITY_INPUT: city,
+            self.STATE_INPUT: state,
+            self.ZIP_CODE_INPUT: zip_code,
+            self.PHONE_INPUT: phone,
+            self.SSN_INPUT: ssn,
+            self.USERNAME_INPUT: username,
+            self.PASSWORD_INPUT: password,
+            self.CONFIRM_PASSWORD_INPUT: confirm_password,
+        })
         self.click(self.REGISTER_BUTTON)
 
+    def result(self, timeout=15):
+        """
+        Ждёт исхода регистрации: "success" (появилась ссылка "Log Out") или
+        "error" — что появится раньше; None по таймауту.
+        """
+        return self.wait_for_any({
+            "success": self.LOGOUT_LINK,
+            "error": self.ERROR_MESSAGE,
+        }, timeout=timeout)
+
     def is_registration_successful(self):
         """
         Проверяет, что регистрация прошла успешно (появилась ссылка "Log Out").
         """
-        try:
-            self.wait_for_element(self.LOGOUT_LINK, timeout=15)
-            return True
-        except Exception:
-            return False
+        return self.result() == "success"
 
     def get_error_message(self):
         """
         Возвращает текст сообщения об ошибке при неуспешной регистрации.
         Если сообщение не найдено, возвращает None.
         """
-        try:
-            error_element = self.wait_for_element(
-                self.ERROR_MESSAGE, timeout=5)
-            return error_element.text
-        except Exception:
+        if self.result(timeout=5) != "error":
             return None
+        for element in self.find_elements(self.ERROR_MESSAGE):
+            if element.is_displayed():
+                return element.text
+        return None
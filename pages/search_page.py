@@ -8,5 +8,8 @@ class SearchPage(BasePage):
 
     def is_search_field_present(self):
         """Возвращает True, если поле поиска найдено на странице, иначе False."""
-        elements = self.driver.find_elements(*self.SEARCH_INPUT)
-        return len(elements) > 0
+        return not self.is_element_absent(self.SEARCH_INPUT)
+
+    def is_results_absent(self):
+        """Возвращает True, если контейнера результатов поиска на загруженной странице нет."""
+        return self.is_element_absent(self.RESULTS)
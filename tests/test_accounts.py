@@ -1,20 +1,28 @@
+from decimal import Decimal
+
+import pytest
+
 from pages.account_overview_page import AccountOverviewPage
-from pages.login_page import LoginPage
+from utils.auth_session import AuthSession
+
+pytestmark = pytest.mark.resources("functional")
 
 
-def test_account_overview(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    account_overview = AccountOverviewPage(driver)
+def test_account_overview(logged_in_driver, base_url):
+    account_overview = AccountOverviewPage(logged_in_driver)
     assert account_overview.is_account_overview_displayed(
     ), "Account Overview is not displayed."
 
 
-def test_view_transaction_history(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    account_overview = AccountOverviewPage(driver)
+def test_view_transaction_history(logged_in_driver, base_url):
+    account_overview = AccountOverviewPage(logged_in_driver)
     account_overview.view_transaction_history("13344")
-    assert "Account Activity" in driver.page_source, "Transaction history is not displayed."
+    assert account_overview.is_text_present("Account Activity"), "Transaction history is not displayed."
+
+
+def test_provisioned_customer_accounts(driver, base_url, customer_factory):
+    customer = customer_factory(balances=[("CHECKING", "250.00"), ("SAVINGS", "75.50")])
+    AuthSession(base_url, customer.username, customer.password).login(driver)
+    snapshot = AccountOverviewPage(driver).snapshot()
+    assert snapshot.account_ids == [str(account_id) for account_id in customer.accounts]
+    assert snapshot.total == Decimal("325.50"), f"Unexpected total: {snapshot.total}"
@@ -1,5 +1,3 @@
-import time
-from selenium.webdriver.common.by import By
 import pytest
 from pages.login_page import LoginPage
 from pages.registration_page import RegistrationPage
@@ -16,17 +14,15 @@ def test_multiple_failed_login_attempts(driver, base_url):
     Тест проверяет, что при вводе неправильных учетных данных вход осуществляется (негативный сценарий).
     Ожидается, что тест провалится, так как система должна блокировать вход, но этого не происходит.
     """
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     for attempt in range(3):
         login_page.login("invalidUser", "invalidPass")
-        assert "Accounts Overview" in driver.page_source, f"Вход не осуществлен при попытке {attempt + 1}"
-        driver.get(base_url)
+        assert login_page.is_text_present("Accounts Overview"), f"Вход не осуществлен при попытке {attempt + 1}"
+        login_page.open(base_url)
 
 
 def test_registration_mismatched_password(driver, base_url):
-    driver.get(f"{base_url}/register.htm")
-    registration_page = RegistrationPage(driver)
+    registration_page = RegistrationPage.navigate(driver, base_url)
     registration_page.register(
         first_name="Mismatch",
         last_name="User",
@@ -44,70 +40,49 @@ def test_registration_mismatched_password(driver, base_url):
         "Регистрация прошла успешно, несмотря на несовпадающие пароли."
 
 
-def test_funds_transfer_negative_amount(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    driver.get(f"{base_url}/transfer.htm")
-    transfer_page = FundsTransferPage(driver)
+def test_funds_transfer_negative_amount(logged_in_driver, base_url):
+    transfer_page = FundsTransferPage.navigate(logged_in_driver, base_url)
     transfer_page.transfer_funds("-50", "13344", "13344")
     assert transfer_page.is_transfer_successful(
     ), "Перевод отрицательной суммы не был выполнен успешно."
 
 
-def test_funds_transfer_same_account(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    driver.get(f"{base_url}/transfer.htm")
-    transfer_page = FundsTransferPage(driver)
+def test_funds_transfer_same_account(logged_in_driver, base_url):
+    transfer_page = FundsTransferPage.navigate(logged_in_driver, base_url)
     transfer_page.transfer_funds("100", "13344", "13344")
     assert transfer_page.is_transfer_successful(
     ), "Перевод между одинаковыми счетами не был выполнен успешно."
 
 
-def test_funds_transfer_non_numeric_amount(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    driver.get(f"{base_url}/transfer.htm")
-    transfer_page = FundsTransferPage(driver)
+def test_funds_transfer_non_numeric_amount(logged_in_driver, base_url):
+    transfer_page = FundsTransferPage.navigate(logged_in_driver, base_url)
     transfer_page.transfer_funds("abc", "13344", "13344")
     assert transfer_page.is_transfer_error_displayed(), \
         "Ошибка не отображается при передаче нечислового значения суммы перевода."
 
 
 @pytest.mark.xfail(reason="Обновление профиля с пустым номером телефона должно проваливаться, но в текущей реализации проходит успешно.")
-def test_update_profile_empty_phone(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    driver.get(f"{base_url}/updateprofile.htm")
-    profile_page = ProfilePage(driver)
+def test_update_profile_empty_phone(logged_in_driver, base_url):
+    profile_page = ProfilePage.navigate(logged_in_driver, base_url)
     profile_page.update_phone_number("")
     assert profile_page.is_update_successful(
     ), "Обновление профиля не прошло успешно при пустом номере телефона."
 
 
-def test_access_restricted_after_logout(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-
-    logout_link = driver.find_element(By.LINK_TEXT, "Log Out")
-    logout_link.click()
-    time.sleep(1)
+@pytest.mark.browserless
+def test_access_restricted_after_logout(logged_in_driver, base_url):
+    NavigationPage(logged_in_driver).log_out()
 
-    driver.get(f"{base_url}/overview.htm")
+    logged_in_driver.get(f"{base_url}/overview.htm")
 
-    page_source = driver.page_source
     expected_indicator = "Customer Login"
 
-    assert expected_indicator in page_source, (
+    assert NavigationPage(logged_in_driver).is_text_present(expected_indicator), (
         f"После выхода доступ к защищённой странице разрешён. Ожидается наличие '{expected_indicator}' в странице."
     )
 
 
+@pytest.mark.browserless
 @pytest.mark.parametrize("link_text, expected_text", [
     ("Open New Account", "Open New Account"),
     ("Accounts Overview", "Accounts Overview"),
@@ -118,16 +93,14 @@ def test_access_restricted_after_logout(driver, base_url):
     ("Request Loan", "Request Loan"),
     ("Log Out", "Customer Login")
 ])
-def test_navigation_parameterized(driver, base_url, link_text, expected_text):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
-    login_page.login("john", "demo")
-    navigation = NavigationPage(driver)
+def test_navigation_parameterized(logged_in_driver, base_url, link_text, expected_text):
+    navigation = NavigationPage(logged_in_driver)
     navigation.navigate_to(link_text)
-    assert expected_text in driver.page_source, \
+    assert navigation.is_text_present(expected_text), \
         f"На странице '{link_text}' не найден ожидаемый текст: '{expected_text}'."
 
 
+@pytest.mark.browserless
 def test_search_empty_query(driver, base_url):
     """Проверяет, что для пустого запроса отсутствует поле поиска (функционал не реализован)."""
     driver.get(base_url)
@@ -136,6 +109,7 @@ def test_search_empty_query(driver, base_url):
     ), "Поле поиска обнаружено при пустом запросе."
 
 
+@pytest.mark.browserless
 def test_search_nonexistent_query(driver, base_url):
     """Проверяет, что для несуществующего запроса отсутствует поле поиска (функционал не реализован)."""
     driver.get(base_url)
@@ -145,20 +119,19 @@ def test_search_nonexistent_query(driver, base_url):
 
 
 def test_login_session_persistence(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
     driver.refresh()
-    assert "Accounts Overview" in driver.page_source, \
+    assert login_page.is_text_present("Accounts Overview"), \
         "Сессия не сохраняется после обновления страницы."
 
 
+@pytest.mark.browserless
 def test_logout_link_visibility(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
     try:
-        logout_link = driver.find_element("link text", "Log Out")
+        logout_link = login_page.find_element(("link text", "Log Out"))
         assert logout_link.is_displayed(
         ), "Ссылка 'Log Out' не отображается после успешного входа."
     except Exception:
@@ -0,0 +1,41 @@
+import asyncio
+
+import pytest
+
+from pages.async_pages import AsyncFundsTransferPage, AsyncLoginPage, AsyncNavigationPage
+
+
+async def login(driver, base_url):
+    login_page = await AsyncLoginPage.navigate(driver, base_url)
+    await login_page.login("john", "demo")
+    return await login_page.result()
+
+
+async def test_async_login(async_browser, base_url):
+    async with async_browser.session() as driver:
+        assert await login(driver, base_url) == "logged_in", "Вход не выполнен."
+
+
+@pytest.mark.parametrize("link_text", [
+    "Open New Account", "Transfer Funds", "Bill Pay", "Find Transactions", "Request Loan",
+])
+async def test_async_navigation(async_browser, base_url, link_text):
+    async with async_browser.session() as driver:
+        await login(driver, base_url)
+        navigation = AsyncNavigationPage(driver)
+        await navigation.navigate_to(link_text)
+        assert await navigation.is_text_present(link_text), \
+            f"Страница '{link_text}' не отображается."
+
+
+async def test_async_concurrent_transfers(async_browser, base_url):
+    """Два перевода в разных браузерах одновременно."""
+    async def transfer(amount):
+        async with async_browser.session() as driver:
+            await login(driver, base_url)
+            transfer_page = await AsyncFundsTransferPage.navigate(driver, base_url)
+            await transfer_page.transfer_funds(amount, "13344", "13344")
+            return await transfer_page.is_transfer_successful()
+
+    results = await asyncio.gather(transfer("10"), transfer("20"))
+    assert all(results), f"Не все переводы выполнены: {results}"
@@ -12,10 +12,9 @@ class TestAuth:
         """
         Проверяет, что пользователь может успешно войти в систему.
         """
-        driver.get(base_url)
-        login_page = LoginPage(driver)
+        login_page = LoginPage.navigate(driver, base_url)
         login_page.login("john", "demo")
-        assert "Accounts Overview" in driver.page_source, "Login failed: 'Accounts Overview' not found."
+        assert login_page.is_text_present("Accounts Overview"), "Login failed: 'Accounts Overview' not found."
 
     @pytest.mark.parametrize("username,password", [
         ("invalidUser", "invalidPass"),
@@ -27,8 +26,7 @@ class TestAuth:
         """
         Проверяет, что вход с неверными учетными данными не выполняется.
         """
-        driver.get(base_url)
-        login_page = LoginPage(driver)
+        login_page = LoginPage.navigate(driver, base_url)
         login_page.login(username, password)
 
         if not login_page.is_error_displayed():
@@ -38,13 +36,12 @@ class TestAuth:
         """
         Проверяет, что пользователь может успешно выйти из системы.
         """
-        driver.get(base_url)
-        login_page = LoginPage(driver)
+        login_page = LoginPage.navigate(driver, base_url)
         login_page.login("john", "demo")
 
-        logout_link = driver.find_element(By.XPATH, "//a[@href='logout.htm']")
+        logout_link = login_page.find_element((By.XPATH, "//a[@href='logout.htm']"))
         logout_link.click()
-        assert "Customer Login" in driver.page_source, "Logout failed: 'Customer Login' page not displayed."
+        assert login_page.is_text_present("Customer Login"), "Logout failed: 'Customer Login' page not displayed."
 
     @pytest.mark.parametrize("first_name,last_name,address,city,state,zip_code,phone,ssn,username,password,confirm_password", [
         ("", "User", "123 Main St", "City", "State", "12345",
@@ -59,8 +56,7 @@ class TestAuth:
         """
         Проверяет, что регистрация с некорректными данными не выполняется.
         """
-        driver.get(f"{base_url}/register.htm")
-        registration_page = RegistrationPage(driver)
+        registration_page = RegistrationPage.navigate(driver, base_url)
         registration_page.register(first_name, last_name, address, city, state, zip_code,
                                    phone, ssn, username, password, confirm_password)
 
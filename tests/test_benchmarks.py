@@ -0,0 +1,74 @@
+import uuid
+
+import pytest
+
+from pages.account_overview_page import AccountOverviewPage
+from pages.bill_pay_page import BillPayPage
+from pages.funds_transfer_page import FundsTransferPage
+from pages.login_page import LoginPage
+from pages.registration_page import RegistrationPage
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_benchmark_login(driver, base_url, benchmark):
+    login_page = LoginPage(driver)
+
+    def open_login_page():
+        driver.delete_all_cookies()
+        login_page.open(base_url)
+
+    def login():
+        login_page.login("john", "demo")
+        assert login_page.result() == "logged_in"
+
+    benchmark("LoginPage.login", login, setup=open_login_page)
+
+
+def test_benchmark_transfer_funds(logged_in_driver, base_url, benchmark):
+    transfer_page = FundsTransferPage(logged_in_driver)
+
+    def transfer_funds():
+        # Замер до исхода перевода: фиксированные 0.5 с тишины в сети после
+        # запроса — константа, а не время операции.
+        transfer_page.transfer_funds("10", "13344", "13455", quiet_period=0)
+        assert transfer_page.result() == "success"
+
+    benchmark("FundsTransferPage.transfer_funds", transfer_funds,
+              setup=lambda: transfer_page.open(f"{base_url}/transfer.htm"))
+
+
+def test_benchmark_pay_bill(logged_in_driver, base_url, benchmark):
+    bill_pay = BillPayPage(logged_in_driver)
+
+    def pay_bill():
+        bill_pay.pay_bill("Electric Company", "456 Electric Ave", "City", "State", "67890",
+                          "555-6789", "987654", "987654", "20", "13344")
+        assert bill_pay.result() == "success"
+
+    benchmark("BillPayPage.pay_bill", pay_bill,
+              setup=lambda: bill_pay.open(f"{base_url}/billpay.htm"))
+
+
+def test_benchmark_register(driver, base_url, benchmark):
+    registration_page = RegistrationPage(driver)
+
+    def open_registration_page():
+        driver.delete_all_cookies()
+        registration_page.open(f"{base_url}/register.htm")
+
+    def register():
+        username = f"bench{uuid.uuid4().hex[:10]}"
+        registration_page.register("Bench", "User", "1 Bench St", "City", "CA", "90210",
+                                   "555-0100", "123-45-6789", username, "demo", "demo")
+        assert registration_page.result() == "success"
+
+    benchmark("RegistrationPage.register", register, setup=open_registration_page)
+
+
+def test_benchmark_view_transaction_history(logged_in_driver, base_url, benchmark):
+    account_overview = AccountOverviewPage(logged_in_driver)
+    benchmark(
+        "AccountOverviewPage.view_transaction_history",
+        lambda: account_overview.view_transaction_history("13344"),
+        setup=lambda: account_overview.open(f"{base_url}/overview.htm"))
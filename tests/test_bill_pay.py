@@ -1,24 +1,24 @@
+import pytest
+
 from pages.bill_pay_page import BillPayPage
 from pages.login_page import LoginPage
 
+pytestmark = pytest.mark.resources("functional")
+
 
 def test_bill_pay_success(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
-    driver.get(f"{base_url}/billpay.htm")
-    bill_pay = BillPayPage(driver)
+    bill_pay = BillPayPage.navigate(driver, base_url)
     bill_pay.pay_bill("Electric Company", "456 Electric Ave", "City", "State", "67890",
                       "555-6789", "987654", "987654", "200", "13344")
     assert bill_pay.is_payment_successful(), "Bill payment was not successful."
 
 
 def test_bill_pay_invalid_payee(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
-    driver.get(f"{base_url}/billpay.htm")
-    bill_pay = BillPayPage(driver)
+    bill_pay = BillPayPage.navigate(driver, base_url)
     bill_pay.pay_bill("", "456 Electric Ave", "City", "State", "67890",
                       "555-6789", "987654", "987654", "200", "13344")
     assert bill_pay.is_payment_error_displayed(
@@ -26,11 +26,9 @@ def test_bill_pay_invalid_payee(driver, base_url):
 
 
 def test_bill_pay_negative_amount(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
-    driver.get(f"{base_url}/billpay.htm")
-    bill_pay = BillPayPage(driver)
+    bill_pay = BillPayPage.navigate(driver, base_url)
     bill_pay.pay_bill(
         payee_name="Negative Bill",
         address="456 Negative Ave",
@@ -48,11 +46,9 @@ def test_bill_pay_negative_amount(driver, base_url):
 
 
 def test_bill_pay_mismatched_verify_account(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
-    driver.get(f"{base_url}/billpay.htm")
-    bill_pay = BillPayPage(driver)
+    bill_pay = BillPayPage.navigate(driver, base_url)
     bill_pay.pay_bill(
         payee_name="Mismatch Bill",
         address="789 Mismatch Rd",
@@ -70,11 +66,9 @@ def test_bill_pay_mismatched_verify_account(driver, base_url):
 
 
 def test_bill_pay_non_numeric_amount(driver, base_url):
-    driver.get(base_url)
-    login_page = LoginPage(driver)
+    login_page = LoginPage.navigate(driver, base_url)
     login_page.login("john", "demo")
-    driver.get(f"{base_url}/billpay.htm")
-    bill_pay = BillPayPage(driver)
+    bill_pay = BillPayPage.navigate(driver, base_url)
     bill_pay.pay_bill(
         payee_name="NonNumeric Bill",
         address="101 NonNumeric Blvd",
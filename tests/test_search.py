@@ -1,6 +1,8 @@
+import pytest
 from pages.search_page import SearchPage
 from pages.login_page import LoginPage
 
+@pytest.mark.browserless
 def test_search_field_absence(driver, base_url):
     driver.get(base_url)
     search_page = SearchPage(driver)
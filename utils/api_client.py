@@ -0,0 +1,149 @@
+import threading
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import NamedTuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+CONTENT_TYPES = {"json": "application/json", "xml": "application/xml"}
+
+
+class ApiError(RuntimeError):
+    pass
+
+
+class Customer(NamedTuple):
+    id: int
+    first_name: str
+    last_name: str
+    street: str
+    city: str
+    state: str
+    zip_code: str
+    phone: str
+    ssn: str
+
+
+class Account(NamedTuple):
+    id: int
+    customer_id: int
+    type: str
+    balance: Decimal
+
+
+class Transaction(NamedTuple):
+    id: int
+    account_id: int
+    type: str
+    date: date
+    amount: Decimal
+    description: str
+
+
+def _xml_to_data(element):
+    """XML ответа ParaBank в те же словари и списки, что и JSON-ответ."""
+    children = list(element)
+    if not children:
+        return element.text or ""
+    same_tags = len({child.tag for child in children}) == 1
+    if same_tags and (len(children) > 1 or element.tag == children[0].tag + "s"):
+        return [_xml_to_data(child) for child in children]
+    return {child.tag: _xml_to_data(child) for child in children}
+
+
+def _parse_date(value):
+    # JSON ParaBank отдаёт дату в миллисекундах epoch, XML — строкой ISO.
+    if isinstance(value, (int, float)) or str(value).isdigit():
+        return datetime.fromtimestamp(int(value) / 1000, tz=timezone.utc).date()
+    return date.fromisoformat(str(value)[:10])
+
+
+def to_customer(data):
+    address = data.get("address") or {}
+    return Customer(
+        int(data["id"]), data.get("firstName", ""), data.get("lastName", ""),
+        address.get("street", ""), address.get("city", ""), address.get("state", ""),
+        address.get("zipCode", ""), data.get("phoneNumber", ""), data.get("ssn", ""))
+
+
+def to_account(data):
+    return Account(int(data["id"]), int(data["customerId"]), data["type"],
+                   Decimal(str(data["balance"])))
+
+
+def to_transaction(data):
+    return Transaction(int(data["id"]), int(data["accountId"]), data["type"],
+                       _parse_date(data["date"]), Decimal(str(data["amount"])),
+                       data.get("description", ""))
+
+
+class BankApi:
+    """
+    Клиент REST-сервиса ParaBank (services/bank) для проверок до и после
+    действия в UI: балансы, транзакции и данные клиента без загрузки страниц.
+
+    Ответы разбираются в типизированные записи (Account, Transaction, Customer)
+    с суммами в Decimal — так же, как AccountOverviewPage.snapshot. Формат
+    ответа — JSON или XML (fmt); XML — формат демо-сайта по умолчанию.
+
+    Соединения держатся открытыми в общем пуле HTTPAdapter; requests.Session
+    у каждого потока свой, поэтому клиент можно использовать из нескольких
+    потоков.
+    """
+
+    def __init__(self, base_url, fmt="json", pool_size=8):
+        if fmt not in CONTENT_TYPES:
+            raise ValueError(f"Неизвестный формат ответа: {fmt}")
+        self.base_url = base_url.rstrip("/")
+        self.fmt = fmt
+        self.pool_size = pool_size
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._local = threading.local()
+
+    @property
+    def http(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            session.headers["Accept"] = CONTENT_TYPES[self.fmt]
+        return session
+
+    def close(self):
+        self.adapter.close()
+
+    def _service(self, method, path, **params):
+        response = self.http.request(method, f"{self.base_url}/services/bank/{path}", params=params)
+        if response.status_code != 200:
+            raise ApiError(f"{method} {path}: HTTP {response.status_code} {response.text.strip()}")
+        return response
+
+    def _parse(self, response):
+        if "xml" in response.headers.get("Content-Type", ""):
+            return _xml_to_data(ET.fromstring(response.content))
+        return response.json()
+
+    def _get(self, path):
+        return self._parse(self._service("GET", path))
+
+    def login(self, username, password):
+        return to_customer(self._get(f"login/{username}/{password}"))
+
+    def customer(self, customer_id):
+        return to_customer(self._get(f"customers/{customer_id}"))
+
+    def accounts(self, customer_id):
+        return [to_account(item) for item in self._get(f"customers/{customer_id}/accounts")]
+
+    def account(self, account_id):
+        return to_account(self._get(f"accounts/{account_id}"))
+
+    def balance(self, account_id):
+        return self.account(account_id).balance
+
+    def transactions(self, account_id):
+        return [to_transaction(item) for item in self._get(f"accounts/{account_id}/transactions")]
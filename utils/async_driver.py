@@ -0,0 +1,152 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from utils import resource_blocking
+from utils.driver_pool import DriverPool, session_lost
+from utils.process_memory import driver_pid, tree_memory
+from utils.webdriver_timing import RECORDER
+
+
+MB = 1024 * 1024
+
+
+def _recorded(func, *args, **kwargs):
+    RECORDER.adopt()
+    return func(*args, **kwargs)
+
+
+class AsyncDriver:
+    """
+    Асинхронная обёртка над WebDriver: каждая команда выполняется в
+    отдельном потоке этой сессии, а корутина ждёт результата, не блокируя
+    event loop. Пока один браузер ждёт сети, цикл ведёт остальные сессии.
+
+    У каждой сессии свой однопоточный executor: команды одной сессии идут
+    строго по очереди (WebDriver не потокобезопасен), команды разных
+    сессий — параллельно. Поток сессии подключается к замерам RECORDER,
+    поэтому команды попадают в сводку текущего теста; пачка async-тестов
+    (utils/async_runner.py) выполняется внутри своего первого теста, и её
+    команды целиком приходятся на него.
+
+        await driver.get(url)
+        elements = await driver.find_elements(By.ID, "x")
+        url = await driver.run(lambda d: d.current_url)
+    """
+
+    def __init__(self, driver):
+        self.sync = driver
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webdriver")
+
+    async def call(self, func, *args, **kwargs):
+        """Выполняет func(*args, **kwargs) в потоке сессии."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(_recorded, func, *args, **kwargs))
+
+    async def run(self, func, *args, **kwargs):
+        """Выполняет func(driver, *args, **kwargs) в потоке сессии."""
+        return await self.call(func, self.sync, *args, **kwargs)
+
+    async def get(self, url):
+        return await self.call(self.sync.get, url)
+
+    async def find_element(self, by, value):
+        return await self.call(self.sync.find_element, by, value)
+
+    async def find_elements(self, by, value):
+        return await self.call(self.sync.find_elements, by, value)
+
+    async def execute_script(self, script, *args):
+        return await self.call(self.sync.execute_script, script, *args)
+
+    async def current_url(self):
+        return await self.run(lambda driver: driver.current_url)
+
+    async def title(self):
+        return await self.run(lambda driver: driver.title)
+
+    async def page_source(self):
+        return await self.run(lambda driver: driver.page_source)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+
+class AsyncDriverPool:
+    """
+    Пул браузеров для асинхронных тестов: не больше limit сессий
+    одновременно, браузеры переиспользуются через обычный DriverPool
+    (сброс cookies и storage между сессиями).
+
+    Это отдельный пул рядом с пулом фикстуры driver: до limit его браузеров
+    остаются открытыми и между пачками async-тестов, так что воркер держит
+    до --driver-pool-size + --async-concurrency Chrome одновременно.
+
+    После каждой сессии, как и после синхронного теста, забирается
+    performance-лог браузера, а браузер, чья память превысила
+    memory_threshold_mb (0 — не проверять), в пул не возвращается.
+
+        async with async_browser.session() as driver:
+            page = await AsyncLoginPage.navigate(driver, base_url)
+    """
+
+    def __init__(self, factory, limit=4, max_uses=20, prepare=None, memory_threshold_mb=0):
+        self.limit = limit
+        # Вызывается для каждого выданного браузера, например чтобы
+        # включить профиль блокировки ресурсов.
+        self.prepare = prepare
+        self.memory_threshold = memory_threshold_mb * MB
+        self.pool = DriverPool(factory, max_uses=max_uses, size=limit)
+        # Запуск, сброс и закрытие браузеров — в одном потоке: DriverPool
+        # не рассчитан на конкурентные вызовы.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver-pool")
+        self._semaphore = None
+        self._loop = None
+
+    def _slots(self):
+        # Семафор привязан к event loop, а прогоны раннера могут идти в разных циклах.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._semaphore = loop, asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def session(self):
+        """Браузер на время блока async with; упавший с ошибкой WebDriver браузер пересоздаётся."""
+        loop = asyncio.get_running_loop()
+        async with self._slots():
+            driver = AsyncDriver(await loop.run_in_executor(self._executor, self._acquire))
+            failed = False
+            try:
+                yield driver
+            except Exception as e:
+                # Таймауты и ненайденные элементы браузер не ломают.
+                failed = session_lost(e)
+                raise
+            finally:
+                driver.close()
+                await loop.run_in_executor(
+                    self._executor, functools.partial(self._release, driver.sync, failed))
+
+    def _release(self, driver, failed):
+        # Лог DevTools копится в chromedriver, пока его не заберут: без этого
+        # он растёт от сессии к сессии, как и память браузера.
+        resource_blocking.drain(driver)
+        if not failed and self.memory_threshold:
+            pid = driver_pid(driver)
+            if pid is not None and tree_memory(pid) >= self.memory_threshold:
+                self.pool.mark_broken(driver)
+        self.pool.release(driver, failed=failed)
+
+    def _acquire(self):
+        RECORDER.adopt()
+        driver = self.pool.acquire()
+        if self.prepare is not None:
+            self.prepare(driver)
+        return driver
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.pool.close()
@@ -0,0 +1,105 @@
+import asyncio
+import inspect
+
+import pytest
+
+
+# Режимы xdist, при которых все тесты модуля попадают на один воркер:
+# только тогда воркер может запустить их пачкой, не дублируя чужие.
+MODULE_DISTRIBUTIONS = ("no", "loadfile", "loadscope")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--async-concurrency", type=int, default=4,
+        help="Сколько async-тестов и браузеров одновременно ведёт один event loop")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(AsyncRunner(config), "async-runner")
+
+
+class AsyncRunner:
+    """
+    Запускает тесты-корутины (async def test_...) в event loop.
+
+    Когда очередь доходит до первого async-теста модуля, раннер запускает
+    все async-тесты этого модуля одновременно, но не больше
+    --async-concurrency за раз; результаты остальных тестов сохраняются и
+    отдаются, когда pytest дойдёт до них. Поэтому время пачки целиком
+    приходится на её первый тест.
+
+    В пачку попадают тесты, которым нужны только параметры и
+    session-фикстуры (base_url, async_browser и т. п.) — их значения общие
+    для всех тестов. Тесты с function-фикстурами, маркерами skip/skipif
+    или под xdist с распределением load выполняются по одному.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.limit = config.getoption("--async-concurrency")
+        self.outcomes = {}
+        self.started = set()
+
+    def can_batch(self):
+        return getattr(self.config.option, "dist", "no") in MODULE_DISTRIBUTIONS
+
+    @staticmethod
+    def batchable(item):
+        if not isinstance(item, pytest.Function) or not inspect.iscoroutinefunction(item.obj):
+            return False
+        if item.get_closest_marker("skip") or item.get_closest_marker("skipif"):
+            return False
+        params = getattr(item, "callspec", None)
+        params = params.params if params is not None else {}
+        for name in item._fixtureinfo.argnames:
+            if name in params:
+                continue
+            fixturedefs = item._fixtureinfo.name2fixturedefs.get(name)
+            if not fixturedefs or fixturedefs[-1].scope != "session":
+                return False
+        return True
+
+    def batch_for(self, item):
+        if not self.can_batch() or not self.batchable(item):
+            return [item]
+        return [other for other in item.session.items
+                if other.module is item.module and other.nodeid not in self.started
+                and self.batchable(other)]
+
+    @staticmethod
+    def arguments(item, current):
+        """Аргументы теста: у текущего — его funcargs, у остальных — параметры и session-фикстуры."""
+        if item is current:
+            return {name: current.funcargs[name] for name in current._fixtureinfo.argnames}
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        return {name: params[name] if name in params else current._request.getfixturevalue(name)
+                for name in item._fixtureinfo.argnames}
+
+    async def run_batch(self, current, batch):
+        semaphore = asyncio.Semaphore(self.limit)
+
+        async def run(item):
+            self.started.add(item.nodeid)
+            async with semaphore:
+                try:
+                    await item.obj(**self.arguments(item, current))
+                    self.outcomes[item.nodeid] = None
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except BaseException as e:
+                    # В том числе pytest.fail/skip/xfail: они наследуют BaseException.
+                    self.outcomes[item.nodeid] = e
+
+        await asyncio.gather(*(run(item) for item in batch))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        if not inspect.iscoroutinefunction(pyfuncitem.obj):
+            return None
+        if pyfuncitem.nodeid not in self.outcomes:
+            asyncio.run(self.run_batch(pyfuncitem, self.batch_for(pyfuncitem)))
+        error = self.outcomes.pop(pyfuncitem.nodeid)
+        if error is not None:
+            raise error
+        return True
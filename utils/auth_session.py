@@ -0,0 +1,98 @@
+import requests
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+
+
+SESSION_COOKIE = "JSESSIONID"
+LOGOUT_LINK = (By.XPATH, "//a[@href='logout.htm']")
+# Форма входа: её показывает overview.htm, если сессия не принята.
+LOGIN_FORM = (By.NAME, "username")
+
+
+class AuthError(RuntimeError):
+    pass
+
+
+class AuthSession:
+    """
+    Авторизованная сессия ParaBank, полученная по HTTP без браузера.
+
+    Логин выполняется один раз (на сессию pytest или xdist-воркер), cookie
+    JSESSIONID кэшируется и подставляется в браузер. Если сервер сессию
+    уже аннулировал (например, тест нажал Log Out), cookie обновляется
+    повторным HTTP-логином.
+    """
+
+    def __init__(self, base_url, username, password, http=None):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.http = http or requests.Session()
+        self._cookie = None
+        self.logins = 0
+
+    def cookie(self, refresh=False):
+        """Возвращает значение JSESSIONID, при необходимости выполняя логин."""
+        if self._cookie is None or refresh:
+            self._cookie = self._login()
+        return self._cookie
+
+    def login(self, driver, timeout=10):
+        """
+        Подставляет cookie в браузер и открывает overview.htm. Если страница
+        показывает форму входа, cookie обновляется и подставляется ещё раз.
+        """
+        for refresh in (False, True):
+            self._inject(driver, self.cookie(refresh=refresh))
+            driver.get(f"{self.base_url}/overview.htm")
+            if self._logged_in(driver, timeout):
+                return driver
+        raise AuthError(f"Не удалось авторизовать браузер как {self.username}")
+
+    @staticmethod
+    def _logged_in(driver, timeout):
+        """
+        Ждёт, пока страница покажет ссылку "Log Out" или форму входа: со
+        стратегией загрузки eager или none сразу после get в DOM может не
+        быть ни того, ни другого.
+        """
+        def outcome(driver):
+            if driver.find_elements(*LOGOUT_LINK):
+                return "logged_in"
+            if driver.find_elements(*LOGIN_FORM):
+                return "login_form"
+            return False
+
+        try:
+            return WebDriverWait(driver, timeout).until(outcome) == "logged_in"
+        except TimeoutException:
+            return False
+
+    def _login(self):
+        self.http.cookies.clear()
+        response = self.http.post(
+            f"{self.base_url}/login.htm",
+            data={"username": self.username, "password": self.password},
+        )
+        response.raise_for_status()
+        cookie = self.http.cookies.get(SESSION_COOKIE)
+        if cookie is None or "logout.htm" not in response.text:
+            raise AuthError(f"HTTP-логин пользователя {self.username} не удался")
+        self.logins += 1
+        return cookie
+
+    def _inject(self, driver, value):
+        path = "/" + self.base_url.split("://", 1)[1].partition("/")[2]
+        try:
+            # Через CDP cookie ставится без предварительного открытия страницы.
+            driver.execute_cdp_cmd("Network.setCookie", {
+                "name": SESSION_COOKIE,
+                "value": value,
+                "url": self.base_url,
+                "path": path,
+            })
+        except (AttributeError, WebDriverException):
+            # WebDriver разрешает add_cookie только для домена открытой страницы.
+            driver.get(f"{self.base_url}/about.htm")
+            driver.add_cookie({"name": SESSION_COOKIE, "value": value, "path": path})
@@ -0,0 +1,177 @@
+import json
+import math
+import time
+from pathlib import Path
+
+import pytest
+
+
+DEFAULT_BASELINE = "benchmark-baseline.json"
+PERCENTILES = (50, 95, 99)
+# Какие перцентили сравниваются с базовой линией: p99 на двух десятках
+# прогонов слишком шумный, чтобы ронять по нему тест.
+COMPARED = ("p50", "p95")
+# Разница меньше этой величины не считается регрессией даже в процентах.
+ABSOLUTE_SLACK = 0.005
+WARMUP_ROUNDS = 1
+USER_PROPERTY = "benchmark"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark", "Бенчмарки page objects")
+    group.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="Запустить только бенчмарки (маркер benchmark) на локальном стенде")
+    group.addoption(
+        "--benchmark-rounds", type=int, default=20,
+        help="Сколько раз повторять каждую операцию")
+    group.addoption(
+        "--benchmark-baseline", default=DEFAULT_BASELINE,
+        help="Файл базовой линии (относительно rootdir)")
+    group.addoption(
+        "--benchmark-save", action="store_true", default=False,
+        help="Записать результаты в базовую линию вместо сравнения с ней")
+    group.addoption(
+        "--benchmark-tolerance", type=float, default=0.25,
+        help="Допустимое замедление p50/p95 относительно базовой линии (0.25 — на 25%%)")
+
+
+def percentile(samples, p):
+    """Перцентиль методом ближайшего ранга."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+def summarize(samples):
+    stats = {f"p{p}": percentile(samples, p) for p in PERCENTILES}
+    stats["rounds"] = len(samples)
+    return stats
+
+
+def baseline_key(config):
+    """Базовая линия своя для каждой задержки стенда: с 50 мс и без неё цифры несравнимы."""
+    return f"latency={config.getoption('--local-latency'):g}ms"
+
+
+def compare(flow, stats, baseline, tolerance):
+    """Возвращает строки с регрессиями flow относительно baseline (пустой список — их нет)."""
+    regressions = []
+    for metric in COMPARED:
+        before, after = baseline[metric], stats[metric]
+        if after > before * (1 + tolerance) and after - before > ABSOLUTE_SLACK:
+            regressions.append(
+                f"{flow} {metric}: {before * 1000:.1f} мс -> {after * 1000:.1f} мс "
+                f"(+{(after / before - 1) * 100:.0f}%, допустимо +{tolerance * 100:.0f}%)")
+    return regressions
+
+
+def _baseline_path(config):
+    return Path(str(config.rootpath)) / config.getoption("--benchmark-baseline")
+
+
+def _load_baseline(config):
+    try:
+        return json.loads(_baseline_path(config).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: повторяемый замер операции page object, запускается с --benchmark")
+    config.pluginmanager.register(BenchmarkCollector(config), "benchmark-collector")
+
+
+def pytest_collection_modifyitems(config, items):
+    benchmark_mode = config.getoption("--benchmark")
+    selected, deselected = [], []
+    for item in items:
+        is_benchmark = item.get_closest_marker("benchmark") is not None
+        (selected if is_benchmark == benchmark_mode else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+class Benchmark:
+    """
+    Прогоняет операцию заданное число раз и сравнивает перцентили с базовой
+    линией. Время setup в замер не входит; первый прогон — прогрев.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.config = request.config
+
+    def __call__(self, flow, operation, setup=None):
+        rounds = self.config.getoption("--benchmark-rounds")
+        samples = []
+        for round_number in range(WARMUP_ROUNDS + rounds):
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            operation()
+            elapsed = time.perf_counter() - started
+            if round_number >= WARMUP_ROUNDS:
+                samples.append(elapsed)
+        stats = summarize(samples)
+        self.request.node.user_properties.append((USER_PROPERTY, {flow: stats}))
+        if self.config.getoption("--benchmark-save"):
+            return stats
+        baseline = _load_baseline(self.config).get(baseline_key(self.config), {}).get(flow)
+        if baseline is not None:
+            regressions = compare(flow, stats, baseline, self.config.getoption("--benchmark-tolerance"))
+            assert not regressions, "Замедление относительно базовой линии:\n" + "\n".join(regressions)
+        return stats
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    Замер операции page object:
+        benchmark("login", lambda: page.login("john", "demo"), setup=open_login_page)
+    """
+    return Benchmark(request)
+
+
+class BenchmarkCollector:
+    """Собирает результаты бенчмарков (в том числе с xdist-воркеров) и пишет базовую линию."""
+
+    def __init__(self, config):
+        self.config = config
+        self.results = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call" or hasattr(self.config, "workerinput"):
+            return
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY:
+                self.results.update(value)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        baseline = _load_baseline(self.config).get(baseline_key(self.config), {})
+        terminalreporter.section(f"benchmark ({baseline_key(self.config)})")
+        for flow, stats in sorted(self.results.items()):
+            line = "{:<28} p50 {:8.1f} мс  p95 {:8.1f} мс  p99 {:8.1f} мс".format(
+                flow, stats["p50"] * 1000, stats["p95"] * 1000, stats["p99"] * 1000)
+            if flow in baseline:
+                line += "  (база p50 {:.1f} мс)".format(baseline[flow]["p50"] * 1000)
+            terminalreporter.write_line(line)
+        missing = sorted(set(self.results) - set(baseline))
+        if missing and not self.config.getoption("--benchmark-save"):
+            # Без базовой линии сравнение молча не выполняется — об этом нужно сказать.
+            terminalreporter.write_line(
+                "Нет базовой линии в {} для {}: регрессии не проверялись. "
+                "Запишите её: pytest --benchmark --benchmark-save".format(
+                    _baseline_path(self.config).name, ", ".join(missing)),
+                yellow=True, bold=True)
+
+    def pytest_sessionfinish(self):
+        if not self.results or not self.config.getoption("--benchmark-save") \
+                or hasattr(self.config, "workerinput"):
+            return
+        baselines = _load_baseline(self.config)
+        baselines.setdefault(baseline_key(self.config), {}).update(self.results)
+        _baseline_path(self.config).write_text(json.dumps(baselines, indent=1, sort_keys=True))
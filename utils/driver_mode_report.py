@@ -0,0 +1,129 @@
+"""
+Сравнение режимов драйвера на локальном стенде: сколько тестов в минуту
+проходит один воркер и сколько памяти занимает его дерево процессов Chrome.
+
+    python -m utils.driver_mode_report
+    python -m utils.driver_mode_report --tests 50 --modes process,context --json modes.json
+
+Режимы: process — новый Chrome на каждый тест (--driver-max-uses=1),
+pool — пул со сбросом браузера между тестами, context — один Chrome и
+browser context на тест (--driver-mode=context). Каждый «тест» — вход
+через LoginPage и ожидание обзора счетов; LoginPage.navigate сработает,
+только если cookies предыдущего теста не унаследованы.
+"""
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from utils.process_memory import MemorySampler
+
+
+ROOT = Path(__file__).resolve().parent.parent
+MODES = ("process", "pool", "context")
+MB = 1024 * 1024
+
+
+def make_pool(mode, factory, tests):
+    from utils.driver_pool import ContextPool, DriverPool
+
+    if mode == "process":
+        return DriverPool(factory, max_uses=1)
+    if mode == "pool":
+        return DriverPool(factory, max_uses=tests + 1)
+    return ContextPool(factory)
+
+
+def run_test(driver, base_url):
+    from pages.account_overview_page import AccountOverviewPage
+    from pages.login_page import LoginPage
+
+    login_page = LoginPage.navigate(driver, base_url)
+    login_page.login("john", "demo")
+    assert AccountOverviewPage(driver).is_account_overview_displayed(), "Вход не выполнен"
+
+
+def measure_mode(mode, factory, base_url, tests):
+    pool = make_pool(mode, factory, tests)
+    # Память считается по потомкам процесса: chromedriver и всё, что он запустил.
+    with MemorySampler(os.getpid(), include_root=False) as sampler:
+        started = time.perf_counter()
+        try:
+            for _ in range(tests):
+                driver = pool.acquire()
+                failed = True
+                try:
+                    run_test(driver, base_url)
+                    failed = False
+                finally:
+                    pool.release(driver, failed=failed)
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.close()
+    peak_mb = sampler.peak / MB
+    tests_per_minute = tests / elapsed * 60
+    return {
+        "tests": tests,
+        "seconds": elapsed,
+        "tests_per_minute": tests_per_minute,
+        "peak_mb": peak_mb,
+        # Сколько таких воркеров помещается в 1 ГБ и сколько тестов в минуту
+        # они вместе проходят.
+        "workers_per_gb": 1024 / peak_mb if peak_mb else None,
+        "tests_per_minute_per_gb": tests_per_minute * 1024 / peak_mb if peak_mb else None,
+        "browsers_started": pool.started,
+    }
+
+
+def benchmark(modes, tests, latency, page_load_strategy):
+    from conftest import create_driver
+    from utils.driver_resolver import resolve_shared
+    from utils.local_server import LocalParaBank
+
+    resolution = resolve_shared(ROOT / ".pytest_cache" / "d" / "chromedriver", allow_download=True)
+
+    def factory():
+        return create_driver(resolution.driver_path, page_load_strategy, resolution.chrome_binary)
+
+    results = {}
+    with LocalParaBank(latency=latency) as server:
+        for mode in modes:
+            results[mode] = measure_mode(mode, factory, server.base_url, tests)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tests", type=int, default=20, help="Тестов на каждый режим")
+    parser.add_argument("--modes", default=",".join(MODES), help="Режимы через запятую")
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка стенда, мс")
+    parser.add_argument("--page-load-strategy", default="eager", choices=("normal", "eager", "none"))
+    parser.add_argument("--json", help="Записать отчёт в JSON-файл")
+    args = parser.parse_args()
+
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        parser.error(f"Неизвестные режимы: {', '.join(sorted(unknown))}")
+    results = benchmark(modes, args.tests, args.latency / 1000, args.page_load_strategy)
+
+    print(f"{'режим':<10} {'тестов/мин':>11} {'пик, МБ':>9} {'воркеров/ГБ':>12} "
+          f"{'тестов/мин на ГБ':>17} {'запусков Chrome':>16}")
+    for mode, row in results.items():
+        print(f"{mode:<10} {row['tests_per_minute']:>11.1f} {row['peak_mb']:>9.0f} "
+              f"{row['workers_per_gb'] or 0:>12.2f} {row['tests_per_minute_per_gb'] or 0:>17.1f} "
+              f"{row['browsers_started']:>16}")
+    if "process" in results:
+        base = results["process"]
+        for mode, row in results.items():
+            if mode != "process" and base["tests_per_minute_per_gb"] and row["tests_per_minute_per_gb"]:
+                print(f"{mode}: в {row['tests_per_minute'] / base['tests_per_minute']:.1f} раза быстрее, "
+                      f"в {row['tests_per_minute_per_gb'] / base['tests_per_minute_per_gb']:.1f} раза "
+                      f"больше тестов/мин на ГБ, чем process")
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=1, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
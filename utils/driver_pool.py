@@ -0,0 +1,277 @@
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
+from selenium.webdriver.support.wait import WebDriverWait
+from urllib3.exceptions import HTTPError
+
+from utils import network_idle, webdriver_timing
+
+
+# Очищает localStorage/sessionStorage текущего origin. На about:blank и
+# страницах с opaque origin обращение к хранилищу бросает SecurityError,
+# поэтому ошибки глушатся внутри скрипта.
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+# Фрагменты сообщений WebDriver, по которым видно, что браузер или сессия
+# потеряны. Остальные ошибки (TimeoutException, NoSuchElementException,
+# StaleElementReferenceException и т. п.) — обычные провалы теста.
+SESSION_LOST_MESSAGES = (
+    "chrome not reachable", "disconnected", "session deleted", "no such session",
+    "browser has closed", "tab crashed",
+)
+
+
+def session_lost(error):
+    """Означает ли исключение, что сессия WebDriver или связь с браузером потеряны."""
+    if isinstance(error, (InvalidSessionIdException, ConnectionError, HTTPError)):
+        return True
+    if isinstance(error, WebDriverException):
+        message = (error.msg or "").lower()
+        return any(fragment in message for fragment in SESSION_LOST_MESSAGES)
+    return False
+
+
+def is_alive(driver):
+    """Проверяет, что сессия отвечает на команды."""
+    try:
+        driver.current_window_handle
+        return True
+    except (WebDriverException, ConnectionError, HTTPError):
+        return False
+
+
+def visited_origins(driver):
+    """Origin (http/https) из истории навигации текущего окна; без CDP — пустое множество."""
+    try:
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+    except (AttributeError, WebDriverException):
+        return set()
+    origins = set()
+    for entry in history.get("entries", ()):
+        parts = urlsplit(entry.get("url", ""))
+        if parts.scheme in ("http", "https") and parts.netloc:
+            origins.add(f"{parts.scheme}://{parts.netloc}")
+    return origins
+
+
+class PooledDriver:
+    """
+    Обёртка над живым экземпляром WebDriver внутри пула: хранит счётчик
+    выданных тестов и признак того, что браузер нужно пересоздать.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.broken = False
+
+
+class DriverPool:
+    """
+    Пул браузеров для одного процесса pytest (одного xdist-воркера).
+
+    Вместо запуска нового Chrome на каждый тест пул выдаёт уже запущенный
+    браузер и после теста приводит его в исходное состояние: закрывает
+    лишние окна, чистит cookies и storage и открывает about:blank.
+    Браузер пересоздаётся, если он отработал max_uses тестов или если
+    сброс/проверка сессии завершились ошибкой WebDriver (краш браузера).
+    """
+
+    def __init__(self, factory, max_uses=20, size=1):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.size = size
+        self._idle = []
+        self._busy = {}
+        self.started = 0
+        self.recycled = 0
+
+    def acquire(self):
+        """Возвращает живой WebDriver, при необходимости запуская новый браузер."""
+        while self._idle:
+            pooled = self._idle.pop()
+            if self._is_alive(pooled):
+                break
+            self._discard(pooled)
+        else:
+            pooled = PooledDriver(self.factory())
+            self.started += 1
+        pooled.uses += 1
+        self._busy[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver, failed=False):
+        """
+        Возвращает браузер в пул. Если браузер упал, исчерпал лимит
+        использований или не сбрасывается, он закрывается.
+        """
+        pooled = self._busy.pop(id(driver), None)
+        if pooled is None:
+            return
+        pooled.broken = pooled.broken or failed
+        if pooled.broken or pooled.uses >= self.max_uses or len(self._idle) >= self.size:
+            self._discard(pooled)
+            return
+        try:
+            self.reset(pooled.driver)
+        except (WebDriverException, ConnectionError, HTTPError):
+            self._discard(pooled)
+            return
+        self._idle.append(pooled)
+
+    def mark_broken(self, driver):
+        """Помечает выданный браузер как неисправный: при release он будет закрыт."""
+        pooled = self._busy.get(id(driver))
+        if pooled is not None:
+            pooled.broken = True
+
+    def reset(self, driver):
+        """
+        Приводит браузер к состоянию «как после запуска»: одно окно, открыта
+        about:blank, удалены cookies всех доменов и HTTP-кэш. Данные сайтов
+        (localStorage, IndexedDB, Cache Storage, service workers) удаляются
+        для всех origin из истории навигации окон, sessionStorage — для
+        origin открытой страницы. Без CDP очищаются только cookies и
+        storage открытой страницы.
+        """
+        handles = driver.window_handles
+        main_handle = handles[0]
+        origins = set()
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            origins |= visited_origins(driver)
+            if handle != main_handle:
+                driver.close()
+        driver.switch_to.window(main_handle)
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        try:
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            # Chrome умеет чистить cookies всех доменов одной командой,
+            # delete_all_cookies удаляет только cookies текущего домена.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def close(self):
+        """Закрывает все браузеры пула, в том числе не возвращённые."""
+        for pooled in self._idle + list(self._busy.values()):
+            self._quit(pooled.driver)
+        self._idle = []
+        self._busy = {}
+
+    def _is_alive(self, pooled):
+        return is_alive(pooled.driver)
+
+    def _discard(self, pooled):
+        self.recycled += 1
+        self._quit(pooled.driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except (WebDriverException, ConnectionError, HTTPError):
+            pass
+
+
+class ContextPool:
+    """
+    Один долгоживущий Chrome на процесс pytest и отдельный browser context
+    (Target.createBrowserContext) на каждый тест.
+
+    Контекст изолирован как новый профиль: свои cookies, storage, кэш и
+    вкладки. После теста контекст удаляется целиком вместе с рендерерами,
+    поэтому состояние не переходит к следующему тесту, а браузер не
+    нужно ни сбрасывать, ни перезапускать. Chrome пересоздаётся, только
+    если тест его уронил или создать контекст не удалось.
+
+    Интерфейс тот же, что у DriverPool: acquire, release, mark_broken, close.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.driver = None
+        self.started = 0
+        self.recycled = 0
+        self.contexts = 0
+        self._home = None
+        self._context = None
+        self._broken = False
+
+    def acquire(self):
+        """Возвращает драйвер, переключённый на вкладку нового контекста."""
+        if self.driver is not None and not self._is_alive():
+            self._discard()
+        if self.driver is None:
+            self.driver = self.factory()
+            self.started += 1
+            self._home = self.driver.current_window_handle
+        try:
+            self._open_context()
+        except WebDriverException:
+            # Браузер в неизвестном состоянии: второй попытки заслуживает
+            # только свежий Chrome.
+            self._discard()
+            self.driver = self.factory()
+            self.started += 1
+            self._home = self.driver.current_window_handle
+            self._open_context()
+        self._broken = False
+        self.contexts += 1
+        return self.driver
+
+    def release(self, driver, failed=False):
+        """Удаляет контекст теста; упавший браузер закрывается."""
+        if driver is not self.driver:
+            return
+        context, self._context = self._context, None
+        if failed or self._broken:
+            self._discard()
+            return
+        try:
+            self.driver.switch_to.window(self._home)
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context})
+        except (WebDriverException, ConnectionError, HTTPError):
+            self._discard()
+
+    def mark_broken(self, driver):
+        if driver is self.driver:
+            self._broken = True
+
+    def close(self):
+        if self.driver is not None:
+            DriverPool._quit(self.driver)
+            self.driver = None
+
+    def _open_context(self):
+        driver = self.driver
+        with webdriver_timing.measure("startup", "newContext"):
+            # disposeOnDetach: если chromedriver завершится, Chrome сам
+            # удалит контекст.
+            self._context = driver.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": True})["browserContextId"]
+            target = driver.execute_cdp_cmd("Target.createTarget", {
+                "url": "about:blank", "browserContextId": self._context})["targetId"]
+            # Дескриптор окна chromedriver построен из targetId; новая
+            # вкладка появляется в window_handles не сразу.
+            handle = WebDriverWait(driver, 5).until(lambda driver: next(
+                (handle for handle in driver.window_handles if handle.endswith(target)), False))
+            driver.switch_to.window(handle)
+        # Скрипты addScriptToEvaluateOnNewDocument действуют на одну вкладку.
+        network_idle.install(driver)
+
+    def _is_alive(self):
+        return is_alive(self.driver)
+
+    def _discard(self):
+        self.recycled += 1
+        DriverPool._quit(self.driver)
+        self.driver = None
+        self._context = None
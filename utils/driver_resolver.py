@@ -0,0 +1,249 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+
+CHROME_BINARIES = (
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+)
+DRIVER_NAMES = ("chromedriver", "chromedriver.exe")
+# Каталог, в который webdriver-manager складывает скачанные драйверы.
+WDM_CACHE_DIR = Path.home() / ".wdm" / "drivers" / "chromedriver"
+VERSION_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+
+class DriverResolutionError(RuntimeError):
+    pass
+
+
+class DriverResolution:
+    """Результат поиска chromedriver и время, которое на него ушло."""
+
+    def __init__(self, driver_path, driver_version, chrome_binary, chrome_version, source, seconds=0.0):
+        self.driver_path = driver_path
+        self.driver_version = driver_version
+        self.chrome_binary = chrome_binary
+        self.chrome_version = chrome_version
+        self.source = source
+        self.seconds = seconds
+
+    def to_dict(self):
+        return {
+            "driver_path": self.driver_path,
+            "driver_version": self.driver_version,
+            "chrome_binary": self.chrome_binary,
+            "chrome_version": self.chrome_version,
+            "chrome_mtime": _mtime(self.chrome_binary),
+        }
+
+    def describe(self):
+        return (f"chromedriver {self.driver_version} для Chrome {self.chrome_version} "
+                f"({self.source}): {self.driver_path}, найден за {self.seconds:.3f}s")
+
+
+def parse_version(text):
+    match = VERSION_RE.search(text or "")
+    return tuple(int(part) for part in match.groups()) if match else None
+
+
+def format_version(version):
+    return ".".join(str(part) for part in version) if version else "unknown"
+
+
+def find_chrome_binary():
+    """Ищет бинарник Chrome: сначала CHROME_BINARY, затем известные имена в PATH."""
+    explicit = os.environ.get("CHROME_BINARY")
+    if explicit:
+        return explicit
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    raise DriverResolutionError(
+        "Chrome не найден: укажите путь в переменной окружения CHROME_BINARY")
+
+
+def binary_version(path):
+    """Возвращает версию из вывода `<path> --version` или None."""
+    try:
+        output = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return parse_version(output)
+
+
+def iter_cached_drivers(cache_dirs):
+    """
+    Перечисляет chromedriver в локальных каталогах кэша. Версия берётся из
+    пути (.../<версия>/chromedriver-linux64/chromedriver, как раскладывает
+    webdriver-manager), чтобы не запускать каждый найденный бинарник.
+    """
+    for cache_dir in cache_dirs:
+        cache_dir = Path(cache_dir)
+        if not cache_dir.is_dir():
+            continue
+        for name in DRIVER_NAMES:
+            for path in cache_dir.rglob(name):
+                if path.is_file() and os.access(path, os.X_OK):
+                    yield str(path), parse_version(str(path.relative_to(cache_dir)))
+
+
+def match_driver(chrome_version, candidates):
+    """
+    Выбирает драйвер под версию Chrome: точное совпадение, иначе самый
+    свежий драйвер той же major-версии.
+    """
+    best = None
+    for path, version in candidates:
+        if version is None:
+            version = binary_version(path)
+        if version is None or version[0] != chrome_version[0]:
+            continue
+        if version == chrome_version:
+            return path, version
+        if best is None or version > best[1]:
+            best = (path, version)
+    return best
+
+
+def default_cache_dirs():
+    dirs = []
+    if os.environ.get("CHROMEDRIVER_CACHE_DIR"):
+        dirs.append(os.environ["CHROMEDRIVER_CACHE_DIR"])
+    dirs.append(str(WDM_CACHE_DIR))
+    return dirs
+
+
+def resolve_local(cache_dirs=None):
+    """
+    Подбирает chromedriver без обращения к сети: CHROMEDRIVER_PATH,
+    chromedriver из PATH (так его ставит CI), затем локальный кэш.
+    """
+    chrome_binary = find_chrome_binary()
+    chrome_version = binary_version(chrome_binary)
+    if chrome_version is None:
+        raise DriverResolutionError(f"Не удалось определить версию Chrome: {chrome_binary}")
+
+    candidates = []
+    if os.environ.get("CHROMEDRIVER_PATH"):
+        candidates.append((os.environ["CHROMEDRIVER_PATH"], None))
+    on_path = shutil.which("chromedriver")
+    if on_path:
+        candidates.append((on_path, None))
+    candidates.extend(iter_cached_drivers(cache_dirs or default_cache_dirs()))
+
+    found = match_driver(chrome_version, candidates)
+    if found is None:
+        raise DriverResolutionError(
+            f"В локальном кэше нет chromedriver для Chrome {format_version(chrome_version)}")
+    return DriverResolution(
+        found[0], format_version(found[1]), chrome_binary, format_version(chrome_version), "local")
+
+
+def resolve_download():
+    """Запасной путь: скачивание через webdriver-manager (нужна сеть)."""
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    # На macOS и Windows Chrome обычно не лежит в PATH: webdriver-manager
+    # находит его сам, а у нас бинарник и версия остаются неизвестными.
+    try:
+        chrome_binary = find_chrome_binary()
+    except DriverResolutionError:
+        chrome_binary = None
+    return DriverResolution(
+        path, format_version(binary_version(path)), chrome_binary,
+        format_version(binary_version(chrome_binary) if chrome_binary else None), "download")
+
+
+@contextmanager
+def file_lock(path, timeout=60, poll=0.05):
+    """
+    Межпроцессная блокировка на основе эксклюзивного создания файла.
+    Блокировку, которую держат дольше timeout (упавший воркер), снимаем.
+    В файле записан pid владельца: при выходе удаляем только свою
+    блокировку, а не ту, что после снятия нашей создал другой воркер.
+    """
+    owner = str(os.getpid())
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(fd, owner.encode())
+            os.close(fd)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                deadline = time.monotonic() + timeout
+            time.sleep(poll)
+    try:
+        yield
+    finally:
+        try:
+            with open(path) as lock:
+                still_owned = lock.read() == owner
+            if still_owned:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def resolve_shared(state_dir, allow_download=True):
+    """
+    Возвращает chromedriver, общий для всех xdist-воркеров.
+
+    Результат хранится в state_dir/chromedriver.json и переиспользуется,
+    пока существует драйвер и не менялся бинарник Chrome. Первый воркер
+    под блокировкой выполняет поиск, остальные читают готовый файл.
+    """
+    started = time.perf_counter()
+    state_dir = Path(state_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+    state_file = state_dir / "chromedriver.json"
+
+    with file_lock(str(state_dir / "chromedriver.lock")):
+        resolution = _load_state(state_file)
+        if resolution is None:
+            try:
+                resolution = resolve_local()
+            except DriverResolutionError:
+                if not allow_download:
+                    raise
+                resolution = resolve_download()
+            state_file.write_text(json.dumps(resolution.to_dict(), indent=2))
+
+    resolution.seconds = time.perf_counter() - started
+    return resolution
+
+
+def _load_state(state_file):
+    try:
+        state = json.loads(state_file.read_text())
+        if not os.path.isfile(state["driver_path"]):
+            return None
+        if _mtime(state["chrome_binary"]) != state["chrome_mtime"]:
+            return None
+        return DriverResolution(
+            state["driver_path"], state["driver_version"], state["chrome_binary"],
+            state["chrome_version"], "shared")
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _mtime(path):
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
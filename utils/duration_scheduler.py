@@ -0,0 +1,164 @@
+import heapq
+import json
+import statistics
+from pathlib import Path
+
+import pytest
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:
+    LoadScheduling = None
+
+
+DEFAULT_HISTORY = ".pytest-durations.json"
+# Оценка для теста, о котором ничего не известно ни по нему, ни по его модулю.
+DEFAULT_ESTIMATE = 1.0
+# Вес нового замера в скользящем среднем истории.
+SMOOTHING = 0.5
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration-schedule", "Планирование тестов по длительности")
+    group.addoption(
+        "--durations-file", default=DEFAULT_HISTORY,
+        help="Файл с историей длительностей тестов (относительно rootdir)")
+    group.addoption(
+        "--no-duration-schedule", action="store_true", default=False,
+        help="Не переупорядочивать тесты по истории длительностей под pytest-xdist")
+
+
+class DurationHistory:
+    """История длительностей тестов: {nodeid: секунды} в JSON-файле."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        try:
+            self.durations = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def estimate(self, nodeid):
+        """
+        Длительность теста из истории. Для нового теста — медиана тестов того же
+        модуля, затем медиана всех известных тестов, затем DEFAULT_ESTIMATE.
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        module = nodeid.split("::", 1)[0]
+        same_module = [d for n, d in self.durations.items() if n.split("::", 1)[0] == module]
+        if same_module:
+            return statistics.median(same_module)
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return DEFAULT_ESTIMATE
+
+    def update(self, measured):
+        for nodeid, duration in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = duration if previous is None else (
+                SMOOTHING * duration + (1 - SMOOTHING) * previous)
+
+    def save(self):
+        self.path.write_text(json.dumps(self.durations, indent=1, sort_keys=True))
+
+
+def lpt_makespan(durations, workers):
+    """Время работы самого загруженного воркера при раздаче «самый длинный — первым»."""
+    loads = [0.0] * max(workers, 1)
+    for duration in sorted(durations, reverse=True):
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+if LoadScheduling is not None:
+    class DurationScheduling(LoadScheduling):
+        """
+        LoadScheduling, раздающий тесты по одному: воркеры сами собирают
+        коллекцию в порядке убывания длительности, а планировщик выдаёт
+        каждому следующий тест из головы очереди, как только тот освободился.
+        """
+
+        def schedule(self):
+            assert self.collection_is_completed
+            if self.collection is not None:
+                return super().schedule()
+            if not self._check_nodes_have_same_collection():
+                self.log("**Different tests collected, aborting run**")
+                return
+            self.collection = list(self.node2collection.values())[0]
+            self.pending[:] = range(len(self.collection))
+            if not self.collection:
+                return
+            self.maxschedchunk = 1
+            # По два теста в очередь каждому воркеру, по кругу: самые длинные
+            # тесты расходятся по разным воркерам, а не попадают в одну пачку.
+            for _ in range(2):
+                for node in self.nodes:
+                    self._send_tests(node, 1)
+            if not self.pending:
+                for node in self.nodes:
+                    node.shutdown()
+
+
+def _enabled(config):
+    return not config.getoption("--no-duration-schedule")
+
+
+def pytest_configure(config):
+    history = DurationHistory(Path(str(config.rootpath)) / config.getoption("--durations-file"))
+    config.pluginmanager.register(DurationRecorder(config, history), "duration-recorder")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if LoadScheduling is not None and _enabled(config) and config.getoption("dist") == "load":
+        return DurationScheduling(config, log)
+    return None
+
+
+class DurationRecorder:
+    """
+    Сортирует коллекцию на xdist-воркерах по убыванию ожидаемой длительности,
+    а на контроллере (или в одиночном процессе) замеряет тесты, сравнивает
+    ожидаемый makespan с фактическим и дописывает историю.
+    """
+
+    def __init__(self, config, history):
+        self.config = config
+        self.history = history
+        self.is_worker = hasattr(config, "workerinput")
+        self.measured = {}
+        self.per_worker = {}
+
+    def pytest_collection_modifyitems(self, items):
+        # Сортируем только на воркерах: в одном процессе порядок не влияет на
+        # общее время, а исходный порядок лучше переиспользует фикстуры.
+        if not self.is_worker or not _enabled(self.config):
+            return
+        order = {item.nodeid: index for index, item in enumerate(items)}
+        items.sort(key=lambda item: (-self.history.estimate(item.nodeid), order[item.nodeid]))
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_worker:
+            return
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        self.per_worker[worker] = self.per_worker.get(worker, 0.0) + report.duration
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.is_worker or not self.measured:
+            return
+        workers = len(self.per_worker)
+        expected = lpt_makespan([self.history.estimate(n) for n in self.measured], workers)
+        terminalreporter.write_line(
+            f"Длительности тестов: воркеров {workers}, ожидаемый makespan {expected:.1f}s, "
+            f"фактический {max(self.per_worker.values()):.1f}s, "
+            f"суммарно {sum(self.measured.values()):.1f}s")
+
+    def pytest_unconfigure(self):
+        if self.is_worker or not self.measured:
+            return
+        self.history.update(self.measured)
+        self.history.save()
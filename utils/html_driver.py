@@ -0,0 +1,384 @@
+import functools
+from urllib.parse import urljoin, urlsplit
+
+import lxml.html
+import requests
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import (
+    InvalidSelectorException, JavascriptException, NoSuchElementException,
+    StaleElementReferenceException, WebDriverException)
+
+from pages.base_page import FILL_FORM_SCRIPT, PAGE_STATE_SCRIPT, TEXT_PRESENT_SCRIPT
+from utils import network_idle, webdriver_timing
+
+
+PROFILE = "browserless"
+READY_STATE_SCRIPT = "return document.readyState"
+
+# Стратегии с параметром: значение локатора подставляется в XPath как
+# переменная, поэтому кавычки в нём не нужно экранировать.
+_PARAMETRIZED = {
+    "id": etree.XPath(".//*[@id=$value]"),
+    "name": etree.XPath(".//*[@name=$value]"),
+    "link text": etree.XPath(".//a[normalize-space(string(.))=normalize-space($value)]"),
+    "partial link text": etree.XPath(".//a[contains(string(.), $value)]"),
+}
+_INVISIBLE_TAGS = {"head", "script", "style", "title", "noscript", "template"}
+_SUBMIT_TYPES = {"submit", "image"}
+_NOT_SUBMITTED_TYPES = {"submit", "image", "button", "reset", "file"}
+
+
+def new_adapter(pool_size=8):
+    """Пул keep-alive соединений, общий для всех HtmlDriver воркера."""
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _selector(by, value):
+    """Скомпилированный поиск для локатора (by, value): функция узел → список узлов."""
+    if by in _PARAMETRIZED:
+        xpath = _PARAMETRIZED[by]
+        return lambda node: xpath(node, value=value)
+    try:
+        if by == "xpath":
+            return etree.XPath(value)
+        if by == "css selector":
+            return CSSSelector(value, translator="html")
+        if by == "tag name":
+            return CSSSelector(value, translator="html")
+        if by == "class name":
+            return CSSSelector(f".{value}", translator="html")
+    except (etree.XPathSyntaxError, SyntaxError) as e:
+        raise InvalidSelectorException(f"Некорректный локатор {by}={value}: {e}")
+    raise InvalidSelectorException(f"Стратегия {by} не поддерживается HtmlDriver")
+
+
+def _find(node, by, value):
+    # CSSSelector ищет по descendant-or-self, WebDriver — только среди потомков.
+    return [found for found in _selector(by, value)(node)
+            if isinstance(found, etree.ElementBase) and found is not node]
+
+
+def _collapse(text):
+    return " ".join(text.split())
+
+
+class HtmlElement:
+    """
+    Элемент документа HtmlDriver с интерфейсом WebElement: текст, атрибуты,
+    видимость, ввод и клик. После загрузки нового документа элемент
+    устаревает и бросает StaleElementReferenceException, как в браузере.
+    """
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+        self._document = driver._document
+
+    @property
+    def node(self):
+        if self._document is not self._driver._document:
+            raise StaleElementReferenceException("Элемент принадлежит предыдущему документу")
+        return self._node
+
+    @property
+    def tag_name(self):
+        return self.node.tag.lower()
+
+    @property
+    def text(self):
+        return _collapse(_visible_text(self.node)) if self.is_displayed() else ""
+
+    def get_attribute(self, name):
+        node = self.node
+        if name == "value":
+            return _value(node)
+        if name in ("checked", "selected"):
+            return "true" if node.get(name) is not None else None
+        return node.get(name)
+
+    def get_dom_attribute(self, name):
+        return self.node.get(name)
+
+    def get_property(self, name):
+        return self.get_attribute(name)
+
+    def is_displayed(self):
+        """
+        Видимость по разметке: type=hidden, атрибут hidden и inline-стили
+        display:none / visibility:hidden у элемента и его предков. Таблицы
+        стилей не применяются.
+        """
+        node = self.node
+        if node.tag == "input" and (node.get("type") or "").lower() == "hidden":
+            return False
+        return all(_is_visible(ancestor) for ancestor in node.iterancestors()) and _is_visible(node)
+
+    def is_enabled(self):
+        return self.node.get("disabled") is None
+
+    def is_selected(self):
+        node = self.node
+        return node.get("selected" if node.tag == "option" else "checked") is not None
+
+    def find_element(self, by="id", value=None):
+        return self._driver._first(self.node, by, value)
+
+    def find_elements(self, by="id", value=None):
+        return [HtmlElement(self._driver, found) for found in _find(self.node, by, value)]
+
+    def clear(self):
+        _set_value(self.node, "")
+        self._driver._mutated()
+
+    def send_keys(self, *keys):
+        node = self.node
+        _set_value(node, (_value(node) or "") + "".join(str(key) for key in keys))
+        self._driver._mutated()
+
+    def click(self):
+        node = self.node
+        kind = (node.get("type") or "").lower()
+        if node.tag == "a" and node.get("href") and not node.get("href").startswith(("#", "javascript:")):
+            self._driver.get(urljoin(self._driver.current_url, node.get("href")))
+        elif node.tag == "option":
+            select = next(node.iterancestors("select"), None)
+            if select is not None and select.get("multiple") is None:
+                for option in select.iter("option"):
+                    option.attrib.pop("selected", None)
+            node.set("selected", "selected")
+            self._driver._mutated()
+        elif node.tag == "input" and kind == "checkbox":
+            if node.get("checked") is None:
+                node.set("checked", "checked")
+            else:
+                del node.attrib["checked"]
+            self._driver._mutated()
+        elif node.tag == "input" and kind == "radio":
+            node.set("checked", "checked")
+            self._driver._mutated()
+        elif (node.tag == "input" and kind in _SUBMIT_TYPES) or \
+                (node.tag == "button" and kind in ("", "submit")):
+            form = next(node.iterancestors("form"), None)
+            if form is not None:
+                self._driver._submit(form, node)
+
+    def submit(self):
+        node = self.node
+        form = node if node.tag == "form" else next(node.iterancestors("form"), None)
+        if form is None:
+            raise WebDriverException("Элемент не находится внутри формы")
+        self._driver._submit(form)
+
+
+def _is_visible(node):
+    if not isinstance(node.tag, str) or node.tag in _INVISIBLE_TAGS or node.get("hidden") is not None:
+        return False
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return "display:none" not in style and "visibility:hidden" not in style
+
+
+def _visible_text(node):
+    parts = [node.text or ""]
+    for child in node:
+        if _is_visible(child):
+            parts.append(_visible_text(child))
+        parts.append(child.tail or "")
+    return " ".join(parts)
+
+
+def _value(node):
+    if node.tag == "textarea":
+        return node.text or ""
+    if node.tag == "select":
+        options = list(node.iter("option"))
+        chosen = [option for option in options if option.get("selected") is not None] or options[:1]
+        return _option_value(chosen[0]) if chosen else ""
+    return node.get("value", "")
+
+
+def _option_value(option):
+    value = option.get("value")
+    return value if value is not None else _collapse(option.text_content())
+
+
+def _set_value(node, value):
+    if node.tag == "textarea":
+        node.text = value
+    else:
+        node.set("value", value)
+
+
+class HtmlDriver:
+    """
+    Драйвер без браузера: страницы загружаются по HTTP (requests) и
+    разбираются lxml, поиск элементов — XPath и CSS (cssselect) по
+    дереву документа.
+
+    Реализует подмножество WebDriver, на котором работают BasePage и
+    проверки вида «страница загрузилась, элемент и текст на месте»: get,
+    find_element(s), page_source, title, cookies, клики по ссылкам и
+    отправка форм. JavaScript не выполняется: execute_script понимает
+    только служебные скрипты BasePage и network_idle, на остальных бросает
+    JavascriptException. Тесты, которым нужен JS, остаются на Selenium.
+
+    Соединения берутся из общего адаптера (new_adapter), cookies у каждого
+    драйвера свои — как у нового профиля браузера.
+    """
+
+    def __init__(self, adapter=None):
+        self.http = requests.Session()
+        # Общий адаптер закрывает тот, кто его создал (фикстура html_adapter).
+        self._owns_adapter = adapter is None
+        if adapter is not None:
+            self.http.mount("http://", adapter)
+            self.http.mount("https://", adapter)
+        self.resource_profile = PROFILE
+        self.current_url = "about:blank"
+        self.stats = {"bytes": 0, "requests": 0, "blocked": 0, "load_time": 0.0, "pages": 0}
+        self._response = None
+        self._document = lxml.html.document_fromstring("<html><head></head><body></body></html>")
+        self._version = 0
+        self._scripts = {
+            READY_STATE_SCRIPT: lambda: "complete",
+            TEXT_PRESENT_SCRIPT: lambda text: text in self.page_source,
+            PAGE_STATE_SCRIPT: lambda: [self.current_url, id(self._document), self._version],
+            FILL_FORM_SCRIPT: self._fill_form,
+            network_idle.TRACKER_SCRIPT: lambda: None,
+            # Документ загружен целиком, фоновых запросов нет.
+            network_idle.STATUS_SCRIPT: lambda: ["complete", 0, False, float("inf")],
+        }
+
+    # --- навигация -----------------------------------------------------
+
+    def get(self, url):
+        self._load("GET", url)
+
+    def refresh(self):
+        self._load("GET", self.current_url)
+
+    def _load(self, method, url, **kwargs):
+        with webdriver_timing.measure("command", "get" if method == "GET" else "submit"):
+            try:
+                response = self.http.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                raise WebDriverException(f"Не удалось загрузить {url}: {e}")
+        self._response = response
+        self.current_url = response.url
+        self._document = lxml.html.document_fromstring(
+            response.content or b"<html></html>", base_url=response.url)
+        self._version = 0
+        self.stats["requests"] += 1 + len(response.history)
+        self.stats["bytes"] += len(response.content)
+        self.stats["load_time"] += response.elapsed.total_seconds()
+        self.stats["pages"] += 1
+
+    def _submit(self, form, submitter=None):
+        fields = []
+        for control in form.iter("input", "select", "textarea", "button"):
+            name = control.get("name")
+            if not name or control.get("disabled") is not None:
+                continue
+            kind = (control.get("type") or "").lower()
+            if control.tag == "input" and kind in ("checkbox", "radio"):
+                if control.get("checked") is not None:
+                    fields.append((name, control.get("value", "on")))
+            elif control.tag == "button" or kind in _NOT_SUBMITTED_TYPES:
+                if control is submitter:
+                    fields.append((name, control.get("value", "")))
+            else:
+                fields.append((name, _value(control)))
+        method = (form.get("method") or "get").upper()
+        action = urljoin(self.current_url, form.get("action") or self.current_url)
+        if method == "POST":
+            self._load("POST", action, data=fields)
+        else:
+            self._load("GET", action.split("?", 1)[0], params=fields)
+
+    @property
+    def title(self):
+        title = self._document.find(".//title")
+        return _collapse(title.text_content()) if title is not None else ""
+
+    @property
+    def page_source(self):
+        return lxml.html.tostring(self._document, encoding="unicode")
+
+    def _mutated(self):
+        self._version += 1
+
+    # --- поиск элементов -----------------------------------------------
+
+    def find_element(self, by="id", value=None):
+        return self._first(self._document, by, value)
+
+    def find_elements(self, by="id", value=None):
+        return [HtmlElement(self, node) for node in _find(self._document, by, value)]
+
+    def _first(self, node, by, value):
+        found = _find(node, by, value)
+        if not found:
+            raise NoSuchElementException(f"Элемент не найден: {by}={value}")
+        return HtmlElement(self, found[0])
+
+    # --- скрипты -------------------------------------------------------
+
+    def execute_script(self, script, *args):
+        try:
+            handler = self._scripts[script]
+        except KeyError:
+            raise JavascriptException("HtmlDriver не выполняет JavaScript; тесту нужен браузер")
+        return handler(*args)
+
+    def _fill_form(self, fields):
+        missing = []
+        for index, (by, value, text) in enumerate(fields):
+            found = _find(self._document, by, value)
+            if not found:
+                missing.append(index)
+                continue
+            node = found[0]
+            if node.tag == "select":
+                options = [option for option in node.iter("option") if _option_value(option) == text]
+                if not options:
+                    missing.append(index)
+                    continue
+                HtmlElement(self, options[0]).click()
+            else:
+                _set_value(node, text)
+        self._mutated()
+        return missing
+
+    # --- cookies и завершение ------------------------------------------
+
+    def add_cookie(self, cookie):
+        if self.current_url == "about:blank":
+            raise WebDriverException("Cookie можно добавить только после открытия страницы")
+        self.http.cookies.set(
+            cookie["name"], cookie["value"],
+            domain=cookie.get("domain") or urlsplit(self.current_url).hostname,
+            path=cookie.get("path", "/"))
+
+    def get_cookies(self):
+        return [{"name": cookie.name, "value": cookie.value, "domain": cookie.domain,
+                 "path": cookie.path} for cookie in self.http.cookies]
+
+    def get_cookie(self, name):
+        return next((cookie for cookie in self.get_cookies() if cookie["name"] == name), None)
+
+    def delete_all_cookies(self):
+        self.http.cookies.clear()
+
+    def quit(self):
+        """
+        Завершает «сессию»: cookies удаляются. Общий пул соединений не
+        закрывается — им пользуются следующие тесты воркера.
+        """
+        if self.http is None:
+            return
+        self.http.cookies.clear()
+        if self._owns_adapter:
+            self.http.close()
+        self.http = None
@@ -0,0 +1,437 @@
+import ast
+import inspect
+import json
+import re
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from utils.duration_scheduler import DurationHistory
+from utils.locators import is_locator
+from utils.webdriver_timing import CALL_LISTENERS
+
+
+DEFAULT_MAP = ".pytest-impact.json"
+USER_PROPERTY = "impact"
+# Символ «изменён модуль целиком»: импорты, константы, функции вне классов.
+MODULE = "*"
+# Файлы вне pages/ и tests/, изменение которых может повлиять на любой тест.
+# Прочие (README, .gitignore, workflow CI) на выбор тестов не влияют.
+GLOBAL_FILES = ("pytest.ini", "requirements.txt", "Dockerfile", "docker-compose.yml")
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "Выбор тестов по изменениям")
+    group.addoption(
+        "--impact-since", default=None, metavar="REV",
+        help="Запустить только тесты, затронутые изменениями с ревизии REV (git diff REV), "
+             "и страховочный набор")
+    group.addoption(
+        "--impact-map", default=DEFAULT_MAP,
+        help="Файл карты «тест → страницы, методы и локаторы» (относительно rootdir)")
+    group.addoption(
+        "--impact-always", action="append", default=[], metavar="PREFIX",
+        help="Тесты с этим префиксом nodeid запускаются всегда (можно указать несколько раз)")
+
+
+def pytest_configure(config):
+    selector = ImpactSelector(config)
+    CALL_LISTENERS.append(selector.record_call)
+    config.pluginmanager.register(selector, "impact-selector")
+
+
+def _git(root, *args):
+    return subprocess.run(["git", *args], cwd=root, check=True, capture_output=True,
+                          text=True).stdout
+
+
+def _hunk_lines(start, count):
+    # Чистое удаление или вставка (count == 0) задевает соседние строки.
+    return list(range(start, start + count)) if count else [start, start + 1]
+
+
+def git_changes(root, since):
+    """
+    Изменения рабочего дерева относительно ревизии since:
+    {путь: (строки старой версии, строки новой версии)}. None вместо
+    списка — этой версии нет: файл новый (в том числе неотслеживаемый) или
+    удалён.
+    """
+    changes = {}
+    old_path = current = None
+    for line in _git(root, "diff", "--unified=0", "--no-color", "--no-renames", since, "--").splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[len("--- a/"):]
+        elif line.startswith("+++ "):
+            new_path = None if line == "+++ /dev/null" else line[len("+++ b/"):]
+            current = changes.setdefault(new_path or old_path, (
+                [] if old_path else None, [] if new_path else None))
+        elif line.startswith("@@") and current is not None:
+            match = _HUNK.match(line)
+            old_start, old_count, new_start, new_count = (
+                int(value) if value is not None else 1 for value in match.groups())
+            if current[0] is not None:
+                current[0].extend(_hunk_lines(old_start, old_count))
+            if current[1] is not None:
+                current[1].extend(_hunk_lines(new_start, new_count))
+    for path in _git(root, "ls-files", "--others", "--exclude-standard").splitlines():
+        changes[path] = (None, None)
+    return changes
+
+
+def _span(node):
+    start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+    return start, node.end_lineno
+
+
+def _overlaps(node, lines):
+    start, end = _span(node)
+    return any(start <= line <= end for line in lines)
+
+
+def _member_symbols(cls, member):
+    if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        # Трассируются только обычные методы без декораторов (trace_methods);
+        # изменение остальных считается изменением класса.
+        if member.decorator_list or member.name.startswith("__"):
+            return {cls}
+        return {f"{cls}.{member.name}"}
+    if isinstance(member, (ast.Assign, ast.AnnAssign)):
+        targets = member.targets if isinstance(member, ast.Assign) else [member.target]
+        names = {f"{cls}.{target.id}" for target in targets if isinstance(target, ast.Name)}
+        return names or {cls}
+    return {cls}
+
+
+def changed_symbols(source, lines):
+    """
+    Что в модуле source затронуто строками lines: MODULE, имя класса (его
+    заголовок, декораторы, docstring, нетрассируемые методы) или
+    "Класс.член" для метода или атрибута (локатора, PATH, READY...).
+    Для нового или удалённого файла (lines — None) — весь модуль.
+    """
+    if source is None or lines is None:
+        return {MODULE}
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {MODULE}
+    touched = set()
+    for node in tree.body:
+        if not _overlaps(node, lines):
+            continue
+        if not isinstance(node, ast.ClassDef):
+            touched.add(MODULE)
+            continue
+        header_end = node.body[0].lineno - 1
+        if any(_span(node)[0] <= line <= header_end for line in lines):
+            touched.add(node.name)
+        for member in node.body:
+            if _overlaps(member, lines):
+                touched |= _member_symbols(node.name, member)
+    return touched
+
+
+def page_imports(path, root, _seen=None):
+    """Модули pages.*, которые файл path импортирует прямо или через другие страницы."""
+    seen = set() if _seen is None else _seen
+    try:
+        tree = ast.parse(Path(path).read_text())
+    except (OSError, SyntaxError):
+        return seen
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            module_path = Path(root) / (name.replace(".", "/") + ".py")
+            if name.startswith("pages.") and name not in seen and module_path.exists():
+                seen.add(name)
+                page_imports(module_path, root, seen)
+    return seen
+
+
+def _page_methods(tree):
+    return {member.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)
+            for member in node.body if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef))}
+
+
+def _traced_arguments(call, page_methods):
+    """Узлы, которые трассировка увидит в аргументах вызова метода page object."""
+    func = call.func
+    if not isinstance(func, ast.Attribute) or func.attr not in page_methods:
+        return set()
+    found = set()
+    for value in list(call.args) + [keyword.value for keyword in call.keywords]:
+        if isinstance(value, ast.Starred):
+            # find_elements(*локатор) — это вызов WebDriver, а не page object.
+            continue
+        found.add(value)
+        if isinstance(value, ast.Dict):
+            found.update(key for key in value.keys if key is not None)
+            found.update(value.values)
+        elif isinstance(value, (ast.List, ast.Tuple, ast.Set)):
+            found.update(value.elts)
+    return found
+
+
+def untraced_attributes(root):
+    """
+    Имена атрибутов, которые в pages/ и tests/ хоть раз читаются мимо
+    аргументов трассируемых методов page object (например,
+    driver.find_elements(*self.ERROR_MESSAGE)). Тест, который так
+    использует локатор, не запишет его в карту, поэтому изменение такого
+    атрибута считается изменением всего класса.
+    """
+    trees = {}
+    for directory in ("pages", "tests"):
+        trees[directory] = []
+        for path in sorted((Path(root) / directory).glob("*.py")):
+            try:
+                trees[directory].append(ast.parse(path.read_text()))
+            except (OSError, SyntaxError):
+                continue
+    page_methods = set()
+    for tree in trees["pages"]:
+        page_methods |= _page_methods(tree)
+    untraced = set()
+    for tree in trees["pages"] + trees["tests"]:
+        traced, called = set(), set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call):
+                traced |= _traced_arguments(node, page_methods)
+                called.add(node.func)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load) \
+                    and node not in traced and node not in called:
+                untraced.add(node.attr)
+    return untraced
+
+
+class ImpactMap:
+    """
+    Карта на диске: для каждого теста — классы page objects, которые он
+    создавал, и вызванные методы и локаторы ("LoginPage.login",
+    "LoginPage.USERNAME_INPUT"), по данным трассировки последнего запуска.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        try:
+            self.tests = json.loads(self.path.read_text())["tests"]
+        except (OSError, ValueError, KeyError):
+            self.tests = {}
+
+    def update(self, records):
+        self.tests.update(records)
+
+    def save(self):
+        self.path.write_text(json.dumps({"tests": self.tests}, indent=1, sort_keys=True))
+
+
+def select(items, changes, since, root, impact_map, safety):
+    """
+    Делит items на (выбранные, страховочные, пропущенные) по изменениям
+    changes с ревизии since (см. git_changes). safety(item) — тест нужно запустить в любом
+    случае. Если изменение нельзя привязать к страницам или тестам
+    (conftest.py, utils/, requirements.txt), выбираются все тесты.
+    """
+    root = Path(root)
+    changed_tests = set()
+    changed_pages = {}
+    for path, (old_lines, new_lines) in changes.items():
+        parts = Path(path).parts
+        if parts[0] == "tests" and path.endswith(".py") and Path(path).name.startswith("test_"):
+            changed_tests.add(path)
+        elif parts[0] == "pages" and path.endswith(".py"):
+            module = "pages." + Path(path).stem
+            new_source = (root / path).read_text() if new_lines is not None else None
+            symbols = changed_symbols(new_source, new_lines)
+            if old_lines is not None:
+                try:
+                    old_source = _git(root, "show", f"{since}:{path}")
+                except subprocess.CalledProcessError:
+                    old_source = None
+                symbols |= changed_symbols(old_source, old_lines)
+            changed_pages[module] = symbols
+        elif path.endswith(".py") or Path(path).name in GLOBAL_FILES:
+            return list(items), [], []
+
+    observed_classes = {name for entry in impact_map.tests.values() for name in entry["classes"]}
+    observed_symbols = {name for entry in impact_map.tests.values() for name in entry["symbols"]}
+    untraced = untraced_attributes(root) if changed_pages else set()
+    # Член класса, который ни один тест не вызывал (PATH, READY, неиспользуемый
+    # метод) или который где-то читается мимо трассировки, влияет на всех
+    # пользователей класса; класс, который ни один тест не создавал, — на
+    # всех, кто импортирует модуль.
+    triggers = {}
+    for module, symbols in changed_pages.items():
+        modules, classes, members = triggers.setdefault(module, (set(), set(), set()))
+        for symbol in symbols:
+            if symbol == MODULE:
+                modules.add(module)
+                continue
+            cls = symbol.split(".", 1)[0]
+            if "." in symbol and symbol in observed_symbols \
+                    and symbol.split(".", 1)[1] not in untraced:
+                members.add(symbol)
+            elif cls in observed_classes:
+                classes.add(cls)
+            else:
+                modules.add(module)
+
+    static = {}
+    selected, safety_net, skipped = [], [], []
+    for item in items:
+        path = item.nodeid.split("::", 1)[0]
+        entry = impact_map.tests.get(item.nodeid)
+        if path not in static:
+            static[path] = page_imports(root / path, root)
+        affected = path in changed_tests
+        for module, (modules, classes, members) in triggers.items():
+            if affected:
+                break
+            affected = bool(modules and module in static[path]) or bool(entry and (
+                classes & set(entry["classes"]) or members & set(entry["symbols"])))
+        if affected:
+            selected.append(item)
+        elif entry is None or safety(item):
+            safety_net.append(item)
+        else:
+            skipped.append(item)
+    return selected, safety_net, skipped
+
+
+class ImpactSelector:
+    """
+    Записывает, какие page objects, методы и локаторы вызывает каждый тест,
+    и хранит это в карте (--impact-map). С --impact-since выбирает по git
+    diff только затронутые тесты плюс страховочный набор: тесты без записи
+    в карте, упавшие в прошлый раз и перечисленные в --impact-always.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.root = Path(str(config.rootpath))
+        self.impact_map = ImpactMap(self.root / config.getoption("--impact-map"))
+        self.is_worker = hasattr(config, "workerinput")
+        self.current = None
+        self.records = {}
+        self.summary = None
+        self._locator_names = {}
+
+    def record_call(self, page, name, locators):
+        if self.current is None:
+            return
+        classes, symbols = self.current
+        mro = [cls for cls in type(page).__mro__ if cls.__module__.startswith("pages.")]
+        classes.update(cls.__name__ for cls in mro)
+        symbols.add(name)
+        for locator in locators:
+            symbols.update(self.locator_names(type(page), locator))
+
+    def locator_names(self, page_class, locator):
+        """Имена атрибутов "Класс.АТРИБУТ" класса и его предков, равных локатору (включая псевдонимы)."""
+        key = (page_class, locator)
+        if key not in self._locator_names:
+            self._locator_names[key] = {
+                f"{cls.__name__}.{attr}"
+                for cls in page_class.__mro__ for attr, value in vars(cls).items()
+                if is_locator(value) and f"{value[0]}={value[1]}" == locator}
+        return self._locator_names[key]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        # Async-тесты раннер запускает пачкой, и вызовы разных тестов не
+        # разделить: такие тесты в карту не попадают и всегда страхуются.
+        self.current = None if inspect.iscoroutinefunction(getattr(item, "obj", None)) else (set(), set())
+        yield
+        self.current = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield
+        if self.current is not None:
+            classes, symbols = self.current
+            item.user_properties.append(
+                (USER_PROPERTY, {"classes": sorted(classes), "symbols": sorted(symbols)}))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown" or self.is_worker:
+            return
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY:
+                self.records[report.nodeid] = value
+
+    def _safety(self, item):
+        cache = getattr(self.config, "cache", None)
+        last_failed = cache.get("cache/lastfailed", {}) if cache is not None else {}
+        prefixes = self.config.getoption("--impact-always")
+        return item.nodeid in last_failed or any(item.nodeid.startswith(prefix) for prefix in prefixes)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        since = config.getoption("--impact-since")
+        if not since or not items:
+            return
+        history = DurationHistory(self.root / config.getoption("--durations-file"))
+        total_time = sum(history.estimate(item.nodeid) for item in items)
+        try:
+            changes = git_changes(self.root, since)
+        except (OSError, subprocess.CalledProcessError) as e:
+            error = getattr(e, "stderr", None) or str(e)
+            self._publish({"since": since, "error": error.strip(), "total": len(items)})
+            return
+        selected, safety_net, skipped = select(items, changes, since, self.root, self.impact_map, self._safety)
+        if skipped:
+            config.hook.pytest_deselected(items=skipped)
+            kept = set(selected + safety_net)
+            items[:] = [item for item in items if item in kept]
+        self._publish({
+            "since": since,
+            "changed_files": len(changes),
+            "total": len(selected) + len(safety_net) + len(skipped),
+            "selected": len(selected),
+            "safety": len(safety_net),
+            "skipped": len(skipped),
+            "total_time": total_time,
+            "saved_time": sum(history.estimate(item.nodeid) for item in skipped),
+        })
+
+    def _publish(self, summary):
+        self.summary = summary
+        if self.is_worker:
+            self.config.workeroutput["impact"] = summary
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node):
+        summary = getattr(node, "workeroutput", {}).get("impact")
+        if summary is not None and self.summary is None:
+            self.summary = summary
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = self.summary
+        if summary is None:
+            return
+        if "error" in summary:
+            terminalreporter.write_line(
+                f"Выбор по изменениям с {summary['since']} отключён, запущены все тесты: {summary['error']}")
+            return
+        share = summary["saved_time"] / summary["total_time"] * 100 if summary["total_time"] else 0.0
+        terminalreporter.write_line(
+            f"Выбор по изменениям с {summary['since']}: изменено файлов {summary['changed_files']}, "
+            f"запущено {summary['selected'] + summary['safety']} из {summary['total']} тестов "
+            f"(затронуто {summary['selected']}, страховочных {summary['safety']}), пропущено "
+            f"{summary['skipped']}; экономия ≈{summary['saved_time']:.0f}s из "
+            f"{summary['total_time']:.0f}s ({share:.0f}%)")
+
+    def pytest_unconfigure(self):
+        CALL_LISTENERS[:] = [listener for listener in CALL_LISTENERS if listener != self.record_call]
+        if self.records and not self.is_worker:
+            self.impact_map.update(self.records)
+            self.impact_map.save()
@@ -0,0 +1,219 @@
+import itertools
+import threading
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+
+class BankError(Exception):
+    pass
+
+
+class Customer:
+    FIELDS = ("first_name", "last_name", "street", "city", "state", "zip_code", "phone", "ssn")
+
+    def __init__(self, customer_id, username, password, **details):
+        self.id = customer_id
+        self.username = username
+        self.password = password
+        for field in self.FIELDS:
+            setattr(self, field, details.get(field, ""))
+
+    @property
+    def full_name(self):
+        return f"{self.first_name} {self.last_name}"
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "firstName": self.first_name,
+            "lastName": self.last_name,
+            "address": {
+                "street": self.street,
+                "city": self.city,
+                "state": self.state,
+                "zipCode": self.zip_code,
+            },
+            "phoneNumber": self.phone,
+            "ssn": self.ssn,
+        }
+
+
+class Account:
+    def __init__(self, account_id, customer_id, account_type, balance):
+        self.id = account_id
+        self.customer_id = customer_id
+        self.type = account_type
+        self.balance = balance
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "customerId": self.customer_id,
+            "type": self.type,
+            "balance": float(self.balance),
+        }
+
+
+class Transaction:
+    def __init__(self, transaction_id, account_id, kind, amount, description):
+        self.id = transaction_id
+        self.account_id = account_id
+        self.type = kind
+        self.amount = amount
+        self.description = description
+        self.date = date.today()
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "accountId": self.account_id,
+            "type": self.type,
+            "date": self.date.isoformat(),
+            "amount": float(self.amount),
+            "description": self.description,
+        }
+
+
+def parse_amount(value):
+    """Разбирает сумму из формы/запроса; нечисловое значение — BankError."""
+    try:
+        amount = Decimal(str(value).strip())
+    except InvalidOperation:
+        raise BankError(f"Invalid amount: {value!r}")
+    if not amount.is_finite():
+        raise BankError(f"Invalid amount: {value!r}")
+    return amount.quantize(Decimal("0.01"))
+
+
+def format_money(amount):
+    sign = "-" if amount < 0 else ""
+    return f"{sign}${abs(amount):,.2f}"
+
+
+class Bank:
+    """
+    Потокобезопасная in-memory модель ParaBank: клиенты, счета и транзакции.
+    Повторяет поведение демо-сайта, на которое опираются тесты, в том числе
+    разрешённые переводы отрицательных сумм и уход счёта в минус.
+    """
+
+    # Стартовый взнос, который ParaBank переводит на новый счёт (createAccount).
+    OPENING_DEPOSIT = Decimal("100.00")
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._customer_ids = itertools.count(12212, 111)
+        self._account_ids = itertools.count(13344, 111)
+        self._transaction_ids = itertools.count(14476, 111)
+        self.customers = {}
+        self.accounts = {}
+        self.transactions = []
+        self.seed()
+
+    def seed(self):
+        """Создаёт встроенного пользователя john/demo со счетами 13344 и 13455."""
+        john = self.register(
+            "john", "demo", first_name="John", last_name="Smith", street="1431 Main St",
+            city="Beverly Hills", state="CA", zip_code="90210", phone="310-447-4121",
+            ssn="622-11-9999")
+        self.open_account(john.id, "CHECKING", Decimal("515.50"))
+        self.open_account(john.id, "SAVINGS", Decimal("1000.00"))
+
+    def register(self, username, password, **details):
+        with self._lock:
+            if not username or self.find_customer(username) is not None:
+                raise BankError("This username already exists.")
+            customer = Customer(next(self._customer_ids), username, password, **details)
+            self.customers[customer.id] = customer
+            return customer
+
+    def find_customer(self, username):
+        with self._lock:
+            for customer in self.customers.values():
+                if customer.username == username:
+                    return customer
+            return None
+
+    def authenticate(self, username, password):
+        customer = self.find_customer(username)
+        if customer is None or customer.password != password:
+            return None
+        return customer
+
+    def update_customer(self, customer_id, **details):
+        with self._lock:
+            customer = self.customer(customer_id)
+            for field, value in details.items():
+                if field in Customer.FIELDS:
+                    setattr(customer, field, value)
+            return customer
+
+    def customer(self, customer_id):
+        try:
+            return self.customers[int(customer_id)]
+        except (KeyError, ValueError):
+            raise BankError(f"Could not find customer #{customer_id}")
+
+    def account(self, account_id):
+        try:
+            return self.accounts[int(account_id)]
+        except (KeyError, ValueError):
+            raise BankError(f"Could not find account #{account_id}")
+
+    def accounts_of(self, customer_id):
+        with self._lock:
+            return [a for a in self.accounts.values() if a.customer_id == int(customer_id)]
+
+    def transactions_of(self, account_id):
+        with self._lock:
+            return [t for t in self.transactions if t.account_id == int(account_id)]
+
+    def open_account(self, customer_id, account_type="CHECKING", initial=Decimal("0.00")):
+        with self._lock:
+            self.customer(customer_id)
+            account = Account(next(self._account_ids), int(customer_id), account_type, Decimal("0.00"))
+            self.accounts[account.id] = account
+            if initial:
+                self._post(account, "Credit", initial, "Funds Transfer Received")
+            return account
+
+    def open_account_from(self, customer_id, account_type, from_account_id):
+        """Открывает счёт и переводит на него стартовый взнос с from_account_id."""
+        with self._lock:
+            source = self.account(from_account_id)
+            account = self.open_account(customer_id, account_type)
+            self._post(source, "Debit", self.OPENING_DEPOSIT, "Funds Transfer Sent")
+            self._post(account, "Credit", self.OPENING_DEPOSIT, "Funds Transfer Received")
+            return account
+
+    def deposit(self, account_id, amount):
+        with self._lock:
+            amount = parse_amount(amount)
+            self._post(self.account(account_id), "Credit", amount, "Deposit")
+            return amount
+
+    def withdraw(self, account_id, amount):
+        with self._lock:
+            amount = parse_amount(amount)
+            self._post(self.account(account_id), "Debit", amount, "Withdrawal")
+            return amount
+
+    def transfer(self, from_account_id, to_account_id, amount):
+        with self._lock:
+            amount = parse_amount(amount)
+            source = self.account(from_account_id)
+            target = self.account(to_account_id)
+            self._post(source, "Debit", amount, "Funds Transfer Sent")
+            self._post(target, "Credit", amount, "Funds Transfer Received")
+            return amount
+
+    def bill_pay(self, account_id, amount, payee_name):
+        with self._lock:
+            amount = parse_amount(amount)
+            self._post(self.account(account_id), "Debit", amount, f"Bill Payment to {payee_name}")
+            return amount
+
+    def _post(self, account, kind, amount, description):
+        account.balance += amount if kind == "Credit" else -amount
+        self.transactions.append(
+            Transaction(next(self._transaction_ids), account.id, kind, amount, description))
@@ -0,0 +1,455 @@
+# HTML-шаблоны локального стенда ParaBank. Разметка повторяет id, name и
+# тексты демо-сайта, на которые опираются локаторы из каталога pages.
+from html import escape
+
+from utils.local_bank import format_money
+
+
+LAYOUT = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>ParaBank | {title}</title>
+<link rel="stylesheet" type="text/css" href="style.css">
+</head>
+<body>
+<div id="mainPanel">
+  <div id="topPanel">
+    <a href="index.htm"><img class="logo" src="images/logo.gif" alt="ParaBank"></a>
+    <p class="caption">Experience the difference</p>
+  </div>
+  <div id="bodyPanel">
+    <div id="leftPanel">{left}</div>
+    <div id="rightPanel">{content}</div>
+  </div>
+</div>
+{script}
+</body>
+</html>
+"""
+
+LOGIN_PANEL = """
+<h2>Customer Login</h2>
+<div id="loginPanel">
+  <form name="login" method="post" action="login.htm">
+    <p><b>Username</b></p>
+    <div class="login"><input type="text" class="input" name="username"></div>
+    <p><b>Password</b></p>
+    <div class="login"><input type="password" class="input" name="password"></div>
+    <div class="login"><input type="submit" class="button" value="Log In"></div>
+  </form>
+  <p><a href="lookup.htm">Forgot login info?</a></p>
+  <p><a href="register.htm">Register</a></p>
+</div>
+"""
+
+ACCOUNT_SERVICES = """
+<p class="smallText"><b>Welcome</b> {name}</p>
+<h2>Account Services</h2>
+<ul>
+  <li><a href="openaccount.htm">Open New Account</a></li>
+  <li><a href="overview.htm">Accounts Overview</a></li>
+  <li><a href="transfer.htm">Transfer Funds</a></li>
+  <li><a href="billpay.htm">Bill Pay</a></li>
+  <li><a href="findtrans.htm">Find Transactions</a></li>
+  <li><a href="updateprofile.htm">Update Contact Info</a></li>
+  <li><a href="requestloan.htm">Request Loan</a></li>
+  <li><a href="logout.htm">Log Out</a></li>
+</ul>
+"""
+
+STYLE = """
+body { font-family: Arial, sans-serif; font-size: 13px; }
+#leftPanel { float: left; width: 220px; }
+#rightPanel { margin-left: 240px; }
+.error { color: #c00; }
+"""
+
+# Прозрачный GIF 1x1 вместо логотипа демо-сайта.
+LOGO_GIF = bytes.fromhex(
+    "47494638396101000100800000000000ffffff21f90401000000002c000000000100010000020144003b")
+
+HOME = """
+<h1 class="title">Welcome to ParaBank</h1>
+<p>ATM Services, Online Services and more.</p>
+"""
+
+LOGIN_ERROR = """
+<h1 class="title">Error!</h1>
+<p class="error">{message}</p>
+"""
+
+OVERVIEW = """
+<div id="showOverview">
+  <h1 class="title">Accounts Overview</h1>
+  <table id="accountTable" class="gridClass">
+    <thead><tr><th>Account</th><th>Balance*</th><th>Available Amount</th></tr></thead>
+    <tbody></tbody>
+    <tfoot><tr><td>*Balance includes deposits that may be subject to holds</td></tr></tfoot>
+  </table>
+</div>
+"""
+
+OVERVIEW_SCRIPT = """
+<script>
+(function () {
+  function money(value) {
+    var sign = value < 0 ? "-" : "";
+    return sign + "$" + Math.abs(value).toLocaleString("en-US",
+      {minimumFractionDigits: 2, maximumFractionDigits: 2});
+  }
+  fetch("services_proxy/bank/customers/%(customer_id)s/accounts",
+        {headers: {"Accept": "application/json"}})
+    .then(function (response) { return response.json(); })
+    .then(function (accounts) {
+      var rows = "", total = 0;
+      accounts.forEach(function (account) {
+        total += account.balance;
+        rows += "<tr><td><a href=\\"activity.htm?id=" + account.id + "\\">" + account.id +
+          "</a></td><td>" + money(account.balance) + "</td><td>" +
+          money(Math.max(account.balance, 0)) + "</td></tr>";
+      });
+      rows += "<tr><td><b>Total</b></td><td><b>" + money(total) + "</b></td><td>&nbsp;</td></tr>";
+      document.querySelector("#accountTable tbody").innerHTML = rows;
+    });
+})();
+</script>
+"""
+
+ACTIVITY = """
+<div id="accountDetails">
+  <h1 class="title">Account Details</h1>
+  <table>
+    <tr><td>Account Number:</td><td id="accountId">{account_id}</td></tr>
+    <tr><td>Account Type:</td><td id="accountType">{account_type}</td></tr>
+    <tr><td>Balance:</td><td id="balance">{balance}</td></tr>
+  </table>
+</div>
+<div id="activity">
+  <h1 class="title">Account Activity</h1>
+  <table id="transactionTable" class="gridClass">
+    <thead><tr><th>Date</th><th>Transaction</th><th>Debit (-)</th><th>Credit (+)</th></tr></thead>
+    <tbody>{rows}</tbody>
+  </table>
+</div>
+"""
+
+TRANSFER = """
+<div id="showForm">
+  <h1 class="title">Transfer Funds</h1>
+  <form id="transferForm">
+    <p><b>Amount:</b> $<input id="amount" type="text" class="input"></p>
+    <div>From account #<select id="fromAccountId" class="input">{options}</select>
+      to account #<select id="toAccountId" class="input">{options}</select></div>
+    <div><input type="submit" class="button" value="Transfer"></div>
+  </form>
+</div>
+<div id="showResult" style="display:none">
+  <h1 class="title">Transfer Complete!</h1>
+  <p>$<span id="amountResult"></span> has been transferred from account
+    #<span id="fromAccountIdResult"></span> to account #<span id="toAccountIdResult"></span>.</p>
+</div>
+<div id="showError" style="display:none">
+  <h1 class="title">Error!</h1>
+  <p class="error">An internal error has occurred and has been logged.</p>
+</div>
+"""
+
+TRANSFER_SCRIPT = """
+<script>
+document.getElementById("transferForm").addEventListener("submit", function (event) {
+  event.preventDefault();
+  var amount = document.getElementById("amount").value;
+  var from = document.getElementById("fromAccountId").value;
+  var to = document.getElementById("toAccountId").value;
+  var query = "fromAccountId=" + encodeURIComponent(from) + "&toAccountId=" +
+    encodeURIComponent(to) + "&amount=" + encodeURIComponent(amount);
+  fetch("services_proxy/bank/transfer?" + query, {method: "POST"})
+    .then(function (response) {
+      if (!response.ok) { throw new Error(response.status); }
+      document.getElementById("amountResult").textContent = amount;
+      document.getElementById("fromAccountIdResult").textContent = from;
+      document.getElementById("toAccountIdResult").textContent = to;
+      document.getElementById("showForm").style.display = "none";
+      document.getElementById("showResult").style.display = "";
+    })
+    .catch(function () {
+      document.getElementById("showForm").style.display = "none";
+      document.getElementById("showError").style.display = "";
+    });
+});
+</script>
+"""
+
+BILLPAY = """
+<div id="billpayForm">
+  <h1 class="title">Bill Payment Service</h1>
+  <form name="billpayForm">
+    <table>
+      <tr><td>Payee Name:</td><td><input class="input" name="payee.name"></td>
+        <td><span id="validationModel-name" class="error" style="display:none">Payee name is required.</span></td></tr>
+      <tr><td>Address:</td><td><input class="input" name="payee.address.street"></td>
+        <td><span id="validationModel-address" class="error" style="display:none">Address is required.</span></td></tr>
+      <tr><td>City:</td><td><input class="input" name="payee.address.city"></td>
+        <td><span id="validationModel-city" class="error" style="display:none">City is required.</span></td></tr>
+      <tr><td>State:</td><td><input class="input" name="payee.address.state"></td>
+        <td><span id="validationModel-state" class="error" style="display:none">State is required.</span></td></tr>
+      <tr><td>Zip Code:</td><td><input class="input" name="payee.address.zipCode"></td>
+        <td><span id="validationModel-zipCode" class="error" style="display:none">Zip Code is required.</span></td></tr>
+      <tr><td>Phone #:</td><td><input class="input" name="payee.phoneNumber"></td>
+        <td><span id="validationModel-phoneNumber" class="error" style="display:none">Phone number is required.</span></td></tr>
+      <tr><td>Account #:</td><td><input class="input" name="payee.accountNumber"></td>
+        <td><span id="validationModel-account-empty" class="error" style="display:none">Account number is required.</span>
+          <span id="validationModel-account-invalid" class="error" style="display:none">Please enter a valid number.</span></td></tr>
+      <tr><td>Verify Account #:</td><td><input class="input" name="verifyAccount"></td>
+        <td><span id="validationModel-verifyAccount-empty" class="error" style="display:none">Account number is required.</span>
+          <span id="validationModel-verifyAccount-mismatch" class="error" style="display:none">The account numbers do not match.</span></td></tr>
+      <tr><td>Amount: $</td><td><input class="input" name="amount"></td>
+        <td><span id="validationModel-amount-empty" class="error" style="display:none">The amount cannot be empty.</span>
+          <span id="validationModel-amount-invalid" class="error" style="display:none">Please enter a valid amount.</span></td></tr>
+      <tr><td>From account #:</td><td><select class="input" name="fromAccountId">{options}</select></td></tr>
+      <tr><td></td><td><input type="button" class="button" value="Send Payment"></td></tr>
+    </table>
+  </form>
+</div>
+<div id="billpayResult" style="display:none">
+  <h1 class="title">Bill Payment Complete</h1>
+  <p>Bill Payment to <span id="payeeName"></span> in the amount of
+    $<span id="amountPaid"></span> from account <span id="fromAccountIdPaid"></span> was successful.</p>
+</div>
+<div id="billpayError" style="display:none">
+  <h1 class="title">Error!</h1>
+  <p class="error">An internal error has occurred and has been logged.</p>
+</div>
+"""
+
+BILLPAY_SCRIPT = """
+<script>
+(function () {
+  var form = document.forms.billpayForm;
+  function value(name) { return form.elements[name].value; }
+  function toggle(id, show) { document.getElementById(id).style.display = show ? "" : "none"; }
+  form.querySelector("input[value='Send Payment']").addEventListener("click", function () {
+    var required = {"name": "payee.name", "address": "payee.address.street",
+      "city": "payee.address.city", "state": "payee.address.state",
+      "zipCode": "payee.address.zipCode", "phoneNumber": "payee.phoneNumber"};
+    var valid = true;
+    Object.keys(required).forEach(function (key) {
+      var empty = !value(required[key]);
+      toggle("validationModel-" + key, empty);
+      valid = valid && !empty;
+    });
+    var account = value("payee.accountNumber"), verify = value("verifyAccount"), amount = value("amount");
+    toggle("validationModel-account-empty", !account);
+    toggle("validationModel-account-invalid", account && isNaN(account));
+    toggle("validationModel-verifyAccount-empty", !verify);
+    toggle("validationModel-verifyAccount-mismatch", verify && verify !== account);
+    toggle("validationModel-amount-empty", !amount);
+    toggle("validationModel-amount-invalid", amount && isNaN(amount));
+    valid = valid && account && !isNaN(account) && verify === account && amount && !isNaN(amount);
+    if (!valid) { return; }
+    var query = "accountId=" + encodeURIComponent(value("fromAccountId")) +
+      "&amount=" + encodeURIComponent(amount);
+    fetch("services_proxy/bank/billpay?" + query, {
+      method: "POST",
+      headers: {"Content-Type": "application/json"},
+      body: JSON.stringify({name: value("payee.name"), accountNumber: account})
+    }).then(function (response) {
+      if (!response.ok) { throw new Error(response.status); }
+      document.getElementById("payeeName").textContent = value("payee.name");
+      document.getElementById("amountPaid").textContent = amount;
+      document.getElementById("fromAccountIdPaid").textContent = value("fromAccountId");
+      toggle("billpayForm", false);
+      toggle("billpayResult", true);
+    }).catch(function () {
+      toggle("billpayForm", false);
+      toggle("billpayError", true);
+    });
+  });
+})();
+</script>
+"""
+
+REGISTER_FIELDS = (
+    ("customer.firstName", "First Name", "text", "First name is required."),
+    ("customer.lastName", "Last Name", "text", "Last name is required."),
+    ("customer.address.street", "Address", "text", "Address is required."),
+    ("customer.address.city", "City", "text", "City is required."),
+    ("customer.address.state", "State", "text", "State is required."),
+    ("customer.address.zipCode", "Zip Code", "text", "Zip Code is required."),
+    ("customer.phoneNumber", "Phone #", "text", None),
+    ("customer.ssn", "SSN", "text", "Social Security Number is required."),
+    ("customer.username", "Username", "text", "Username is required."),
+    ("customer.password", "Password", "password", "Password is required."),
+    ("repeatedPassword", "Confirm", "password", "Password confirmation is required."),
+)
+
+REGISTER = """
+<h1 class="title">Signing up is easy!</h1>
+<p>If you have an account with us you can sign-up for free instant online access.</p>
+<form id="customerForm" method="post" action="register.htm">
+  <table class="form2">{rows}
+    <tr><td></td><td colspan="2"><input type="submit" class="button" value="Register"></td></tr>
+  </table>
+</form>
+"""
+
+REGISTERED = """
+<h1 class="title">Welcome {username}</h1>
+<p>Your account was created successfully. You are now logged in.</p>
+"""
+
+CONTACT = """
+<h1 class="title">Customer Care</h1>
+<p>Email support is available by filling out the following form.</p>
+<form id="contactForm" method="post" action="contact.htm">
+  <table>
+    <tr><td>Name:</td><td><input id="name" name="name" class="input" value="{name}"></td>
+      <td>{name_error}</td></tr>
+    <tr><td>Email:</td><td><input id="email" name="email" class="input" value="{email}"></td>
+      <td>{email_error}</td></tr>
+    <tr><td>Phone:</td><td><input id="phone" name="phone" class="input" value="{phone}"></td>
+      <td>{phone_error}</td></tr>
+    <tr><td>Message:</td><td><textarea id="message" name="message" class="input">{message}</textarea></td>
+      <td>{message_error}</td></tr>
+    <tr><td></td><td><input type="submit" class="button" value="Send to Customer Care"></td></tr>
+  </table>
+</form>
+"""
+
+CONTACT_SENT = """
+<h1 class="title">Customer Care</h1>
+<p>Thank you {name}</p>
+<p>A Customer Care Representative will be contacting you.</p>
+"""
+
+PROFILE_FIELDS = (
+    ("customer.firstName", "firstName", "First Name", "First name is required."),
+    ("customer.lastName", "lastName", "Last Name", "Last name is required."),
+    ("customer.address.street", "street", "Address", "Address is required."),
+    ("customer.address.city", "city", "City", "City is required."),
+    ("customer.address.state", "state", "State", "State is required."),
+    ("customer.address.zipCode", "zipCode", "Zip Code", "Zip Code is required."),
+    ("customer.phoneNumber", "phoneNumber", "Phone #", None),
+)
+
+PROFILE = """
+<div id="updateProfileForm">
+  <h1 class="title">Update Profile</h1>
+  <form name="updateProfileForm">
+    <table class="form2">{rows}
+      <tr><td></td><td><input type="button" class="button" value="Update Profile"></td></tr>
+    </table>
+  </form>
+</div>
+<div id="updateProfileResult" style="display:none">
+  <h1 class="title">Profile Updated</h1>
+  <p>Your updated address and phone number have been added to the system.</p>
+</div>
+<div id="updateProfileError" style="display:none">
+  <h1 class="title">Error!</h1>
+  <p class="error">An internal error has occurred and has been logged.</p>
+</div>
+"""
+
+PROFILE_SCRIPT = """
+<script>
+(function () {
+  var form = document.forms.updateProfileForm;
+  var fields = %(fields)s;
+  function toggle(id, show) { document.getElementById(id).style.display = show ? "" : "none"; }
+  form.querySelector("input[value='Update Profile']").addEventListener("click", function () {
+    var valid = true, query = [];
+    fields.forEach(function (field) {
+      var value = form.elements[field[0]].value;
+      if (field[2]) {
+        toggle(field[1] + "-error", !value);
+        valid = valid && !!value;
+      }
+      query.push(field[1] + "=" + encodeURIComponent(value));
+    });
+    if (!valid) { return; }
+    fetch("services_proxy/bank/customers/update/%(customer_id)s?" + query.join("&"), {method: "POST"})
+      .then(function (response) {
+        if (!response.ok) { throw new Error(response.status); }
+        toggle("updateProfileForm", false);
+        toggle("updateProfileResult", true);
+      })
+      .catch(function () {
+        toggle("updateProfileForm", false);
+        toggle("updateProfileError", true);
+      });
+  });
+})();
+</script>
+"""
+
+SIMPLE_PAGES = {
+    "openaccount.htm": ("Open Account", "<h1 class=\"title\">Open New Account</h1>"
+                                        "<p>What type of Account would you like to open?</p>"),
+    "findtrans.htm": ("Find Transactions", "<h1 class=\"title\">Find Transactions</h1>"),
+    "requestloan.htm": ("Request Loan", "<h1 class=\"title\">Apply for a Loan</h1>"),
+    "about.htm": ("About Us", "<h1 class=\"title\">ParaBank Is Demo Site</h1>"),
+    "lookup.htm": ("Customer Lookup", "<h1 class=\"title\">Customer Lookup</h1>"),
+}
+
+
+def render(title, content, customer=None, script=""):
+    left = ACCOUNT_SERVICES.format(name=escape(customer.full_name)) if customer else LOGIN_PANEL
+    return LAYOUT.format(title=escape(title), left=left, content=content, script=script)
+
+
+def account_options(accounts):
+    return "".join(f'<option value="{a.id}">{a.id}</option>' for a in accounts)
+
+
+def activity_rows(transactions):
+    rows = []
+    for t in transactions:
+        debit = format_money(t.amount) if t.type == "Debit" else ""
+        credit = format_money(t.amount) if t.type == "Credit" else ""
+        rows.append(
+            f"<tr><td>{t.date:%m-%d-%Y}</td>"
+            f"<td><a href=\"transaction.htm?id={t.id}\">{escape(t.description)}</a></td>"
+            f"<td>{debit}</td><td>{credit}</td></tr>")
+    return "".join(rows)
+
+
+def register_rows(values, errors):
+    rows = []
+    for name, label, kind, _ in REGISTER_FIELDS:
+        error = errors.get(name)
+        error_html = f'<span id="{name}.errors" class="error">{escape(error)}</span>' if error else ""
+        value = "" if kind == "password" else escape(values.get(name, ""), quote=True)
+        rows.append(
+            f'\n    <tr><td>{label}:</td><td><input id="{name}" name="{name}" type="{kind}" '
+            f'class="input" value="{value}"></td><td>{error_html}</td></tr>')
+    return "".join(rows)
+
+
+def profile_rows(customer):
+    values = {
+        "firstName": customer.first_name, "lastName": customer.last_name,
+        "street": customer.street, "city": customer.city, "state": customer.state,
+        "zipCode": customer.zip_code, "phoneNumber": customer.phone,
+    }
+    rows = []
+    for name, key, label, error in PROFILE_FIELDS:
+        error_html = (f'<span id="{key}-error" class="error" style="display:none">{error}</span>'
+                      if error else "")
+        rows.append(
+            f'\n      <tr><td>{label}:</td><td><input id="{name}" name="{name}" class="input" '
+            f'value="{escape(values[key], quote=True)}"></td><td>{error_html}</td></tr>')
+    return "".join(rows)
+
+
+def contact_page(values=None, errors=None):
+    values = values or {}
+    errors = errors or {}
+    fields = {}
+    for name in ("name", "email", "phone", "message"):
+        fields[name] = escape(values.get(name, ""), quote=True)
+        error = errors.get(name)
+        fields[f"{name}_error"] = (
+            f'<span id="{name}.errors" class="error">{escape(error)}</span>' if error else "")
+    return CONTACT.format(**fields)
@@ -0,0 +1,357 @@
+import json
+import secrets
+import threading
+import time
+import xml.etree.ElementTree as ET
+from html import escape
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from utils import local_pages as pages
+from utils.local_bank import Bank, BankError, format_money
+
+
+CONTEXT_PATH = "/parabank"
+SESSION_COOKIE = "JSESSIONID"
+ROUTES = {
+    "index.htm": "page_index",
+    "login.htm": "page_login",
+    "logout.htm": "page_logout",
+    "overview.htm": "page_overview",
+    "activity.htm": "page_activity",
+    "transfer.htm": "page_transfer",
+    "billpay.htm": "page_billpay",
+    "updateprofile.htm": "page_updateprofile",
+    "register.htm": "page_register",
+    "contact.htm": "page_contact",
+    "style.css": "page_style",
+    "images/logo.gif": "page_logo",
+}
+
+
+def to_xml(tag, value, item_tag=None):
+    """Сериализует ответ сервиса в XML, как ParaBank без Accept: application/json."""
+    element = ET.Element(tag)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            element.append(to_xml(key, item))
+    elif isinstance(value, list):
+        for item in value:
+            element.append(to_xml(item_tag, item))
+    else:
+        element.text = str(value)
+    return element
+
+
+class LocalParaBank:
+    """
+    Локальный стенд ParaBank в отдельном потоке текущего процесса.
+
+    Отдаёт страницы и AJAX-эндпоинты, с которыми работают page objects,
+    хранит клиентов и счета в памяти (Bank) и умеет добавлять искусственную
+    задержку к каждому ответу, чтобы имитировать медленный сервер.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, bank=None):
+        self.bank = bank or Bank()
+        self.latency = latency
+        self.sessions = {}
+        self._server = ThreadingHTTPServer((host, port), ParaBankHandler)
+        self._server.daemon_threads = True
+        self._server.app = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{CONTEXT_PATH}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-parabank", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class ParaBankHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def app(self):
+        return self.server.app
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        if self.app.latency:
+            time.sleep(self.app.latency)
+        url = urlsplit(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        self.form = {}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded"):
+            self.form = {k: v[-1] for k, v in parse_qs(
+                self.body.decode("utf-8"), keep_blank_values=True).items()}
+
+        if url.path in (CONTEXT_PATH, CONTEXT_PATH + "/"):
+            return self._redirect("index.htm")
+        if not url.path.startswith(CONTEXT_PATH + "/"):
+            return self._send(404, "text/plain", b"Not Found")
+        path = url.path[len(CONTEXT_PATH) + 1:]
+
+        for prefix in ("services/bank/", "services_proxy/bank/"):
+            if path.startswith(prefix):
+                return self._service(method, path[len(prefix):].strip("/").split("/"))
+
+        if path in ROUTES:
+            return getattr(self, ROUTES[path])(method)
+        if path in pages.SIMPLE_PAGES:
+            title, content = pages.SIMPLE_PAGES[path]
+            return self._html(title, content)
+        return self._send(404, "text/plain", b"Not Found")
+
+    # --- сессия ---
+
+    def _session_token(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    @property
+    def customer(self):
+        customer_id = self.app.sessions.get(self._session_token())
+        return self.app.bank.customers.get(customer_id) if customer_id else None
+
+    def _start_session(self, customer):
+        token = secrets.token_hex(16).upper()
+        self.app.sessions[token] = customer.id
+        return f"{SESSION_COOKIE}={token}; Path={CONTEXT_PATH}; HttpOnly"
+
+    # --- ответы ---
+
+    def _send(self, status, content_type, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _html(self, title, content, script="", status=200, headers=None, customer=None):
+        body = pages.render(title, content, customer or self.customer, script).encode("utf-8")
+        self._send(status, "text/html;charset=utf-8", body, headers)
+
+    def _redirect(self, location, headers=None):
+        headers = dict(headers or {})
+        headers["Location"] = f"{CONTEXT_PATH}/{location}"
+        self._send(302, "text/plain", b"", headers)
+
+    def _json(self, payload, status=200):
+        self._send(status, "application/json", json.dumps(payload).encode("utf-8"))
+
+    def _data(self, root, payload, item_tag=None):
+        """Ответ сервиса в XML, если клиент просит XML, иначе в JSON."""
+        if "xml" not in self.headers.get("Accept", ""):
+            return self._json(payload)
+        body = ET.tostring(to_xml(root, payload, item_tag), encoding="utf-8", xml_declaration=True)
+        self._send(200, "application/xml", body)
+
+    def _login_required(self):
+        """Незалогиненному пользователю защищённые страницы показывают форму входа."""
+        if self.customer is None:
+            self._html("Welcome | Online Banking", pages.LOGIN_ERROR.format(
+                message="Please log in to access this page."))
+            return True
+        return False
+
+    # --- страницы ---
+
+    def page_index(self, method):
+        self._html("Welcome | Online Banking", pages.HOME)
+
+    def page_style(self, method):
+        self._send(200, "text/css", pages.STYLE.encode("utf-8"))
+
+    def page_logo(self, method):
+        self._send(200, "image/gif", pages.LOGO_GIF)
+
+    def page_login(self, method):
+        username = self.form.get("username", "")
+        password = self.form.get("password", "")
+        if not username or not password:
+            return self._html("Error", pages.LOGIN_ERROR.format(
+                message="Please enter a username and password."))
+        customer = self.app.bank.authenticate(username, password)
+        if customer is None:
+            return self._html("Error", pages.LOGIN_ERROR.format(
+                message="The username and password could not be verified."))
+        self._redirect("overview.htm", {"Set-Cookie": self._start_session(customer)})
+
+    def page_logout(self, method):
+        self.app.sessions.pop(self._session_token(), None)
+        self._redirect("index.htm")
+
+    def page_overview(self, method):
+        if self._login_required():
+            return
+        self._html("Accounts Overview", pages.OVERVIEW,
+                   pages.OVERVIEW_SCRIPT % {"customer_id": self.customer.id})
+
+    def page_activity(self, method):
+        if self._login_required():
+            return
+        try:
+            account = self.app.bank.account(self.query.get("id"))
+        except BankError as e:
+            return self._html("Error", pages.LOGIN_ERROR.format(message=escape(str(e))))
+        self._html("Account Activity", pages.ACTIVITY.format(
+            account_id=account.id, account_type=account.type,
+            balance=format_money(account.balance),
+            rows=pages.activity_rows(self.app.bank.transactions_of(account.id))))
+
+    def page_transfer(self, method):
+        if self._login_required():
+            return
+        options = pages.account_options(self.app.bank.accounts_of(self.customer.id))
+        self._html("Transfer Funds", pages.TRANSFER.format(options=options), pages.TRANSFER_SCRIPT)
+
+    def page_billpay(self, method):
+        if self._login_required():
+            return
+        options = pages.account_options(self.app.bank.accounts_of(self.customer.id))
+        self._html("Bill Pay", pages.BILLPAY.format(options=options), pages.BILLPAY_SCRIPT)
+
+    def page_updateprofile(self, method):
+        if self._login_required():
+            return
+        fields = json.dumps([[name, key, bool(error)] for name, key, _, error in pages.PROFILE_FIELDS])
+        self._html("Update Profile", pages.PROFILE.format(rows=pages.profile_rows(self.customer)),
+                   pages.PROFILE_SCRIPT % {"fields": fields, "customer_id": self.customer.id})
+
+    def page_register(self, method):
+        if method == "GET":
+            return self._html("Register for Free Online Account Access",
+                              pages.REGISTER.format(rows=pages.register_rows({}, {})))
+        errors = {name: message for name, _, _, message in pages.REGISTER_FIELDS
+                  if message and not self.form.get(name)}
+        password = self.form.get("customer.password")
+        if password and self.form.get("repeatedPassword") and \
+                password != self.form.get("repeatedPassword"):
+            errors["repeatedPassword"] = "Passwords did not match."
+        if not errors:
+            try:
+                customer = self.app.bank.register(
+                    self.form["customer.username"], password,
+                    first_name=self.form["customer.firstName"],
+                    last_name=self.form["customer.lastName"],
+                    street=self.form["customer.address.street"],
+                    city=self.form["customer.address.city"],
+                    state=self.form["customer.address.state"],
+                    zip_code=self.form["customer.address.zipCode"],
+                    phone=self.form.get("customer.phoneNumber", ""),
+                    ssn=self.form["customer.ssn"])
+            except BankError as e:
+                errors["customer.username"] = str(e)
+            else:
+                self.app.bank.open_account(customer.id)
+                return self._html(
+                    "Customer Created",
+                    pages.REGISTERED.format(username=escape(customer.username)),
+                    headers={"Set-Cookie": self._start_session(customer)}, customer=customer)
+        self._html("Register for Free Online Account Access",
+                   pages.REGISTER.format(rows=pages.register_rows(self.form, errors)))
+
+    def page_contact(self, method):
+        if method == "GET":
+            return self._html("Customer Care", pages.contact_page())
+        messages = {"name": "Name is required.", "email": "Email is required.",
+                    "phone": "Phone is required.", "message": "Message is required."}
+        errors = {name: message for name, message in messages.items() if not self.form.get(name)}
+        if errors:
+            return self._html("Customer Care", pages.contact_page(self.form, errors))
+        self._html("Customer Care", pages.CONTACT_SENT.format(name=escape(self.form["name"])))
+
+    # --- REST-сервис (services/bank и services_proxy/bank) ---
+
+    def _service(self, method, parts):
+        bank = self.app.bank
+        account_types = ("CHECKING", "SAVINGS")
+        try:
+            if parts[0] == "login" and len(parts) == 3:
+                customer = bank.authenticate(parts[1], parts[2])
+                if customer is None:
+                    return self._send(400, "text/plain", b"Invalid username and/or password")
+                return self._data("customer", customer.to_dict())
+            if parts[0] == "customers" and len(parts) == 2:
+                return self._data("customer", bank.customer(parts[1]).to_dict())
+            if parts[0] == "accounts" and len(parts) == 2:
+                return self._data("account", bank.account(parts[1]).to_dict())
+            if parts[0] == "accounts" and len(parts) == 3 and parts[2] == "transactions":
+                account = bank.account(parts[1])
+                return self._data("transactions", [t.to_dict() for t in bank.transactions_of(account.id)],
+                                  "transaction")
+            if parts == ["createAccount"] and method == "POST":
+                try:
+                    account_type = account_types[int(self.query.get("newAccountType", 0))]
+                except (IndexError, ValueError):
+                    raise BankError("Invalid account type")
+                account = bank.open_account_from(
+                    self.query.get("customerId"), account_type, self.query.get("fromAccountId"))
+                return self._data("account", account.to_dict())
+            if parts == ["deposit"] and method == "POST":
+                amount = bank.deposit(self.query.get("accountId"), self.query.get("amount"))
+                message = f"Successfully deposited ${amount} to account #{self.query['accountId']}"
+                return self._send(200, "text/plain", message.encode("utf-8"))
+            if parts == ["withdraw"] and method == "POST":
+                amount = bank.withdraw(self.query.get("accountId"), self.query.get("amount"))
+                message = f"Successfully withdrew ${amount} from account #{self.query['accountId']}"
+                return self._send(200, "text/plain", message.encode("utf-8"))
+            if parts[0] == "customers" and len(parts) == 3 and parts[2] == "accounts":
+                return self._data("accounts", [a.to_dict() for a in bank.accounts_of(parts[1])], "account")
+            if parts[:2] == ["customers", "update"] and method == "POST":
+                bank.update_customer(
+                    parts[2], first_name=self.query.get("firstName", ""),
+                    last_name=self.query.get("lastName", ""), street=self.query.get("street", ""),
+                    city=self.query.get("city", ""), state=self.query.get("state", ""),
+                    zip_code=self.query.get("zipCode", ""), phone=self.query.get("phoneNumber", ""))
+                return self._send(200, "text/plain", b"Successfully updated customer profile")
+            if parts == ["transfer"] and method == "POST":
+                amount = bank.transfer(
+                    self.query.get("fromAccountId"), self.query.get("toAccountId"),
+                    self.query.get("amount"))
+                message = (f"Successfully transferred ${amount} from account "
+                           f"#{self.query['fromAccountId']} to account #{self.query['toAccountId']}")
+                return self._send(200, "text/plain", message.encode("utf-8"))
+            if parts == ["billpay"] and method == "POST":
+                payee = json.loads(self.body or b"{}")
+                amount = bank.bill_pay(self.query.get("accountId"), self.query.get("amount"),
+                                       payee.get("name", ""))
+                return self._json({"payeeName": payee.get("name", ""),
+                                   "amount": float(amount),
+                                   "accountId": int(self.query["accountId"])})
+        except BankError as e:
+            return self._send(400, "text/plain", str(e).encode("utf-8"))
+        self._send(404, "text/plain", b"Not Found")
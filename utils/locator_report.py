@@ -0,0 +1,132 @@
+"""
+Отчёт по локаторам page objects: исходный XPath, во что он скомпилирован,
+и (с --benchmark) время поиска до и после на локальном стенде.
+
+    python -m utils.locator_report
+    python -m utils.locator_report --benchmark --iterations 500 --json locators.json
+"""
+import argparse
+import importlib
+import json
+import statistics
+import time
+from pathlib import Path
+
+from utils.locators import REGISTRY
+
+
+ROOT = Path(__file__).resolve().parent.parent
+# На какой странице стенда измерять локаторы класса и нужен ли для неё вход.
+PAGE_PATHS = {
+    "LoginPage": ("index.htm", False),
+    "SearchPage": ("index.htm", False),
+    "RegistrationPage": ("register.htm", False),
+    "ContactPage": ("contact.htm", False),
+    "AccountOverviewPage": ("overview.htm", True),
+    "NavigationPage": ("overview.htm", True),
+    "FundsTransferPage": ("transfer.htm", True),
+    "BillPayPage": ("billpay.htm", True),
+    "ProfilePage": ("updateprofile.htm", True),
+}
+
+# Среднее время одного поиска внутри браузера, мкс: без обмена с WebDriver,
+# только вычисление XPath, querySelectorAll или getElementById.
+LOOKUP_SCRIPT = """
+var by = arguments[0], value = arguments[1], n = arguments[2];
+function find() {
+  switch (by) {
+    case "id": return document.getElementById(value);
+    case "css selector": return document.querySelectorAll(value);
+    case "xpath": return document.evaluate(
+      value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+  }
+  return null;
+}
+var start = performance.now();
+for (var i = 0; i < n; i++) { find(); }
+return (performance.now() - start) / n * 1000;
+"""
+
+
+def load_page_objects():
+    """Импортирует все модули pages/: при создании классов их локаторы попадают в REGISTRY."""
+    for path in sorted((ROOT / "pages").glob("*.py")):
+        importlib.import_module(f"pages.{path.stem}")
+    return REGISTRY
+
+
+def measure(driver, locator, iterations, round_trips):
+    in_browser = None
+    if locator[0] in ("id", "css selector", "xpath"):
+        in_browser = driver.execute_script(LOOKUP_SCRIPT, locator[0], locator[1], iterations)
+    samples = []
+    for _ in range(round_trips):
+        started = time.perf_counter()
+        driver.find_elements(*locator)
+        samples.append((time.perf_counter() - started) * 1000)
+    return in_browser, statistics.median(samples)
+
+
+def benchmark(registry, iterations, round_trips, latency):
+    from conftest import create_driver
+    from utils.auth_session import AuthSession
+    from utils.driver_resolver import resolve_shared
+    from utils.local_server import LocalParaBank
+
+    driver_path = resolve_shared(ROOT / ".pytest_cache" / "d" / "chromedriver", allow_download=True)
+    driver = create_driver(driver_path.driver_path, chrome_binary=driver_path.chrome_binary)
+    results = {}
+    try:
+        with LocalParaBank(latency=latency) as server:
+            auth = AuthSession(server.base_url, "john", "demo")
+            for name, (original, compiled) in registry.items():
+                path, needs_login = PAGE_PATHS.get(name.split(".")[0], ("index.htm", False))
+                driver.delete_all_cookies()
+                if needs_login:
+                    auth.login(driver)
+                driver.get(f"{server.base_url}/{path}")
+                before = measure(driver, original, iterations, round_trips)
+                after = measure(driver, compiled, iterations, round_trips)
+                results[name] = {"before": before, "after": after}
+    finally:
+        driver.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--benchmark", action="store_true", help="Измерить поиск в браузере на локальном стенде")
+    parser.add_argument("--iterations", type=int, default=200, help="Поисков на локатор внутри браузера")
+    parser.add_argument("--round-trips", type=int, default=20, help="Вызовов find_elements на локатор")
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка стенда, мс")
+    parser.add_argument("--json", help="Записать отчёт в JSON-файл")
+    args = parser.parse_args()
+
+    registry = load_page_objects()
+    results = benchmark(registry, args.iterations, args.round_trips, args.latency / 1000) \
+        if args.benchmark else {}
+
+    rows = []
+    for name, (original, compiled) in sorted(registry.items()):
+        row = {"locator": name, "original": list(original), "compiled": list(compiled)}
+        line = f"{name:<45} {original[0]:<6} -> {compiled[0]:<13} {compiled[1]}"
+        if name in results:
+            (browser_before, trip_before), (browser_after, trip_after) = \
+                results[name]["before"], results[name]["after"]
+            row.update(browser_us_before=browser_before, browser_us_after=browser_after,
+                       find_ms_before=trip_before, find_ms_after=trip_after)
+            if browser_before is not None and browser_after is not None:
+                line += f"  | {browser_before:8.1f} -> {browser_after:8.1f} мкс"
+            line += f"  | {trip_before:6.2f} -> {trip_after:6.2f} мс"
+        rows.append(row)
+        print(line)
+
+    changed = sum(1 for original, compiled in registry.values() if original != compiled)
+    print(f"\nЛокаторов: {len(registry)}, скомпилировано: {changed}, "
+          f"оставлено как есть: {len(registry) - changed}")
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=1, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
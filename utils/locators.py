@@ -0,0 +1,182 @@
+import re
+
+from selenium.webdriver.common.by import By
+
+
+# Исходный и скомпилированный локатор для каждого атрибута page objects:
+# {"LoginPage.USERNAME_INPUT": (исходный, скомпилированный)}.
+REGISTRY = {}
+
+_NAME = re.compile(r"[A-Za-z_][\w.-]*|\*")
+_ID_ONLY = re.compile(r"""//\*\[@id=(['"])([^'"]*)\1\]$""")
+
+
+class Unsupported(ValueError):
+    """XPath использует то, что нельзя выразить в CSS без потери смысла."""
+
+
+def css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def css_id(value):
+    """#id с экранированием точек и прочих символов, которые в CSS значат другое."""
+    if not value or value[0].isdigit():
+        return f"[id={css_string(value)}]"
+    return "#" + re.sub(r"([^\w-])", r"\\\1", value)
+
+
+class _XPathParser:
+    """
+    Разбор подмножества XPath, которое однозначно переводится в CSS:
+    шаги //tag и /tag, предикаты @attr='v', contains(@attr, 'v'),
+    not(...) и их соединение через and. Текстовые предикаты (text(),
+    contains(text(), ...)), or, позиции и оси дают Unsupported.
+    """
+
+    def __init__(self, xpath):
+        self.text = xpath.strip()
+        self.pos = 0
+
+    def parse(self):
+        parts = []
+        while self.pos < len(self.text):
+            if self._take("//"):
+                combinator = " "
+            elif self._take("/"):
+                combinator = " > "
+            else:
+                raise Unsupported(self.text)
+            if not parts and combinator != " ":
+                raise Unsupported(self.text)
+            parts.append((combinator if parts else "") + self._step())
+        if not parts:
+            raise Unsupported(self.text)
+        return "".join(parts)
+
+    def _take(self, token):
+        if self.text.startswith(token, self.pos):
+            self.pos += len(token)
+            return True
+        return False
+
+    def _skip_spaces(self):
+        while self.pos < len(self.text) and self.text[self.pos] == " ":
+            self.pos += 1
+
+    def _expect(self, token):
+        self._skip_spaces()
+        if not self._take(token):
+            raise Unsupported(self.text)
+        self._skip_spaces()
+
+    def _step(self):
+        match = _NAME.match(self.text, self.pos)
+        if match is None:
+            raise Unsupported(self.text)
+        self.pos = match.end()
+        tag = match.group()
+        selectors = []
+        while self._take("["):
+            self._skip_spaces()
+            selectors.extend(self._conjunction())
+            self._expect("]")
+        css = "".join(css_id(value) if kind == "id" else value for kind, value in selectors)
+        if tag == "*":
+            return css or "*"
+        return tag + css
+
+    def _conjunction(self):
+        selectors = [self._term()]
+        self._skip_spaces()
+        while self._take("and "):
+            self._skip_spaces()
+            selectors.append(self._term())
+            self._skip_spaces()
+        if self.text.startswith("or ", self.pos):
+            raise Unsupported(self.text)
+        return selectors
+
+    def _term(self):
+        if self._take("not("):
+            self._skip_spaces()
+            kind, value = self._term()
+            self._expect(")")
+            return "css", f":not({css_id(value) if kind == 'id' else value})"
+        if self._take("contains("):
+            self._skip_spaces()
+            attribute = self._attribute()
+            self._expect(",")
+            literal = self._literal()
+            self._expect(")")
+            return "css", f"[{attribute}*={css_string(literal)}]"
+        attribute = self._attribute()
+        self._expect("=")
+        literal = self._literal()
+        if attribute == "id":
+            return "id", literal
+        return "css", f"[{attribute}={css_string(literal)}]"
+
+    def _attribute(self):
+        if not self._take("@"):
+            raise Unsupported(self.text)
+        match = re.compile(r"[A-Za-z_][\w.-]*").match(self.text, self.pos)
+        if match is None:
+            raise Unsupported(self.text)
+        self.pos = match.end()
+        return match.group()
+
+    def _literal(self):
+        quote = self.text[self.pos:self.pos + 1]
+        if quote not in ("'", '"'):
+            raise Unsupported(self.text)
+        end = self.text.find(quote, self.pos + 1)
+        if end == -1:
+            raise Unsupported(self.text)
+        literal = self.text[self.pos + 1:end]
+        self.pos = end + 1
+        return literal
+
+
+def compile_locator(locator):
+    """
+    Переводит XPath-локатор в (By.ID, ...) или (By.CSS_SELECTOR, ...), если
+    перевод сохраняет смысл, иначе возвращает локатор без изменений.
+    //*[@id='x'] становится поиском по id, остальное — CSS-селектором.
+    """
+    by, value = locator
+    if by != By.XPATH:
+        return locator
+    match = _ID_ONLY.match(value.strip())
+    if match:
+        return (By.ID, match.group(2))
+    try:
+        return (By.CSS_SELECTOR, _XPathParser(value).parse())
+    except Unsupported:
+        return locator
+
+
+def is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 \
+        and all(isinstance(part, str) for part in value) and value[0] in vars(By).values()
+
+
+def compile_class_locators(cls):
+    """
+    Заменяет локаторы в атрибутах класса (и в кортежах локаторов вроде
+    TYPED_FIELDS) скомпилированными и записывает пары в REGISTRY.
+    """
+    compiled = {}
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if is_locator(value):
+            # Псевдонимы (READY = USERNAME_INPUT) в отчёт второй раз не попадают.
+            if value not in compiled:
+                compiled[value] = compile_locator(value)
+                REGISTRY[f"{cls.__name__}.{name}"] = (value, compiled[value])
+            setattr(cls, name, compiled[value])
+    for name, value in list(vars(cls).items()):
+        if isinstance(value, tuple) and value and all(is_locator(item) for item in value):
+            setattr(cls, name, tuple(compiled.get(item, compile_locator(item)) for item in value))
+    return cls
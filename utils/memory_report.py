@@ -0,0 +1,146 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from utils.process_memory import MemorySampler, driver_pid
+
+try:
+    import allure
+except ImportError:
+    allure = None
+
+
+DEFAULT_REPORT = "browser-memory.json"
+USER_PROPERTY = "browser_memory"
+MB = 1024 * 1024
+# Сколько тестов с наибольшим приростом памяти печатать в итоговой сводке.
+SUMMARY_TOP = 5
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("memory", "Память браузера")
+    group.addoption(
+        "--memory-threshold", type=float, default=1024,
+        help="Порог памяти дерева процессов браузера, МБ: если после теста он превышен, "
+             "браузер перезапускается (0 — не перезапускать)")
+    group.addoption(
+        "--memory-interval", type=float, default=0.25,
+        help="Как часто измерять память браузера во время теста, с")
+    group.addoption(
+        "--memory-report", default=DEFAULT_REPORT,
+        help="JSON-отчёт о памяти браузера по тестам и воркерам (пустая строка — не писать)")
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(MemoryCollector(config), "memory-collector")
+
+
+class MemoryWatchdog:
+    """
+    Следит за памятью дерева процессов браузера (chromedriver, Chrome и его
+    рендереры) во время теста: начальное, конечное и пиковое значение.
+    Если после теста память выше порога, браузер нужно перезапустить.
+    """
+
+    def __init__(self, threshold_mb, interval):
+        self.threshold = threshold_mb * MB
+        self.interval = interval
+        self._sampler = None
+        self._start = 0
+
+    def begin(self, driver):
+        """
+        Начинает замер; для драйверов без своего процесса (HtmlDriver) и
+        там, где нет /proc (macOS, Windows), ничего не делает.
+        """
+        pid = driver_pid(driver)
+        if pid is None:
+            self._sampler = None
+            return
+        self._sampler = MemorySampler(pid, self.interval)
+        self._start = self._sampler.sample()
+        self._sampler.start()
+
+    def finish(self, item):
+        """
+        Заканчивает замер, прикладывает его к user_properties и Allure и
+        возвращает словарь с цифрами в МБ (None, если замера не было).
+        """
+        if self._sampler is None:
+            return None
+        end = self._sampler.stop()
+        stats = {
+            "start_mb": self._start / MB,
+            "end_mb": end / MB,
+            "peak_mb": self._sampler.peak / MB,
+            "growth_mb": (end - self._start) / MB,
+            "recycled": bool(self.threshold) and end >= self.threshold,
+        }
+        self._sampler = None
+        item.user_properties.append((USER_PROPERTY, stats))
+        if allure is not None:
+            allure.attach(json.dumps(stats, indent=1), name="Browser memory",
+                          attachment_type=allure.attachment_type.JSON)
+        return stats
+
+
+@pytest.fixture(scope="session")
+def memory_watchdog(request):
+    config = request.config
+    return MemoryWatchdog(config.getoption("--memory-threshold"), config.getoption("--memory-interval"))
+
+
+class MemoryCollector:
+    """Собирает замеры памяти тестов (в том числе с xdist-воркеров), печатает итог и пишет JSON-отчёт."""
+
+    def __init__(self, config):
+        self.config = config
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown" or hasattr(self.config, "workerinput"):
+            return
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY:
+                self.tests[report.nodeid] = dict(value, worker=worker)
+
+    def workers(self):
+        workers = {}
+        for stats in self.tests.values():
+            total = workers.setdefault(stats["worker"], {
+                "tests": 0, "peak_mb": 0.0, "growth_mb": 0.0, "recycled": 0})
+            total["tests"] += 1
+            total["peak_mb"] = max(total["peak_mb"], stats["peak_mb"])
+            total["growth_mb"] += stats["growth_mb"]
+            total["recycled"] += stats["recycled"]
+        return workers
+
+    def leaks(self):
+        """Тесты по убыванию прироста памяти браузера."""
+        return sorted(self.tests.items(), key=lambda item: item[1]["growth_mb"], reverse=True)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        for worker, total in sorted(self.workers().items()):
+            terminalreporter.write_line(
+                f"Память браузера [{worker}]: тестов {total['tests']}, пик {total['peak_mb']:.0f} МБ, "
+                f"прирост {total['growth_mb']:+.0f} МБ, перезапусков по порогу {total['recycled']}")
+        for nodeid, stats in self.leaks()[:SUMMARY_TOP]:
+            if stats["growth_mb"] > 0:
+                terminalreporter.write_line(
+                    f"  {stats['growth_mb']:+.1f} МБ (пик {stats['peak_mb']:.0f} МБ) {nodeid}")
+
+    def pytest_unconfigure(self):
+        path = self.config.getoption("--memory-report")
+        if not path or not self.tests or hasattr(self.config, "workerinput"):
+            return
+        path = Path(str(self.config.rootpath)) / path
+        path.write_text(json.dumps({
+            "threshold_mb": self.config.getoption("--memory-threshold"),
+            "workers": self.workers(),
+            "tests": dict(self.leaks()),
+        }, indent=1, ensure_ascii=False))
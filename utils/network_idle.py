@@ -0,0 +1,72 @@
+from selenium.common.exceptions import WebDriverException
+
+
+# Счётчик незавершённых XHR/fetch и признак начавшейся навигации. Скрипт
+# идемпотентен: повторное выполнение в том же документе ничего не меняет.
+TRACKER_SCRIPT = """
+(function () {
+  if (window.__networkIdle) { return; }
+  var state = window.__networkIdle = {pending: 0, navigating: false, last: performance.now()};
+  function start() { state.pending++; state.last = performance.now(); }
+  function done() { state.pending = Math.max(0, state.pending - 1); state.last = performance.now(); }
+  var send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    start();
+    this.addEventListener("loadend", done);
+    return send.apply(this, arguments);
+  };
+  if (window.fetch) {
+    var fetch = window.fetch;
+    window.fetch = function () {
+      start();
+      return fetch.apply(this, arguments).then(
+        function (response) { done(); return response; },
+        function (error) { done(); throw error; });
+    };
+  }
+  window.addEventListener("beforeunload", function () {
+    state.navigating = true;
+    state.last = performance.now();
+  });
+})();
+"""
+
+STATUS_SCRIPT = TRACKER_SCRIPT + """
+var state = window.__networkIdle;
+return [document.readyState, state.pending, state.navigating, performance.now() - state.last];
+"""
+
+
+def install(driver):
+    """
+    Регистрирует трекер для всех будущих документов браузера через CDP.
+    Для драйверов без CDP трекер ставится в документ при первом обращении.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": TRACKER_SCRIPT})
+    except (AttributeError, WebDriverException):
+        pass
+
+
+def track(driver):
+    """Ставит трекер в текущий документ, если его там ещё нет."""
+    driver.execute_script(TRACKER_SCRIPT)
+
+
+def idle_for(driver, loaded=True):
+    """
+    Возвращает, сколько секунд страница простаивает: документ загружен,
+    нет незавершённых запросов и начатой навигации. Если страница занята
+    (или документ сменяется прямо сейчас), возвращает None.
+
+    С loaded=False достаточно разобранного DOM (readyState "interactive"):
+    так проверяется готовность страницы при стратегии загрузки eager, когда
+    картинки и прочие подресурсы ещё могут загружаться.
+    """
+    try:
+        ready_state, pending, navigating, idle_ms = driver.execute_script(STATUS_SCRIPT)
+    except WebDriverException:
+        return None
+    if ready_state == "loading" or (loaded and ready_state != "complete") or pending or navigating:
+        return None
+    return idle_ms / 1000
@@ -0,0 +1,43 @@
+from utils.resource_blocking import DEFAULT_PROFILE, PROFILES, USER_PROPERTY
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--resource-profile", choices=tuple(PROFILES), default=DEFAULT_PROFILE,
+        help="Какие ресурсы браузер не загружает (маркер resources('...') переопределяет для теста)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "resources(profile): профиль блокировки ресурсов браузера для теста")
+    config.pluginmanager.register(NetworkCollector(config), "network-collector")
+
+
+class NetworkCollector:
+    """Собирает сетевые сводки тестов (в том числе с xdist-воркеров) и печатает итог по профилям."""
+
+    def __init__(self, config):
+        self.config = config
+        self.tests = {}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown" or hasattr(self.config, "workerinput"):
+            return
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY:
+                self.tests[report.nodeid] = value
+
+    def pytest_terminal_summary(self, terminalreporter):
+        by_profile = {}
+        for stats in self.tests.values():
+            total = by_profile.setdefault(stats["profile"], {
+                "tests": 0, "bytes": 0, "blocked": 0, "load_time": 0.0, "pages": 0})
+            total["tests"] += 1
+            for key in ("bytes", "blocked", "load_time", "pages"):
+                total[key] += stats[key]
+        for profile, total in sorted(by_profile.items()):
+            average = total["load_time"] / total["pages"] if total["pages"] else 0.0
+            terminalreporter.write_line(
+                f"Сеть [{profile}]: тестов {total['tests']}, загружено "
+                f"{total['bytes'] / 1024:.0f} КиБ, заблокировано запросов {total['blocked']}, "
+                f"страниц {total['pages']}, средняя загрузка {average * 1000:.0f} мс")
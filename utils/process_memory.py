@@ -0,0 +1,131 @@
+import os
+import threading
+
+
+PROC = "/proc"
+
+
+def _read(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        # Процесс мог завершиться между листингом /proc и чтением.
+        return None
+
+
+def parent_pids():
+    """{pid: ppid} для всех процессов системы по /proc/<pid>/stat."""
+    parents = {}
+    for name in os.listdir(PROC):
+        if not name.isdigit():
+            continue
+        stat = _read(f"{PROC}/{name}/stat")
+        if stat is None:
+            continue
+        # Имя процесса в скобках может содержать пробелы: поля считаем после ")".
+        fields = stat.rpartition(")")[2].split()
+        parents[int(name)] = int(fields[1])
+    return parents
+
+
+def descendants(pid, parents=None):
+    """Все потомки процесса pid (дети, внуки и т. д.)."""
+    parents = parent_pids() if parents is None else parents
+    children = {}
+    for child, parent in parents.items():
+        children.setdefault(parent, []).append(child)
+    found, queue = [], list(children.get(pid, ()))
+    while queue:
+        child = queue.pop()
+        found.append(child)
+        queue.extend(children.get(child, ()))
+    return found
+
+
+def process_memory(pid):
+    """
+    Память процесса в байтах: PSS из smaps_rollup, если он доступен, иначе
+    VmRSS. PSS делит общие страницы между процессами, поэтому сумма по
+    дереву процессов Chrome не считает разделяемую память многократно.
+    Для завершившегося процесса возвращает 0.
+    """
+    rollup = _read(f"{PROC}/{pid}/smaps_rollup")
+    status = rollup if rollup and "Pss:" in rollup else _read(f"{PROC}/{pid}/status")
+    if not status:
+        return 0
+    key = "Pss:" if status is rollup else "VmRSS:"
+    for line in status.splitlines():
+        if line.startswith(key):
+            return int(line.split()[1]) * 1024
+    return 0
+
+
+def tree_memory(pid, include_root=True):
+    """Суммарная память процесса pid и всех его потомков, байт."""
+    pids = descendants(pid) + ([pid] if include_root else [])
+    return sum(process_memory(child) for child in pids)
+
+
+def available():
+    """Можно ли измерять память процессов: /proc есть только в Linux."""
+    return os.path.isdir(PROC)
+
+
+def driver_pid(driver):
+    """
+    PID chromedriver; Chrome и его рендереры — потомки этого процесса.
+    None, если у драйвера нет своего процесса или память измерить нельзя
+    (нет /proc, как на macOS и Windows).
+    """
+    if not available():
+        return None
+    try:
+        return driver.service.process.pid
+    except AttributeError:
+        return None
+
+
+class MemorySampler:
+    """
+    Фоновый поток, который каждые interval секунд измеряет память дерева
+    процессов pid и запоминает последнее и пиковое значение.
+    """
+
+    def __init__(self, pid, interval=0.2, include_root=True):
+        self.pid = pid
+        self.interval = interval
+        self.include_root = include_root
+        self.current = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        self.current = tree_memory(self.pid, self.include_root)
+        self.peak = max(self.peak, self.current)
+        return self.current
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.sample()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
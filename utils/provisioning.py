@@ -0,0 +1,121 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from utils.api_client import ApiError, BankApi, to_account
+
+
+ACCOUNT_TYPES = {"CHECKING": 0, "SAVINGS": 1}
+DEFAULT_DETAILS = {
+    "first_name": "Test",
+    "last_name": "User",
+    "street": "1 Test St",
+    "city": "Testville",
+    "state": "CA",
+    "zip_code": "90210",
+    "phone": "555-0100",
+    "ssn": "123-45-6789",
+}
+REGISTER_FORM = {
+    "first_name": "customer.firstName",
+    "last_name": "customer.lastName",
+    "street": "customer.address.street",
+    "city": "customer.address.city",
+    "state": "customer.address.state",
+    "zip_code": "customer.address.zipCode",
+    "phone": "customer.phoneNumber",
+    "ssn": "customer.ssn",
+}
+
+
+class ProvisionedCustomer:
+    """Клиент, созданный по HTTP: логин, пароль, id и id счетов в порядке создания."""
+
+    def __init__(self, customer_id, username, password, accounts):
+        self.id = customer_id
+        self.username = username
+        self.password = password
+        self.accounts = accounts
+
+    def __repr__(self):
+        return f"ProvisionedCustomer({self.username!r}, id={self.id}, accounts={self.accounts})"
+
+
+class Provisioner(BankApi):
+    """
+    Создание тестовых данных ParaBank без браузера: регистрация клиентов,
+    открытие счетов, пополнения и списания через HTTP и REST-сервис.
+
+    Пул keep-alive соединений и cookie по потокам — от BankApi: регистрация
+    логинит созданного клиента, и сессии параллельных регистраций не должны
+    перемешиваться.
+    """
+
+    def open_account(self, customer_id, from_account_id, account_type="CHECKING"):
+        """Открывает счёт; ParaBank переводит на него стартовый взнос с from_account_id."""
+        response = self._service(
+            "POST", "createAccount", customerId=customer_id,
+            newAccountType=ACCOUNT_TYPES[account_type], fromAccountId=from_account_id)
+        return to_account(self._parse(response)).id
+
+    def deposit(self, account_id, amount):
+        self._service("POST", "deposit", accountId=account_id, amount=amount)
+
+    def withdraw(self, account_id, amount):
+        self._service("POST", "withdraw", accountId=account_id, amount=amount)
+
+    def transfer(self, from_account_id, to_account_id, amount):
+        self._service("POST", "transfer", fromAccountId=from_account_id,
+                      toAccountId=to_account_id, amount=amount)
+
+    def set_balance(self, account_id, amount):
+        """Доводит баланс счёта до amount одним пополнением или списанием."""
+        delta = Decimal(str(amount)) - self.balance(account_id)
+        if delta > 0:
+            self.deposit(account_id, delta)
+        elif delta < 0:
+            self.withdraw(account_id, -delta)
+
+    # --- клиенты ---
+
+    def register(self, username=None, password="demo", **details):
+        """Регистрирует клиента через register.htm и возвращает ProvisionedCustomer."""
+        username = username or f"u{uuid.uuid4().hex[:12]}"
+        details = {**DEFAULT_DETAILS, **details}
+        form = {REGISTER_FORM[key]: value for key, value in details.items()}
+        form.update({"customer.username": username, "customer.password": password,
+                     "repeatedPassword": password})
+        self.http.cookies.clear()
+        response = self.http.post(f"{self.base_url}/register.htm", data=form)
+        self.http.cookies.clear()
+        if response.status_code != 200 or "logout.htm" not in response.text:
+            raise ApiError(f"Регистрация пользователя {username} не удалась")
+        customer_id = self.login(username, password).id
+        accounts = [account.id for account in self.accounts(customer_id)]
+        return ProvisionedCustomer(customer_id, username, password, accounts)
+
+    def create_customer(self, balances=None, transactions=(), **details):
+        """
+        Создаёт клиента со счетами и балансами.
+
+        balances — список пар (тип счёта, баланс): первая пара относится к счёту,
+        открытому при регистрации, для остальных открываются новые счета.
+        transactions — дополнительные операции (kind, индекс счёта, сумма), где
+        kind — "deposit" или "withdraw"; выполняются после установки балансов.
+        """
+        customer = self.register(**details)
+        balances = list(balances or [])
+        first = customer.accounts[0]
+        for account_type, _ in balances[1:]:
+            customer.accounts.append(self.open_account(customer.id, first, account_type))
+        for account_id, (_, amount) in zip(customer.accounts, balances):
+            self.set_balance(account_id, amount)
+        for kind, index, amount in transactions:
+            getattr(self, kind)(customer.accounts[index], amount)
+        return customer
+
+    def create_customers(self, count, **kwargs):
+        """Создаёт count клиентов параллельно, по потоку на соединение пула."""
+        with ThreadPoolExecutor(max_workers=min(count, self.pool_size) or 1) as executor:
+            futures = [executor.submit(self.create_customer, **kwargs) for _ in range(count)]
+            return [future.result() for future in futures]
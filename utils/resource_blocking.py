@@ -0,0 +1,92 @@
+import json
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+
+USER_PROPERTY = "network"
+IMAGES_FONTS_MEDIA = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav",
+)
+THIRD_PARTY = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*hotjar.com*",
+)
+# Шаблоны URL для Network.setBlockedURLs ("*" — любая подстрока).
+PROFILES = {
+    # Ничего не блокируется — как в обычном браузере.
+    "full": (),
+    # Картинки, шрифты, медиа и сторонние счётчики: ни одна проверка на них
+    # не опирается.
+    "functional": IMAGES_FONTS_MEDIA + THIRD_PARTY,
+    # То же плюс CSS. Видимость элементов, скрытых стилями из .css, меняется,
+    # поэтому профиль подходит только тестам, которые не проверяют видимость.
+    "strict": IMAGES_FONTS_MEDIA + THIRD_PARTY + ("*.css",),
+}
+# По умолчанию браузер загружает всё; блокировку тесты включают явно
+# (маркер resources, --resource-profile, RESOURCE_PROFILE page object).
+DEFAULT_PROFILE = "full"
+
+
+def apply_profile(driver, name):
+    """
+    Включает профиль блокировки name в текущей вкладке через CDP. Действует
+    на все следующие загрузки до смены профиля. Для драйверов без CDP ничего
+    не делает.
+    """
+    try:
+        patterns = PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Неизвестный профиль блокировки: {name}. Доступны: {', '.join(PROFILES)}")
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+    except (AttributeError, WebDriverException):
+        return False
+    driver.resource_profile = name
+    return True
+
+
+def drain(driver):
+    """
+    Забирает накопленные записи performance-лога драйвера (события DevTools).
+    Если драйвер без логов или chromedriver уже недоступен, возвращает [].
+    """
+    try:
+        entries = driver.get_log("performance")
+    except (AttributeError, WebDriverException, ConnectionError, HTTPError):
+        return []
+    return [json.loads(entry["message"])["message"] for entry in entries]
+
+
+def network_stats(events):
+    """
+    Сводка по событиям DevTools: загружено байт (encodedDataLength), запросов,
+    заблокировано запросов и суммарное время загрузки документов — от запроса
+    документа до события load.
+    """
+    stats = {"bytes": 0, "requests": 0, "blocked": 0, "load_time": 0.0, "pages": 0}
+    document_started = None
+    for event in events:
+        method, params = event.get("method"), event.get("params", {})
+        if method == "Network.requestWillBeSent":
+            stats["requests"] += 1
+            if params.get("type") == "Document":
+                document_started = params["timestamp"]
+        elif method == "Network.loadingFinished":
+            stats["bytes"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            stats["blocked"] += 1
+        elif method == "Page.loadEventFired" and document_started is not None:
+            stats["load_time"] += params["timestamp"] - document_started
+            stats["pages"] += 1
+            document_started = None
+    return stats
+
+
+def profile_for(item):
+    """Профиль теста: из маркера resources("...") или из --resource-profile."""
+    marker = item.get_closest_marker("resources")
+    return marker.args[0] if marker else item.config.getoption("--resource-profile")
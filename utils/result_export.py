@@ -0,0 +1,148 @@
+"""
+Перевод результатов прогона из JSONL (плагин utils/result_sink.py) в
+отчёт Allure или HTML — только когда отчёт действительно нужен.
+
+    python -m utils.result_export test-results.jsonl --allure allure-results
+    allure serve allure-results
+    python -m utils.result_export test-results.jsonl --html report.html
+"""
+import argparse
+import hashlib
+import html
+import json
+import uuid
+from pathlib import Path
+
+
+# Исход pytest → статус Allure. failed у Allure — проваленная проверка,
+# broken — любая другая ошибка.
+ALLURE_STATUS = {
+    "passed": "passed",
+    "xpassed": "passed",
+    "skipped": "skipped",
+    "xfailed": "skipped",
+    "error": "broken",
+}
+# Порядок строк HTML-отчёта: сначала то, что требует внимания.
+HTML_ORDER = ("failed", "error", "xpassed", "xfailed", "skipped", "passed")
+
+
+def read_results(path):
+    with open(path, encoding="utf-8") as results:
+        return [json.loads(line) for line in results if line.strip()]
+
+
+def allure_status(result):
+    if result["outcome"] == "failed":
+        message = result.get("message", "")
+        return "failed" if message.startswith("AssertionError") or message.startswith("assert ") \
+            else "broken"
+    return ALLURE_STATUS[result["outcome"]]
+
+
+def allure_result(result):
+    """Результат теста в формате allure-results (*-result.json)."""
+    path, _, name = result["nodeid"].partition("::")
+    module = path[:-3].replace("/", ".") if path.endswith(".py") else path.replace("/", ".")
+    package, _, suite = module.rpartition(".")
+    labels = [
+        {"name": "framework", "value": "pytest"},
+        {"name": "language", "value": "python"},
+        {"name": "package", "value": module},
+        {"name": "suite", "value": suite},
+        {"name": "thread", "value": result["worker"]},
+    ]
+    if package:
+        labels.append({"name": "parentSuite", "value": package})
+    details = {}
+    if "message" in result:
+        details["message"] = result["message"]
+    if "longrepr" in result:
+        details["trace"] = result["longrepr"]
+    return {
+        "uuid": str(uuid.uuid4()),
+        "historyId": hashlib.md5(result["nodeid"].encode()).hexdigest(),
+        "testCaseId": hashlib.md5(f"{module}#{name.split('[', 1)[0]}".encode()).hexdigest(),
+        "fullName": f"{module}#{name}",
+        "name": name,
+        "status": allure_status(result),
+        "statusDetails": details,
+        "description": f"Команд WebDriver: {result['commands']} ({result['command_time']:.3f}s), "
+                       f"ожидания {result['wait_time']:.3f}s, воркер {result['worker']}",
+        "start": int(result["start"] * 1000),
+        "stop": int(result["stop"] * 1000),
+        "labels": labels,
+    }
+
+
+def export_allure(results, directory):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for result in results:
+        data = allure_result(result)
+        (directory / f"{data['uuid']}-result.json").write_text(
+            json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _html_row(result):
+    outcome = result["outcome"]
+    details = ""
+    if "longrepr" in result or "message" in result:
+        text = result.get("longrepr") or result["message"]
+        details = f"<details><summary>{html.escape(result.get('message', outcome))}</summary>" \
+                  f"<pre>{html.escape(text)}</pre></details>"
+    return (f'<tr class="{outcome}"><td>{outcome}</td><td>{html.escape(result["nodeid"])}{details}</td>'
+            f'<td>{result["duration"]:.2f}</td><td>{html.escape(result["worker"])}</td>'
+            f'<td>{result["commands"]}</td></tr>')
+
+
+def export_html(results, path, title="Отчёт о тестах"):
+    """Самодостаточная HTML-страница в духе pytest-html: сводка и таблица тестов."""
+    counts = {}
+    for result in results:
+        counts[result["outcome"]] = counts.get(result["outcome"], 0) + 1
+    summary = ", ".join(f"{counts[outcome]} {outcome}" for outcome in HTML_ORDER if outcome in counts)
+    duration = sum(result["duration"] for result in results)
+    rows = "\n".join(_html_row(result) for result in sorted(
+        results, key=lambda result: (HTML_ORDER.index(result["outcome"]), result["nodeid"])))
+    Path(path).write_text(f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; font-size: 13px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #e6e6e6; padding: 4px 8px; text-align: left; vertical-align: top; }}
+pre {{ white-space: pre-wrap; background: #f6f6f6; }}
+.passed td:first-child, .xpassed td:first-child {{ color: green; }}
+.failed td:first-child, .error td:first-child {{ color: red; }}
+.skipped td:first-child, .xfailed td:first-child {{ color: orange; }}
+</style></head>
+<body><h1>{html.escape(title)}</h1>
+<p>Тестов: {len(results)}, суммарное время {duration:.2f} с: {summary}</p>
+<table><thead><tr><th>Исход</th><th>Тест</th><th>Длительность, с</th><th>Воркер</th>
+<th>Команд WebDriver</th></tr></thead>
+<tbody>
+{rows}
+</tbody></table></body></html>
+""", encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("results", nargs="?", default="test-results.jsonl",
+                        help="JSONL с результатами (--results-jsonl прогона)")
+    parser.add_argument("--allure", metavar="DIR", help="Каталог allure-results для allure serve/generate")
+    parser.add_argument("--html", metavar="FILE", help="HTML-отчёт")
+    args = parser.parse_args(argv)
+    if not args.allure and not args.html:
+        parser.error("укажите --allure и/или --html")
+    results = read_results(args.results)
+    if args.allure:
+        export_allure(results, args.allure)
+        print(f"Allure: {len(results)} результатов в {args.allure}")
+    if args.html:
+        export_html(results, args.html)
+        print(f"HTML: {args.html}")
+
+
+if __name__ == "__main__":
+    main()
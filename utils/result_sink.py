@@ -0,0 +1,139 @@
+import json
+import queue
+import threading
+from pathlib import Path
+
+from utils.timing_report import USER_PROPERTY as TIMING_PROPERTY
+
+
+DEFAULT_RESULTS = "test-results.jsonl"
+PHASES = ("setup", "call", "teardown")
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--results-jsonl", default=DEFAULT_RESULTS,
+        help="Файл JSONL с результатами тестов, по записи на тест (пустая строка — не писать). "
+             "В Allure и HTML переводится командой python -m utils.result_export")
+
+
+def pytest_configure(config):
+    path = config.getoption("--results-jsonl")
+    if path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ResultSink(Path(str(config.rootpath)) / path), "result-sink")
+
+
+class JsonlWriter:
+    """
+    Дописывает записи в JSONL-файл из фонового потока: тест только кладёт
+    словарь в очередь и не ждёт диска. Файл сбрасывается на диск, когда
+    очередь пустеет, так что при падении прогона теряется не больше
+    последних записей.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._queue = queue.Queue()
+        self._file = open(path, "w", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, name="results-jsonl", daemon=True)
+        self._thread.start()
+
+    def write(self, record):
+        self.count += 1
+        self._queue.put(record)
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            if record is self._STOP:
+                break
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if self._queue.empty():
+                self._file.flush()
+        self._file.close()
+
+    def close(self):
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+
+def outcome(reports):
+    """Итог теста по отчётам фаз, как в сводке pytest: passed, failed, error, skipped, xfailed, xpassed."""
+    for report in reports.values():
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+    call = reports.get("call")
+    if call is not None and hasattr(call, "wasxfail"):
+        return "xfailed" if call.skipped else "xpassed"
+    if any(report.skipped for report in reports.values()):
+        return "skipped"
+    return "passed"
+
+
+def record(reports, worker):
+    """Запись JSONL по отчётам фаз одного теста."""
+    teardown = reports["teardown"]
+    first = next(reports[when] for when in PHASES if when in reports)
+    timing = next((value for name, value in teardown.user_properties if name == TIMING_PROPERTY), None)
+    result = {
+        "nodeid": teardown.nodeid,
+        "outcome": outcome(reports),
+        "duration": round(sum(report.duration for report in reports.values()), 4),
+        "phases": {when: round(report.duration, 4) for when, report in reports.items()},
+        "start": first.start,
+        "stop": teardown.stop,
+        "worker": worker,
+        "commands": timing["commands"] if timing else 0,
+        "command_time": round(timing["totals"]["command"], 4) if timing else 0.0,
+        "wait_time": round(timing["totals"]["wait"], 4) if timing else 0.0,
+    }
+    problem = next((report for report in reports.values() if report.failed or report.skipped), None)
+    if problem is not None and problem.longrepr is not None:
+        crash = getattr(problem.longrepr, "reprcrash", None)
+        if crash is not None:
+            result["message"] = crash.message
+        elif isinstance(problem.longrepr, tuple):
+            # Пропуск: (файл, строка, причина).
+            result["message"] = problem.longrepr[2]
+        if problem.failed:
+            result["longrepr"] = problem.longreprtext
+    return result
+
+
+class ResultSink:
+    """
+    Пишет на контроллере (или в одиночном процессе) по записи JSONL на
+    тест: исход, длительность фаз, число команд WebDriver и воркер xdist.
+    Отчёты фаз копятся до teardown, после чего запись уходит в фоновый
+    писатель.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.writer = None
+        self.pending = {}
+
+    def pytest_sessionstart(self, session):
+        self.writer = JsonlWriter(self.path)
+
+    def pytest_runtest_logreport(self, report):
+        reports = self.pending.setdefault(report.nodeid, {})
+        reports[report.when] = report
+        if report.when != "teardown":
+            return
+        del self.pending[report.nodeid]
+        node = getattr(report, "node", None)
+        self.writer.write(record(reports, node.gateway.id if node is not None else "main"))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.writer is not None and self.writer.count:
+            terminalreporter.write_line(
+                f"Результаты: {self.writer.count} записей в {self.path.name} "
+                f"(Allure/HTML: python -m utils.result_export {self.path.name} --allure DIR --html FILE)")
+
+    def pytest_sessionfinish(self, session):
+        if self.writer is not None:
+            self.writer.close()
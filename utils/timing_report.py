@@ -0,0 +1,116 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+from selenium.webdriver.support.wait import WebDriverWait
+
+from utils.webdriver_timing import RECORDER, format_summary, timed_sleep, timed_until
+
+try:
+    import allure
+except ImportError:
+    allure = None
+
+
+DEFAULT_REPORT = "webdriver-timing.json"
+USER_PROPERTY = "webdriver_timing"
+# Сколько самых медленных локаторов и ожиданий попадает в JSON-отчёт.
+REPORT_TOP = 20
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--timing-report", default=DEFAULT_REPORT,
+        help="JSON-отчёт о самых медленных локаторах и ожиданиях (пустая строка — не писать)")
+
+
+def pytest_configure(config):
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(WebDriverWait, "until", timed_until(WebDriverWait.until, "until"))
+    patcher.setattr(WebDriverWait, "until_not", timed_until(WebDriverWait.until_not, "until_not"))
+    patcher.setattr(time, "sleep", timed_sleep)
+    config.pluginmanager.register(TimingCollector(config, patcher), "webdriver-timing")
+
+
+class TimingCollector:
+    """
+    Ведёт RECORDER от начала до конца каждого теста, прикладывает сводку
+    к Allure и к user_properties отчёта, а на контроллере (или в одиночном
+    процессе) собирает сводки всех тестов в JSON-отчёт.
+    """
+
+    def __init__(self, config, patcher):
+        self.config = config
+        self.patcher = patcher
+        self.tests = {}
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_protocol(self, item):
+        RECORDER.begin()
+        yield
+        RECORDER.events = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield
+        summary = RECORDER.finish()
+        item.user_properties.append((USER_PROPERTY, summary))
+        if allure is not None:
+            allure.attach(format_summary(summary), name="WebDriver timing",
+                          attachment_type=allure.attachment_type.TEXT)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown" or hasattr(self.config, "workerinput"):
+            return
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY:
+                self.tests[report.nodeid] = value
+
+    def report(self):
+        locators = {}
+        waits = {}
+        for nodeid, summary in self.tests.items():
+            for locator, stats in summary["by_locator"].items():
+                total = locators.setdefault(locator, {"locator": locator, "count": 0,
+                                                      "time": 0.0, "max": 0.0})
+                total["count"] += stats["count"]
+                total["time"] += stats["time"]
+                total["max"] = max(total["max"], stats["max"])
+            for event in summary["waits"]:
+                key = (event["method"], event["locator"], event["timeout"])
+                total = waits.setdefault(key, {
+                    "method": event["method"], "locator": event["locator"],
+                    "timeout": event["timeout"], "count": 0, "time": 0.0, "max": 0.0,
+                    "timeouts": 0})
+                total["count"] += 1
+                total["time"] += event["duration"]
+                total["max"] = max(total["max"], event["duration"])
+                total["timeouts"] += event["outcome"] == "TimeoutException"
+        return {
+            "tests": {nodeid: {"commands": summary["commands"], "totals": summary["totals"]}
+                      for nodeid, summary in self.tests.items()},
+            "slowest_locators": sorted(
+                locators.values(), key=lambda stats: stats["time"], reverse=True)[:REPORT_TOP],
+            "slowest_waits": sorted(
+                waits.values(), key=lambda stats: stats["time"], reverse=True)[:REPORT_TOP],
+        }
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        commands = sum(summary["commands"] for summary in self.tests.values())
+        totals = {kind: sum(summary["totals"].get(kind, 0.0) for summary in self.tests.values())
+                  for kind in ("command", "wait", "sleep", "startup")}
+        terminalreporter.write_line(
+            f"WebDriver: команд {commands} ({totals['command']:.1f}s), ожидания "
+            f"{totals['wait']:.1f}s, sleep {totals['sleep']:.1f}s, "
+            f"запуск браузеров {totals['startup']:.1f}s")
+
+    def pytest_unconfigure(self):
+        self.patcher.undo()
+        path = self.config.getoption("--timing-report")
+        if not path or not self.tests or hasattr(self.config, "workerinput"):
+            return
+        path = Path(str(self.config.rootpath)) / path
+        path.write_text(json.dumps(self.report(), indent=1, ensure_ascii=False))
@@ -0,0 +1,220 @@
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Сколько самых медленных событий теста сохранять в сводке.
+SLOWEST_EVENTS = 5
+# Функции listener(page, name, locators), вызываемые при каждом вызове
+# трассируемого метода page object со всеми локаторами его аргументов
+# (см. utils/impact_selection.py).
+CALL_LISTENERS = []
+
+_sleep = time.sleep
+
+
+class CommandRecorder:
+    """
+    Журнал команд WebDriver, ожиданий и sleep текущего теста.
+
+    Каждое событие — словарь с видом (command, wait, sleep, startup), именем
+    команды, локатором, методом page object, длительностью и исходом. Метод —
+    внешний вызов page object (например, FundsTransferPage.transfer_funds),
+    локатор — самый вложенный из переданных в методы BasePage или из
+    параметров findElement. События из других потоков (например, из потока
+    локального стенда) не записываются, кроме потоков, подключённых через
+    adopt (потоки сессий async-тестов).
+    """
+
+    def __init__(self):
+        self.events = None
+        self.threads = set()
+        self._local = threading.local()
+
+    @property
+    def stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self):
+        self.events = []
+        self.threads = {threading.get_ident()}
+
+    def adopt(self):
+        """Записывает до конца текущего теста и события текущего потока."""
+        if self.events is not None:
+            self.threads.add(threading.get_ident())
+
+    def finish(self):
+        events, self.events = self.events, None
+        return summarize(events or [])
+
+    def record(self, kind, name, duration, outcome, locator=None, **extra):
+        if self.events is None or threading.get_ident() not in self.threads:
+            return
+        stack = self.stack
+        if locator is None:
+            locator = next((frame[1] for frame in reversed(stack) if frame[1]), None)
+        event = {
+            "kind": kind,
+            "name": name,
+            "method": stack[0][0] if stack else None,
+            "locator": locator,
+            "duration": duration,
+            "outcome": outcome,
+        }
+        event.update(extra)
+        self.events.append(event)
+
+
+RECORDER = CommandRecorder()
+
+
+@contextmanager
+def measure(kind, name, **extra):
+    """Записывает длительность и исход блока как одно событие."""
+    started = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except Exception as e:
+        outcome = type(e).__name__
+        raise
+    finally:
+        RECORDER.record(kind, name, time.perf_counter() - started, outcome, **extra)
+
+
+def _locator_text(locator):
+    return f"{locator[0]}={locator[1]}"
+
+
+def _is_locator(value):
+    return isinstance(value, tuple) and len(value) == 2 and isinstance(value[0], str)
+
+
+def _argument_locators(args, kwargs):
+    """
+    Локаторы в аргументах, в том числе в ключах и значениях словарей
+    ({имя: локатор}, {локатор: значение}) и в списках.
+    """
+    locators = []
+    for value in list(args) + list(kwargs.values()):
+        if _is_locator(value):
+            locators.append(value)
+        elif isinstance(value, dict):
+            locators.extend(item for item in list(value) + list(value.values()) if _is_locator(item))
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            locators.extend(item for item in value if _is_locator(item))
+    return [_locator_text(locator) for locator in locators]
+
+
+def instrument(driver):
+    """Оборачивает driver.execute: каждая команда WebDriver попадает в RECORDER."""
+    execute = driver.execute
+
+    @functools.wraps(execute)
+    def timed_execute(command, params=None):
+        locator = None
+        if params and "using" in params and "value" in params:
+            locator = f"{params['using']}={params['value']}"
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            return execute(command, params)
+        except Exception as e:
+            outcome = type(e).__name__
+            raise
+        finally:
+            RECORDER.record("command", command, time.perf_counter() - started, outcome, locator)
+
+    driver.execute = timed_execute
+    return driver
+
+
+def traced(name, func):
+    """Метод page object, вызовы которого задают контекст (метод, локатор) для событий."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        locator = _locator_text(args[0]) if args and _is_locator(args[0]) else None
+        if CALL_LISTENERS:
+            locators = _argument_locators(args, kwargs)
+            for listener in CALL_LISTENERS:
+                listener(self, name, locators)
+        stack = RECORDER.stack
+        stack.append((name, locator))
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            stack.pop()
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_methods(cls):
+    """Оборачивает методы, объявленные в самом классе (кроме dunder-методов)."""
+    for name, value in list(vars(cls).items()):
+        if inspect.isfunction(value) and not name.startswith("__") \
+                and not getattr(value, "__traced__", False):
+            setattr(cls, name, traced(f"{cls.__name__}.{name}", value))
+    return cls
+
+
+def timed_until(until, kind):
+    @functools.wraps(until)
+    def wrapper(self, method, message=""):
+        local = RECORDER._local
+        local.waiting = getattr(local, "waiting", 0) + 1
+        try:
+            with measure("wait", kind, timeout=self._timeout):
+                return until(self, method, message)
+        finally:
+            local.waiting -= 1
+    return wrapper
+
+
+def timed_sleep(seconds):
+    # Паузы между опросами WebDriverWait уже входят во время ожидания.
+    if getattr(RECORDER._local, "waiting", 0):
+        return _sleep(seconds)
+    with measure("sleep", "time.sleep"):
+        _sleep(seconds)
+
+
+def summarize(events):
+    """Сводка по тесту: время по видам событий, по локаторам и самые медленные события."""
+    totals = {"command": 0.0, "wait": 0.0, "sleep": 0.0, "startup": 0.0}
+    by_locator = {}
+    for event in events:
+        totals[event["kind"]] = totals.get(event["kind"], 0.0) + event["duration"]
+        if event["locator"] and event["kind"] in ("command", "wait"):
+            stats = by_locator.setdefault(event["locator"], {"count": 0, "time": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["time"] += event["duration"]
+            stats["max"] = max(stats["max"], event["duration"])
+    return {
+        "commands": sum(1 for event in events if event["kind"] == "command"),
+        "totals": totals,
+        "by_locator": by_locator,
+        "waits": [event for event in events if event["kind"] == "wait"],
+        "slowest": sorted(events, key=lambda event: event["duration"], reverse=True)[:SLOWEST_EVENTS],
+    }
+
+
+def format_summary(summary):
+    totals = summary["totals"]
+    lines = [
+        f"Команд WebDriver: {summary['commands']}, {totals['command']:.3f}s",
+        f"Ожидания: {totals['wait']:.3f}s, sleep: {totals['sleep']:.3f}s, "
+        f"запуск браузера: {totals['startup']:.3f}s",
+        "",
+        "Самые медленные события:",
+    ]
+    for event in summary["slowest"]:
+        lines.append(f"  {event['duration']:.3f}s {event['kind']} {event['name']} "
+                     f"{event['locator'] or ''} [{event['method'] or '-'}] {event['outcome']}")
+    return "\n".join(lines)